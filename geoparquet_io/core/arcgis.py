@@ -13,8 +13,10 @@ import tempfile
 import time
 import uuid
 from collections.abc import Generator
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 import pyarrow as pa
@@ -28,6 +30,9 @@ from geoparquet_io.core.common import (
 )
 from geoparquet_io.core.logging_config import configure_verbose, debug, progress, success, warn
 
+if TYPE_CHECKING:
+    import httpx
+
 # ArcGIS Online token endpoint
 ARCGIS_ONLINE_TOKEN_URL = "https://www.arcgis.com/sharing/rest/generateToken"
 
@@ -92,19 +97,24 @@ def _make_request(
     data: dict | None = None,
     max_retries: int = 3,
     retry_delay: float = 1.0,
+    client: httpx.Client | None = None,
 ) -> dict:
-    """Make HTTP request with retry logic."""
+    """Make HTTP request with retry logic.
+
+    Uses ``client`` when given so requests share its pooled connections,
+    otherwise a new client for this request alone.
+    """
     import httpx
 
     last_exception = None
 
     for attempt in range(max_retries):
         try:
-            with _get_http_client() as client:
+            with nullcontext(client) if client is not None else _get_http_client() as http:
                 if method == "GET":
-                    response = client.get(url, params=params)
+                    response = http.get(url, params=params)
                 else:
-                    response = client.post(url, data=data)
+                    response = http.post(url, data=data)
                 response.raise_for_status()
                 return response.json()
         except httpx.TimeoutException as e:
@@ -170,6 +180,7 @@ def generate_token(
     password: str,
     portal_url: str | None = None,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> str:
     """
     Generate authentication token via ArcGIS REST API.
@@ -179,6 +190,7 @@ def generate_token(
         password: ArcGIS password
         portal_url: Enterprise portal URL (default: ArcGIS Online)
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests
 
     Returns:
         Authentication token string
@@ -199,7 +211,7 @@ def generate_token(
         "expiration": 60,  # 60 minutes
     }
 
-    result = _make_request("POST", token_url, data=data)
+    result = _make_request("POST", token_url, data=data, client=client)
     result = _handle_arcgis_response(result, "Token generation")
 
     if "token" not in result:
@@ -215,6 +227,7 @@ def resolve_token(
     auth: ArcGISAuth,
     service_url: str,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> str | None:
     """
     Resolve authentication token from various sources.
@@ -228,6 +241,7 @@ def resolve_token(
         auth: ArcGISAuth configuration
         service_url: Service URL (used to detect enterprise portal)
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests
 
     Returns:
         Token string, or None if no auth provided
@@ -265,7 +279,7 @@ def resolve_token(
                 if verbose:
                     debug(f"Detected enterprise portal: {portal_url}")
 
-        return generate_token(auth.username, auth.password, portal_url, verbose)
+        return generate_token(auth.username, auth.password, portal_url, verbose, client=client)
 
     return None
 
@@ -338,6 +352,7 @@ def get_layer_info(
     where: str = "1=1",
     bbox: tuple[float, float, float, float] | None = None,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> ArcGISLayerInfo:
     """
     Fetch layer metadata from ArcGIS REST service.
@@ -348,6 +363,7 @@ def get_layer_info(
         where: SQL WHERE clause for counting features (default: "1=1" = all)
         bbox: Bounding box filter (xmin, ymin, xmax, ymax) in WGS84
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests
 
     Returns:
         ArcGISLayerInfo with layer metadata
@@ -356,11 +372,13 @@ def get_layer_info(
         debug(f"Fetching layer info from {service_url}")
 
     params = _add_token_to_params({"f": "json"}, token)
-    data = _make_request("GET", service_url, params=params)
+    data = _make_request("GET", service_url, params=params, client=client)
     data = _handle_arcgis_response(data, "Layer info")
 
     # Get feature count (using the WHERE and bbox filters)
-    count = get_feature_count(service_url, where=where, bbox=bbox, token=token, verbose=verbose)
+    count = get_feature_count(
+        service_url, where=where, bbox=bbox, token=token, verbose=verbose, client=client
+    )
 
     return ArcGISLayerInfo(
         name=data.get("name", "Unknown"),
@@ -378,6 +396,7 @@ def get_feature_count(
     bbox: tuple[float, float, float, float] | None = None,
     token: str | None = None,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> int:
     """
     Get total feature count from ArcGIS service.
@@ -388,6 +407,7 @@ def get_feature_count(
         bbox: Bounding box filter (xmin, ymin, xmax, ymax) in WGS84
         token: Optional authentication token
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests
 
     Returns:
         Feature count
@@ -409,7 +429,7 @@ def get_feature_count(
 
     params = _add_token_to_params(params, token)
 
-    data = _make_request("GET", query_url, params=params)
+    data = _make_request("GET", query_url, params=params, client=client)
     data = _handle_arcgis_response(data, "Feature count")
 
     count = data.get("count", 0)
@@ -428,6 +448,7 @@ def fetch_features_page(
     out_fields: str = "*",
     token: str | None = None,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> dict:
     """
     Fetch a single page of features as GeoJSON.
@@ -441,6 +462,7 @@ def fetch_features_page(
         out_fields: Comma-separated field names or "*" for all
         token: Optional authentication token
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests
 
     Returns:
         GeoJSON FeatureCollection dict
@@ -465,7 +487,7 @@ def fetch_features_page(
 
     params = _add_token_to_params(params, token)
 
-    data = _make_request("GET", query_url, params=params)
+    data = _make_request("GET", query_url, params=params, client=client)
 
     # GeoJSON responses don't have the standard error format
     # Check if we got features or an error
@@ -485,6 +507,7 @@ def fetch_all_features(
     token: str | None = None,
     batch_size: int | None = None,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> Generator[dict, None, None]:
     """
     Generator that yields pages of GeoJSON features.
@@ -501,6 +524,7 @@ def fetch_all_features(
         token: Optional authentication token
         batch_size: Custom batch size (default: server's maxRecordCount)
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests
 
     Yields:
         GeoJSON FeatureCollection dicts for each page
@@ -536,6 +560,7 @@ def fetch_all_features(
             out_fields=out_fields,
             token=token,
             verbose=verbose,
+            client=client,
         )
 
         features = page.get("features", [])
@@ -640,6 +665,7 @@ def _stream_features_to_parquet(
     token: str | None = None,
     batch_size: int | None = None,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> int:
     """
     Stream features from ArcGIS to a Parquet file page by page.
@@ -659,6 +685,7 @@ def _stream_features_to_parquet(
         token: Optional authentication token
         batch_size: Custom batch size for pagination
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests
 
     Returns:
         Number of features written
@@ -678,6 +705,7 @@ def _stream_features_to_parquet(
             token=token,
             batch_size=batch_size,
             verbose=verbose,
+            client=client,
         ):
             features = page.get("features", [])
             if not features:
@@ -719,6 +747,7 @@ def arcgis_to_table(
     limit: int | None = None,
     batch_size: int | None = None,
     verbose: bool = False,
+    client: httpx.Client | None = None,
 ) -> pa.Table:
     """
     Convert ArcGIS Feature Service to PyArrow Table.
@@ -746,20 +775,40 @@ def arcgis_to_table(
         limit: Maximum number of features to return
         batch_size: Custom batch size for pagination
         verbose: Whether to print debug output
+        client: Optional httpx.Client to reuse across requests (default: one
+            client for this conversion, closed when it finishes)
 
     Returns:
         PyArrow Table with WKB geometry column
     """
+    if client is None:
+        # Scope one client to this conversion so its requests share pooled connections
+        with _get_http_client() as client:
+            return arcgis_to_table(
+                service_url,
+                auth=auth,
+                where=where,
+                bbox=bbox,
+                include_cols=include_cols,
+                exclude_cols=exclude_cols,
+                limit=limit,
+                batch_size=batch_size,
+                verbose=verbose,
+                client=client,
+            )
+
     configure_verbose(verbose)
 
     # Validate URL
     service_url, layer_id = validate_arcgis_url(service_url)
 
     # Resolve authentication
-    token = resolve_token(auth, service_url, verbose) if auth else None
+    token = resolve_token(auth, service_url, verbose, client=client) if auth else None
 
     # Get layer info (with WHERE and bbox filters applied to count)
-    layer_info = get_layer_info(service_url, token=token, where=where, bbox=bbox, verbose=verbose)
+    layer_info = get_layer_info(
+        service_url, token=token, where=where, bbox=bbox, verbose=verbose, client=client
+    )
     debug(f"Layer: {layer_info.name}")
     debug(f"Geometry type: {layer_info.geometry_type}")
     debug(f"Total features matching filter: {layer_info.total_count}")
@@ -802,6 +851,7 @@ def arcgis_to_table(
             token=token,
             batch_size=batch_size,
             verbose=verbose,
+            client=client,
         )
 
         if total_rows == 0:
@@ -3347,6 +3347,9 @@ def check_bbox_structure(parquet_file, verbose=False):
     """
     Check bbox structure and metadata coverage in a GeoParquet file.
 
+    The schema and geo metadata are read over one DuckDB connection, so the
+    footer is fetched and parsed by a single connection.
+
     Returns:
         dict: Results including:
             - has_bbox_column (bool): Whether a valid bbox struct column exists
@@ -3355,12 +3358,20 @@ def check_bbox_structure(parquet_file, verbose=False):
             - status (str): "optimal", "suboptimal", or "poor"
             - message (str): Human readable description
     """
-    from geoparquet_io.core.duckdb_metadata import get_geo_metadata, get_schema_info
+    from geoparquet_io.core.duckdb_metadata import (
+        _get_connection_for_file,
+        get_geo_metadata,
+        get_schema_info,
+    )
 
     safe_url = safe_file_url(parquet_file, verbose=False)
-
-    # Get schema info using DuckDB
-    schema_info = get_schema_info(safe_url)
+    connection, _ = _get_connection_for_file(safe_url)
+    try:
+        # Get schema info and geo metadata using DuckDB
+        schema_info = get_schema_info(safe_url, con=connection)
+        geo_meta = get_geo_metadata(safe_url, con=connection)
+    finally:
+        connection.close()
 
     if verbose:
         debug("\nSchema fields:")
@@ -3374,8 +3385,7 @@ def check_bbox_structure(parquet_file, verbose=False):
     bbox_column_name = _find_bbox_column_in_schema(schema_info, verbose)
     has_bbox_column = bbox_column_name is not None
 
-    # Get geo metadata and check for bbox covering
-    geo_meta = get_geo_metadata(safe_url)
+    # Check geo metadata for bbox covering
     has_bbox_metadata = _check_bbox_metadata_covering(geo_meta, has_bbox_column, verbose)
 
     # Determine status and message
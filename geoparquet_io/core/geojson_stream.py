@@ -24,6 +24,8 @@ import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import TextIO
+
     import duckdb
 
 # RFC 8142 record separator character
@@ -222,6 +224,7 @@ def _stream_to_stdout(
     query: str,
     rs: bool = True,
     pretty: bool = False,
+    output: TextIO | None = None,
 ) -> int:
     """
     Stream GeoJSON features to stdout line by line (GeoJSONSeq format).
@@ -231,6 +234,7 @@ def _stream_to_stdout(
         query: SQL query that returns feature JSON strings
         rs: Whether to include RFC 8142 record separators
         pretty: Whether to pretty-print each feature
+        output: Text stream to write to (default: sys.stdout)
 
     Returns:
         Number of features written
@@ -239,7 +243,8 @@ def _stream_to_stdout(
 
     result = con.execute(query)
     count = 0
-    output = sys.stdout
+    if output is None:
+        output = sys.stdout
 
     while True:
         row = result.fetchone()
@@ -385,6 +390,7 @@ def convert_to_geojson_stream(
     verbose: bool = False,
     profile: str | None = None,
     keep_crs: bool = False,
+    stream: TextIO | None = None,
 ) -> int:
     """
     Convert GeoParquet to GeoJSON.
@@ -410,6 +416,8 @@ def convert_to_geojson_stream(
         verbose: Enable verbose output (to stderr)
         profile: AWS profile name for S3 files
         keep_crs: If True, keep original CRS instead of reprojecting to WGS84
+        stream: Text stream for GeoJSONSeq output instead of stdout (e.g. a
+            tippecanoe stdin pipe); only used when streaming with seq=True
 
     Returns:
         Number of features written
@@ -489,7 +497,7 @@ def convert_to_geojson_stream(
 
         # Streaming output: GeoJSONSeq or FeatureCollection to stdout
         if seq:
-            return _stream_to_stdout(con, query, rs, pretty)
+            return _stream_to_stdout(con, query, rs, pretty, output=stream)
         else:
             return _stream_feature_collection(con, query, description, pretty)
 
@@ -624,6 +632,7 @@ def convert_to_geojson(
     verbose: bool = False,
     profile: str | None = None,
     keep_crs: bool = False,
+    stream: TextIO | None = None,
 ) -> int:
     """
     Convert GeoParquet to GeoJSON.
@@ -647,6 +656,8 @@ def convert_to_geojson(
         verbose: Enable verbose output
         profile: AWS profile name for S3 files
         keep_crs: If True, keep original CRS instead of reprojecting to WGS84
+        stream: Text stream for GeoJSONSeq output instead of stdout; only used
+            when streaming with seq=True
 
     Returns:
         Number of features written
@@ -664,4 +675,5 @@ def convert_to_geojson(
         verbose=verbose,
         profile=profile,
         keep_crs=keep_crs,
+        stream=stream,
     )
@@ -2,12 +2,23 @@
 
 import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from inspect import signature
 
 import click
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
 from geoparquet_io.core.common import (
+    find_primary_geometry_column,
+    get_dataset_bounds,
     get_duckdb_connection,
     get_parquet_metadata,
+    is_remote_url,
     needs_httpfs,
     remote_write_context,
     safe_file_url,
@@ -598,10 +609,15 @@ def _build_column_expression(column_name, column_prefix_length):
     return column_expr, partition_description
 
 
+# Column holding each row's partition value (as VARCHAR) in the staged copy
+PARTITION_KEY_COLUMN = "__gpio_partition"
+
+
 def _get_unique_partition_values(con, input_url, column_expr, column_name, verbose):
-    """Get unique partition values from input."""
+    """Get unique partition values from input, each with its staged partition key."""
     query = f"""
-        SELECT DISTINCT {column_expr} as partition_value
+        SELECT DISTINCT {column_expr} as partition_value,
+            CAST({column_expr} AS VARCHAR) as partition_key
         FROM '{input_url}'
         WHERE "{column_name}" IS NOT NULL
         ORDER BY partition_value
@@ -618,6 +634,163 @@ def _get_unique_partition_values(con, input_url, column_expr, column_name, verbo
     return partition_values
 
 
+def _is_clustered_by(con, input_url, column_name, partition_values, verbose):
+    """
+    Check whether the input's row groups are already ordered by the partition column.
+
+    When each row group's min/max range follows the previous one, a filter on a
+    single value only touches the row groups holding it, so partitions can be read
+    straight from the input and staging it would be wasted work. Only string and
+    integer columns are checked, since their statistics compare reliably.
+    """
+    value_type = type(partition_values[0][0])
+    if value_type not in (str, int):
+        return False
+
+    # Strings only carry the newer *_value statistics; all-NULL row groups are skipped
+    stats = con.execute(
+        """
+        SELECT
+            COALESCE(stats_min_value, stats_min),
+            COALESCE(stats_max_value, stats_max)
+        FROM parquet_metadata(?)
+        WHERE path_in_schema = ?
+            AND stats_null_count IS DISTINCT FROM num_values
+        ORDER BY file_name, row_group_id
+        """,
+        [input_url, column_name],
+    ).fetchall()
+
+    # A single row group can't be pruned
+    if len(stats) < 2 or any(lo is None or hi is None for lo, hi in stats):
+        return False
+
+    try:
+        ranges = [(value_type(lo), value_type(hi)) for lo, hi in stats]
+    except ValueError:
+        return False
+
+    clustered = all(prev[1] <= cur[0] for prev, cur in zip(ranges, ranges[1:], strict=False))
+    if verbose and clustered:
+        debug(
+            f"Input row groups are ordered by '{column_name}'; each partition reads "
+            f"~{max(1, len(ranges) // len(partition_values))} of {len(ranges)} row groups"
+        )
+    return clustered
+
+
+def _can_stage_with_arrow(input_url, column_name):
+    """
+    Check whether PyArrow can stage the input without changing how it reads back.
+
+    Requires a local file, a string or integer partition column (whose string
+    form matches DuckDB's VARCHAR cast) and no native Parquet geometry types,
+    which PyArrow would rewrite as plain binary.
+    """
+    # preserve_order needs pyarrow >= 15
+    if is_remote_url(input_url) or "preserve_order" not in signature(ds.write_dataset).parameters:
+        return False
+
+    try:
+        parquet_schema = pq.read_metadata(input_url).schema
+    except (OSError, pa.ArrowException):
+        # Globs and other inputs only DuckDB can resolve
+        return False
+    if any(
+        str(parquet_schema.column(i).logical_type).startswith(("Geometry", "Geography"))
+        for i in range(len(parquet_schema))
+    ):
+        return False
+
+    arrow_schema = parquet_schema.to_arrow_schema()
+    if column_name not in arrow_schema.names:
+        return False
+    column_type = arrow_schema.field(column_name).type
+    return (
+        pa.types.is_string(column_type)
+        or pa.types.is_large_string(column_type)
+        or pa.types.is_integer(column_type)
+    )
+
+
+def _stage_partitions(
+    con,
+    input_url,
+    column_expr,
+    column_name,
+    partition_keys,
+    staging_dir,
+    verbose,
+    column_prefix_length=None,
+):
+    """
+    Split the input into Hive partitions under staging_dir in a single pass.
+
+    Each partition is then written from its own staged files instead of
+    rescanning the whole input once per partition value. Row order within a
+    partition is preserved, so spatially sorted inputs stay sorted.
+
+    Rows are staged under the index of their key in partition_keys rather
+    than the key itself, since Hive readers turn directory values such as
+    NULL back into SQL NULL. Rows whose key is not listed are left out.
+
+    Whole-value partitions of local inputs are split by PyArrow's dataset
+    writer, which copies the encoded columns without decoding geometries.
+    Everything else goes through DuckDB's partitioned COPY.
+
+    Returns:
+        SQL relation reading the staged partitions, filterable on PARTITION_KEY_COLUMN
+        against a key's index as a string
+    """
+    if verbose:
+        debug("Staging partitions in a single pass over the input...")
+
+    keys = pa.array(partition_keys, pa.string())
+    escaped_dir = staging_dir.replace("'", "''")
+    if column_prefix_length is None and _can_stage_with_arrow(input_url, column_name):
+        dataset = ds.dataset(input_url, format="parquet")
+        key_index = pc.index_in(ds.field(column_name).cast(pa.string()), value_set=keys)
+        scanner = dataset.scanner(
+            columns={
+                **{name: ds.field(name) for name in dataset.schema.names},
+                PARTITION_KEY_COLUMN: key_index,
+            },
+            filter=key_index.is_valid(),
+        )
+        ds.write_dataset(
+            scanner,
+            staging_dir,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([(PARTITION_KEY_COLUMN, pa.int32())]), flavor="hive"
+            ),
+            max_partitions=2**31 - 1,
+            existing_data_behavior="overwrite_or_ignore",
+            preserve_order=True,
+        )
+    else:
+        key_table = pa.table(
+            {"__gpio_key": keys, "__gpio_index": pa.array(range(len(keys)), pa.int32())}
+        )
+        con.register("__gpio_partition_keys", key_table)
+        try:
+            con.execute(f"""
+                COPY (
+                    SELECT src.*, k."__gpio_index" AS "{PARTITION_KEY_COLUMN}"
+                    FROM '{input_url}' AS src
+                    JOIN __gpio_partition_keys AS k
+                        ON CAST({column_expr} AS VARCHAR) = k."__gpio_key"
+                ) TO '{escaped_dir}' (FORMAT PARQUET, PARTITION_BY ("{PARTITION_KEY_COLUMN}"))
+            """)
+        finally:
+            con.unregister("__gpio_partition_keys")
+
+    return (
+        f"read_parquet('{escaped_dir}/*/*.parquet', "
+        "hive_partitioning = true, hive_types_autocast = false)"
+    )
+
+
 def _determine_output_path(
     actual_output, partition_value, column_name, column_prefix_length, hive, filename_prefix
 ):
@@ -705,10 +878,27 @@ def _strip_bbox_from_metadata(metadata: dict | None) -> dict | None:
     return metadata_copy
 
 
+def _hilbert_order_clause(input_parquet, verbose=False):
+    """Build an ORDER BY clause sorting rows along a Hilbert curve over the dataset bounds."""
+    geom_col = find_primary_geometry_column(input_parquet, verbose)
+    bounds = get_dataset_bounds(input_parquet, geom_col, verbose=verbose)
+    if not bounds:
+        raise click.ClickException("Could not calculate dataset bounds for Hilbert ordering")
+
+    xmin, ymin, xmax, ymax = bounds
+    return (
+        f'ORDER BY ST_Hilbert("{geom_col}", '
+        f"ST_Extent(ST_MakeEnvelope({xmin}, {ymin}, {xmax}, {ymax})))"
+    )
+
+
 def _process_partition_value(
     con,
-    input_url,
+    source,
+    select_clause,
+    filter_column,
     partition_value,
+    partition_key,
     column_name,
     column_prefix_length,
     actual_output,
@@ -716,7 +906,6 @@ def _process_partition_value(
     filename_prefix,
     overwrite,
     metadata,
-    keep_partition_column,
     verbose,
     geoparquet_version=None,
     compression: str = "ZSTD",
@@ -724,6 +913,7 @@ def _process_partition_value(
     row_group_size_mb: int | None = None,
     row_group_rows: int | None = None,
     memory_limit: str | None = None,
+    order_clause: str = "",
 ):
     """Process a single partition value."""
     output_filename = _determine_output_path(
@@ -738,20 +928,13 @@ def _process_partition_value(
     if verbose:
         debug(f"Processing partition: {partition_value}...")
 
-    # Build WHERE clause
-    if column_prefix_length is not None:
-        where_clause = f"LEFT(\"{column_name}\", {column_prefix_length}) = '{partition_value}'"
-    else:
-        where_clause = f"\"{column_name}\" = '{partition_value}'"
-
-    # Build SELECT clause
-    select_clause = _build_select_clause(con, input_url, column_name, keep_partition_column)
-
-    # Build SELECT query for partition
+    # Build SELECT query for partition; the filter prunes files or row groups
+    escaped_key = partition_key.replace("'", "''")
     partition_query = f"""
         SELECT {select_clause}
-        FROM '{input_url}'
-        WHERE {where_clause}
+        FROM {source}
+        WHERE "{filter_column}" = '{escaped_key}'
+        {order_clause}
     """
 
     # Strip bbox from metadata so it gets recomputed for this partition's data
@@ -797,6 +980,7 @@ def partition_by_column(
     row_group_size_mb: int | None = None,
     row_group_rows: int | None = None,
     memory_limit: str | None = None,
+    hilbert_order: bool = False,
 ) -> int:
     """
     Common function to partition a GeoParquet file by column values.
@@ -823,6 +1007,8 @@ def partition_by_column(
         row_group_size_mb: Row group size in MB (mutually exclusive with row_group_rows)
         row_group_rows: Row group size in number of rows (mutually exclusive with row_group_size_mb)
         memory_limit: DuckDB memory limit for write operations (e.g., "2GB")
+        hilbert_order: Sort each partition's rows along a Hilbert curve so row group
+            bbox statistics stay tight and spatial filters can skip row groups
 
     Returns:
         Number of partitions created
@@ -868,29 +1054,110 @@ def partition_by_column(
             con, input_url, column_expr, column_name, verbose
         )
 
-        # Process each partition value
-        for row in partition_values:
-            partition_value = row[0]
-            _process_partition_value(
-                con,
-                input_url,
-                partition_value,
-                column_name,
-                column_prefix_length,
-                actual_output,
-                hive,
-                filename_prefix,
-                overwrite,
-                metadata,
-                keep_partition_column,
-                verbose,
-                geoparquet_version,
-                compression,
-                compression_level,
-                row_group_size_mb,
-                row_group_rows,
-                memory_limit,
+        select_clause = _build_select_clause(con, input_url, column_name, keep_partition_column)
+
+        # Existing outputs are skipped without overwrite, so leave them out of staging
+        pending = [
+            (value, key)
+            for value, key in partition_values
+            if overwrite
+            or not os.path.exists(
+                _determine_output_path(
+                    actual_output, value, column_name, column_prefix_length, hive, filename_prefix
+                )
             )
+        ]
+        if verbose and len(pending) < len(partition_values):
+            debug(
+                f"Skipping {len(partition_values) - len(pending)} partitions "
+                "whose output files already exist"
+            )
+
+        order_clause = ""
+        if hilbert_order and pending:
+            if verbose:
+                debug("Ordering rows within each partition using Hilbert curve...")
+            order_clause = _hilbert_order_clause(input_parquet, verbose)
+
+        with ExitStack() as stack:
+            if not pending:
+                source = filter_column = None
+            elif column_prefix_length is None and _is_clustered_by(
+                con, input_url, column_name, partition_values, verbose
+            ):
+                # Row-group statistics already isolate each partition
+                source, filter_column = f"'{input_url}'", column_name
+            else:
+                # Stage the pending partitions in one pass, then write each from its
+                # staged files. The staging directory sits beside the output folder,
+                # on the same disk but outside the dataset being written.
+                staging = stack.enter_context(
+                    tempfile.TemporaryDirectory(
+                        prefix=".gpio-staging-",
+                        dir=os.path.dirname(os.path.abspath(actual_output)),
+                    )
+                )
+                source = _stage_partitions(
+                    con,
+                    input_url,
+                    column_expr,
+                    column_name,
+                    [key for _, key in pending],
+                    staging,
+                    verbose,
+                    column_prefix_length=column_prefix_length,
+                )
+                filter_column = PARTITION_KEY_COLUMN
+                # Staged partitions are looked up by their index in pending
+                pending = [(value, str(index)) for index, (value, _) in enumerate(pending)]
+                if select_clause == "*":
+                    select_clause = f'* EXCLUDE ("{PARTITION_KEY_COLUMN}")'
+
+            def write_partition(partition_value, partition_key):
+                # Each worker gets its own cursor on the shared database
+                cursor = con.cursor()
+                try:
+                    _process_partition_value(
+                        cursor,
+                        source,
+                        select_clause,
+                        filter_column,
+                        partition_value,
+                        partition_key,
+                        column_name,
+                        column_prefix_length,
+                        actual_output,
+                        hive,
+                        filename_prefix,
+                        overwrite,
+                        metadata,
+                        verbose,
+                        geoparquet_version,
+                        compression,
+                        compression_level,
+                        row_group_size_mb,
+                        row_group_rows,
+                        memory_limit,
+                        order_clause,
+                    )
+                finally:
+                    cursor.close()
+
+            # Partitions are independent, so write them concurrently with one worker
+            # per core. Thread settings are database-wide, so DuckDB is pinned to one
+            # thread here, after staging, instead of giving every write the full pool.
+            con.execute("SET threads = 1")
+            max_workers = max(1, min(len(pending), os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(write_partition, value, key) for value, key in pending]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except Exception:
+                    # Don't start the remaining partitions after a failure
+                    for f in futures:
+                        f.cancel()
+                    raise
 
         con.close()
 
@@ -1,51 +1,93 @@
 #!/usr/bin/env python3
 
+import re
+
 import click
 
 from geoparquet_io.core.common import safe_file_url
 from geoparquet_io.core.logging_config import debug, progress, success, warn
 from geoparquet_io.core.partition_common import partition_by_column, preview_partition
 
+# Common WGS84 identifiers, matched case-insensitively anywhere in a CRS string:
+# 4326, EPSG:4326, WGS84, WGS 84, urn:ogc:def:crs:EPSG::4326 and
+# urn:ogc:def:crs:OGC:1.3:CRS84
+_WGS84_PATTERN = re.compile(r"4326|wgs ?84|urn:ogc:def:crs:ogc:1\.3:crs84", re.IGNORECASE)
 
-def check_country_code_column(parquet_file, column_name="admin:country_code"):
-    """Check if the specified column exists and is populated."""
-    from geoparquet_io.core.duckdb_metadata import get_column_names
+# PROJJSON (authority, code) identifiers of WGS84
+_WGS84_IDS = {("EPSG", "4326"), ("OGC", "CRS84")}
 
-    safe_url = safe_file_url(parquet_file, verbose=False)
-    column_names = get_column_names(safe_url)
 
-    # Check if column exists
-    if column_name not in column_names:
-        raise click.UsageError(
-            f"Column '{column_name}' not found in the Parquet file. "
-            "Please add country codes first using the add_country_codes command."
-        )
+def _metadata_connection(parquet_file):
+    """Create a DuckDB connection for footer-only reads of parquet_file.
 
-    # Check if column has values using DuckDB query
-    from geoparquet_io.core.common import get_duckdb_connection, needs_httpfs
+    For remote files the connection caches parquet footers and HTTP metadata,
+    so the column and CRS checks share one footer fetch instead of each issuing
+    their own range requests.
+    """
+    from geoparquet_io.core.common import get_duckdb_connection, is_remote_url, needs_httpfs
 
     con = get_duckdb_connection(load_spatial=False, load_httpfs=needs_httpfs(parquet_file))
+    if is_remote_url(parquet_file):
+        con.execute("SET parquet_metadata_cache = true")
+        con.execute("SET enable_http_metadata_cache = true")
+    return con
+
+
+def check_country_code_column(parquet_file, column_name="admin:country_code", con=None):
+    """Check if the specified column exists and is populated.
+
+    Pass ``con`` to reuse a connection that has already read the file's footer.
+    """
+    from geoparquet_io.core.duckdb_metadata import get_column_names
+
+    safe_url = safe_file_url(parquet_file, verbose=False)
+    should_close = con is None
+    if con is None:
+        con = _metadata_connection(parquet_file)
+
     try:
-        result = con.execute(f"""
-            SELECT COUNT(*) as total, COUNT("{column_name}") as non_null
-            FROM read_parquet('{safe_url}')
-        """).fetchone()
-        total, non_null = result
+        column_names = get_column_names(safe_url, con=con)
+
+        # Check if column exists
+        if column_name not in column_names:
+            raise click.UsageError(
+                f"Column '{column_name}' not found in the Parquet file. "
+                "Please add country codes first using the add_country_codes command."
+            )
+
+        # Check if column has values, from the footer's null counts when every row
+        # group has them, so no data pages are read
+        total, nulls, missing_stats = con.execute(
+            """
+            SELECT SUM(num_values), SUM(stats_null_count), COUNT(*) - COUNT(stats_null_count)
+            FROM parquet_metadata(?)
+            WHERE path_in_schema = ?
+            """,
+            [safe_url, column_name],
+        ).fetchone()
+        if missing_stats == 0 and total is not None:
+            non_null = total - nulls
+        else:
+            quoted_column = column_name.replace('"', '""')
+            (non_null,) = con.execute(
+                f'SELECT COUNT("{quoted_column}") FROM read_parquet(?)', [safe_url]
+            ).fetchone()
         if non_null == 0:
             raise click.UsageError(
                 f"Column '{column_name}' exists but contains only NULL values. "
                 "Please populate country codes using the add_country_codes command."
             )
     finally:
-        con.close()
+        if should_close:
+            con.close()
 
 
-def check_crs(parquet_file, verbose=False):
+def check_crs(parquet_file, verbose=False, con=None):
     """Check if CRS is WGS84 or null, warn if not."""
     from geoparquet_io.core.duckdb_metadata import get_geo_metadata
 
     safe_url = safe_file_url(parquet_file, verbose=False)
-    geo_meta = get_geo_metadata(safe_url)
+    geo_meta = get_geo_metadata(safe_url, con=con)
 
     if geo_meta:
         # Check CRS in both metadata formats
@@ -74,25 +116,20 @@ def _is_wgs84(crs):
     if not crs:
         return True
 
-    # Common WGS84 identifiers
-    wgs84_identifiers = [
-        "4326",
-        "EPSG:4326",
-        "WGS84",
-        "WGS 84",
-        "urn:ogc:def:crs:EPSG::4326",
-        "urn:ogc:def:crs:OGC:1.3:CRS84",
-    ]
-
     if isinstance(crs, str):
-        return any(id.lower() in crs.lower() for id in wgs84_identifiers)
+        return _WGS84_PATTERN.search(crs) is not None
     elif isinstance(crs, dict):
-        # Check PROJJSON format
-        return (
-            crs.get("type", "").lower() == "geographiccrs"
-            and "wgs" in str(crs).lower()
-            and "84" in str(crs)
-        )
+        # Check PROJJSON format from its identifying fields, not the whole serialized dict
+        if crs.get("type", "").lower() != "geographiccrs":
+            return False
+        ident = crs.get("id") or {}
+        if (ident.get("authority"), str(ident.get("code"))) in _WGS84_IDS:
+            return True
+        datum = crs.get("datum") or crs.get("datum_ensemble") or {}
+        for name in (crs.get("name"), datum.get("name")):
+            name = (name or "").lower()
+            if "wgs" in name and "84" in name:
+                return True
     return False
 
 
@@ -108,6 +145,11 @@ def split_by_country(
     force=False,
     skip_analysis=False,
     filename_prefix=None,
+    compression="ZSTD",
+    compression_level=15,
+    row_group_size_mb=None,
+    row_group_rows=None,
+    hilbert_order=False,
 ):
     """
     Split a GeoParquet file into separate files by country code.
@@ -127,17 +169,29 @@ def split_by_country(
         preview_limit: Maximum number of partitions to show in preview (default: 15)
         force: Force partitioning even if analysis detects issues
         skip_analysis: Skip partition strategy analysis (for performance)
+        filename_prefix: Optional prefix for country filenames (e.g., 'places' → places_US.parquet)
+        compression: Compression codec (default: ZSTD)
+        compression_level: Compression level (default: 15)
+        row_group_size_mb: Row group size in MB (mutually exclusive with row_group_rows)
+        row_group_rows: Row group size in number of rows (mutually exclusive with row_group_size_mb)
+        hilbert_order: Sort each country's rows along a Hilbert curve (default: False)
     """
     input_url = safe_file_url(input_parquet, verbose)
 
-    # Verify column exists and is populated
-    if verbose:
-        debug(f"Checking column '{column}'...")
-    check_country_code_column(input_url, column)
-
-    # Check CRS (only if not in preview mode)
-    if not preview:
-        check_crs(input_url, verbose)
+    # Both checks share one connection, whose file cache keeps the footer of a
+    # remote input after the first read
+    con = _metadata_connection(input_url)
+    try:
+        # Verify column exists and is populated
+        if verbose:
+            debug(f"Checking column '{column}'...")
+        check_country_code_column(input_url, column, con=con)
+
+        # Check CRS (only if not in preview mode)
+        if not preview:
+            check_crs(input_url, verbose, con=con)
+    finally:
+        con.close()
 
     # If preview mode, show analysis and preview, then exit
     if preview:
@@ -184,6 +238,11 @@ def split_by_country(
         force=force,
         skip_analysis=skip_analysis,
         filename_prefix=filename_prefix,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size_mb=row_group_size_mb,
+        row_group_rows=row_group_rows,
+        hilbert_order=hilbert_order,
     )
 
     success(f"Successfully split file into {num_partitions} country file(s)")
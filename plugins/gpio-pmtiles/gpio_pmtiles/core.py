@@ -1,5 +1,6 @@
 """Core PMTiles generation logic using tippecanoe subprocess."""
 
+import io
 import shutil
 import subprocess
 import sys
@@ -192,6 +193,43 @@ def _build_tippecanoe_command(
     return cmd
 
 
+def _wait_for_upstream(processes: list[subprocess.Popen]) -> None:
+    """
+    Reap all upstream gpio processes, then report the first failure.
+
+    Every process is waited on before any returncode is inspected, so a
+    failing stage never leaves its siblings running while the error is
+    raised. Failures are reported in pipeline order.
+
+    Raises:
+        RuntimeError: If any process exited with a non-zero code
+    """
+    for proc in processes:
+        proc.wait()
+
+    for proc in processes:
+        if proc.returncode != 0:
+            cmd_name = proc.args[0] if hasattr(proc, "args") else "command"
+            raise RuntimeError(f"{cmd_name} failed with exit code {proc.returncode}")
+
+
+def _spawn_stage(cmd: list[str], prev_stdout, stdout, stderr) -> tuple[subprocess.Popen, object]:
+    """
+    Start one pipeline stage reading from the previous stage's stdout.
+
+    The parent's handle on ``prev_stdout`` is closed exactly once, right after
+    it has been handed to the child, so the upstream process receives SIGPIPE
+    if this stage exits early.
+
+    Returns:
+        Tuple of (process, process stdout) for chaining into the next stage
+    """
+    proc = subprocess.Popen(cmd, stdin=prev_stdout, stdout=stdout, stderr=stderr)
+    if prev_stdout:
+        prev_stdout.close()
+    return proc, proc.stdout
+
+
 def _run_pipeline(
     gpio_commands: list[list[str]],
     tippecanoe_cmd: list[str],
@@ -218,34 +256,25 @@ def _run_pipeline(
 
     try:
         # Create all gpio processes in the pipeline
-        for i, cmd in enumerate(gpio_commands):
-            stdin_source = processes[-1].stdout if processes else None
-
-            proc = subprocess.Popen(
+        prev_stdout = None
+        for cmd in gpio_commands:
+            proc, prev_stdout = _spawn_stage(
                 cmd,
-                stdin=stdin_source,
+                prev_stdout,
                 stdout=subprocess.PIPE,
                 stderr=None if verbose else subprocess.PIPE,
             )
             processes.append(proc)
 
-            # Close the previous process's stdout to allow SIGPIPE
-            if i > 0 and processes[-2].stdout:
-                processes[-2].stdout.close()
-
         # Final step: tippecanoe reads from the last gpio process
-        tippecanoe_proc = subprocess.Popen(
+        tippecanoe_proc, _ = _spawn_stage(
             tippecanoe_cmd,
-            stdin=processes[-1].stdout if processes else None,
+            prev_stdout,
             stdout=None if verbose else subprocess.PIPE,
             stderr=None,  # tippecanoe writes progress to stderr
         )
         processes.append(tippecanoe_proc)
 
-        # Close last gpio process's stdout
-        if len(processes) > 1 and processes[-2].stdout:
-            processes[-2].stdout.close()
-
         # Wait for the final process to complete
         tippecanoe_proc.communicate()
 
@@ -253,12 +282,8 @@ def _run_pipeline(
         if tippecanoe_proc.returncode != 0:
             raise RuntimeError(f"tippecanoe failed with exit code {tippecanoe_proc.returncode}")
 
-        # Check earlier processes in the pipeline
-        for proc in processes[:-1]:  # Skip tippecanoe (already checked)
-            proc.wait()
-            if proc.returncode != 0:
-                cmd_name = proc.args[0] if hasattr(proc, "args") else "command"
-                raise RuntimeError(f"{cmd_name} failed with exit code {proc.returncode}")
+        # Check earlier processes in the pipeline (tippecanoe already checked)
+        _wait_for_upstream(processes[:-1])
 
     except KeyboardInterrupt:
         # Clean up processes on interrupt
@@ -273,6 +298,91 @@ def _run_pipeline(
         raise
 
 
+def _can_convert_in_process(
+    input_path: str,
+    bbox: str | None,
+    where: str | None,
+    include_cols: str | None,
+    src_crs: str | None,
+) -> bool:
+    """
+    Check whether GeoJSON can be streamed to tippecanoe without a gpio subprocess.
+
+    Only plain local conversions qualify: no filters, no forced reprojection,
+    and a local input path.
+    """
+    if any([bbox, where, include_cols, src_crs]):
+        return False
+
+    try:
+        from geoparquet_io.core.common import is_remote_url
+    except ImportError:
+        return False
+
+    return input_path != "-" and not is_remote_url(input_path)
+
+
+def _run_in_process(
+    input_path: str,
+    tippecanoe_cmd: list[str],
+    precision: int,
+    verbose: bool,
+    profile: str | None,
+) -> None:
+    """
+    Stream GeoJSON from GeoParquet straight into tippecanoe's stdin.
+
+    Avoids launching ``gpio convert geojson`` as a separate interpreter for
+    the common unfiltered local-file case.
+
+    Raises:
+        RuntimeError: If tippecanoe fails
+    """
+    from geoparquet_io.core.geojson_stream import convert_to_geojson_stream
+
+    if verbose:
+        print(
+            f"Running: gpio convert geojson {input_path} (in-process) | {' '.join(tippecanoe_cmd)}",
+            file=sys.stderr,
+        )
+
+    # Quiet mode discards stdout instead of piping it: nothing would drain the pipe
+    # while GeoJSON is being written, and stdin is closed by us, not communicate()
+    tippecanoe_proc = subprocess.Popen(
+        tippecanoe_cmd,
+        stdin=subprocess.PIPE,
+        stdout=None if verbose else subprocess.DEVNULL,
+        stderr=None,  # tippecanoe writes progress to stderr
+    )
+
+    try:
+        stream = io.TextIOWrapper(tippecanoe_proc.stdin, encoding="utf-8")
+        try:
+            convert_to_geojson_stream(
+                input_path,
+                precision=precision,
+                verbose=verbose,
+                profile=profile,
+                stream=stream,
+            )
+        except BrokenPipeError:
+            # tippecanoe exited early; its returncode carries the real error
+            pass
+        finally:
+            try:
+                stream.close()
+            except BrokenPipeError:
+                pass
+
+        if tippecanoe_proc.wait() != 0:
+            raise RuntimeError(f"tippecanoe failed with exit code {tippecanoe_proc.returncode}")
+
+    except BaseException:
+        if tippecanoe_proc.poll() is None:
+            tippecanoe_proc.terminate()
+        raise
+
+
 def create_pmtiles_from_geoparquet(
     input_path: str,
     output_path: str,
@@ -297,6 +407,9 @@ def create_pmtiles_from_geoparquet(
     3. Stream GeoJSON from GeoParquet (gpio convert geojson)
     4. Generate PMTiles using tippecanoe
 
+    Local files with no filters or reprojection skip the gpio subprocesses and
+    stream GeoJSON into tippecanoe directly from this process.
+
     Args:
         input_path: Path to input GeoParquet file
         output_path: Path for output PMTiles file
@@ -324,15 +437,16 @@ def create_pmtiles_from_geoparquet(
     if not _check_tippecanoe():
         raise TippecanoeNotFoundError()
 
-    # Build commands
-    gpio_commands = _build_gpio_commands(
-        input_path, bbox, where, include_cols, precision, verbose, profile, src_crs
-    )
-
     tippecanoe_cmd = _build_tippecanoe_command(output_path, layer, min_zoom, max_zoom, verbose)
 
-    # Run the pipeline
-    _run_pipeline(gpio_commands, tippecanoe_cmd, verbose)
+    if _can_convert_in_process(input_path, bbox, where, include_cols, src_crs):
+        # Fast path: no gpio subprocess needed for plain local conversion
+        _run_in_process(input_path, tippecanoe_cmd, precision, verbose, profile)
+    else:
+        gpio_commands = _build_gpio_commands(
+            input_path, bbox, where, include_cols, precision, verbose, profile, src_crs
+        )
+        _run_pipeline(gpio_commands, tippecanoe_cmd, verbose)
 
     if verbose:
         print(f"Successfully created {output_path}", file=sys.stderr)
@@ -1,8 +1,19 @@
 """Pytest configuration for gpio-pmtiles tests."""
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path so we can import gpio_pmtiles
 plugin_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(plugin_dir))
+
+
+@pytest.fixture(scope="session")
+def subprocess_pool():
+    """Thread pool for tests that launch several subprocesses at once."""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        yield executor
@@ -1,64 +1,84 @@
 """Tests for gpio-pmtiles plugin."""
 
+import functools
 import shutil
 import subprocess
+import sys
+from pathlib import Path
 
 import pytest
-
-
+from click.testing import CliRunner
+
+from gpio_pmtiles.cli import pmtiles
+from gpio_pmtiles.core import (
+    TippecanoeNotFoundError,
+    _build_gpio_commands,
+    _build_tippecanoe_command,
+    _can_convert_in_process,
+    _get_gpio_executable,
+    _run_in_process,
+    _spawn_stage,
+    _validate_path,
+    _wait_for_upstream,
+    create_pmtiles_from_geoparquet,
+)
+
+
+@functools.cache
 def has_tippecanoe():
     """Check if tippecanoe is available."""
     return shutil.which("tippecanoe") is not None
 
 
+@functools.cache
 def has_gpio():
     """Check if gpio is available."""
     return shutil.which("gpio") is not None
 
 
-@pytest.mark.skipif(not has_gpio(), reason="gpio not installed")
-def test_plugin_loaded():
-    """Test that the pmtiles plugin is loaded."""
-    result = subprocess.run(
-        ["gpio", "--help"],
-        capture_output=True,
-        text=True,
+HAS_TIPPECANOE = has_tippecanoe()
+HAS_GPIO = has_gpio()
+
+runner = CliRunner()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not HAS_GPIO, reason="gpio not installed")
+def test_plugin_loaded(subprocess_pool):
+    """Test that the pmtiles plugin is registered with the gpio entry point."""
+    root_future, create_future = (
+        subprocess_pool.submit(subprocess.run, cmd, capture_output=True, text=True)
+        for cmd in (["gpio", "--help"], ["gpio", "pmtiles", "create", "--help"])
     )
-    assert result.returncode == 0
-    assert "pmtiles" in result.stdout
+
+    root = root_future.result()
+    assert root.returncode == 0
+    assert "pmtiles" in root.stdout
+
+    create = create_future.result()
+    assert create.returncode == 0
+    assert "Create PMTiles from GeoParquet file" in create.stdout
 
 
-@pytest.mark.skipif(not has_gpio(), reason="gpio not installed")
 def test_pmtiles_help():
     """Test that pmtiles help works."""
-    result = subprocess.run(
-        ["gpio", "pmtiles", "--help"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "PMTiles generation commands" in result.stdout
+    result = runner.invoke(pmtiles, ["--help"])
+    assert result.exit_code == 0
+    assert "PMTiles generation commands" in result.output
 
 
-@pytest.mark.skipif(not has_gpio(), reason="gpio not installed")
 def test_create_help():
     """Test that pmtiles create help works."""
-    result = subprocess.run(
-        ["gpio", "pmtiles", "create", "--help"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "Create PMTiles from GeoParquet file" in result.stdout
-    assert "--layer" in result.stdout
-    assert "--bbox" in result.stdout
+    result = runner.invoke(pmtiles, ["create", "--help"])
+    assert result.exit_code == 0
+    assert "Create PMTiles from GeoParquet file" in result.output
+    assert "--layer" in result.output
+    assert "--bbox" in result.output
 
 
-@pytest.mark.skipif(not has_tippecanoe(), reason="tippecanoe not installed")
+@pytest.mark.skipif(not HAS_TIPPECANOE, reason="tippecanoe not installed")
 def test_tippecanoe_not_found_error():
     """Test error message when tippecanoe is not found."""
-    from gpio_pmtiles.core import TippecanoeNotFoundError
-
     error = TippecanoeNotFoundError()
     error_msg = str(error)
 
@@ -69,81 +89,67 @@ def test_tippecanoe_not_found_error():
 
 def test_gpio_executable_detection():
     """Test that gpio executable is correctly detected."""
-    from gpio_pmtiles.core import _get_gpio_executable
-
     gpio_exe = _get_gpio_executable()
     assert gpio_exe is not None
     assert isinstance(gpio_exe, str)
     assert len(gpio_exe) > 0
 
 
-def test_build_gpio_commands_simple():
-    """Test building simple gpio convert command."""
-    from gpio_pmtiles.core import _build_gpio_commands
-
-    commands = _build_gpio_commands(
-        input_path="input.parquet",
-        bbox=None,
-        where=None,
-        include_cols=None,
-        precision=6,
-        verbose=False,
-        profile=None,
-        src_crs=None,
-    )
-
-    assert len(commands) == 1
-    assert "convert" in commands[0]
-    assert "geojson" in commands[0]
-    assert "input.parquet" in commands[0]
-    assert "--precision" in commands[0]
-    assert "6" in commands[0]
-
-
-def test_build_gpio_commands_with_filters():
-    """Test building gpio commands with filters."""
-    from gpio_pmtiles.core import _build_gpio_commands
-
-    commands = _build_gpio_commands(
-        input_path="input.parquet",
-        bbox="-122,37,-121,38",
-        where="population > 1000",
-        include_cols="name,type",
-        precision=5,
-        verbose=True,
-        profile="my-profile",
-        src_crs=None,
-    )
-
-    assert len(commands) == 2
-
-    # Extract command
-    extract_cmd = commands[0]
-    assert "extract" in extract_cmd
-    assert "input.parquet" in extract_cmd
-    assert "--bbox" in extract_cmd
-    assert "-122,37,-121,38" in extract_cmd
-    assert "--where" in extract_cmd
-    assert "population > 1000" in extract_cmd
-    assert "--include-cols" in extract_cmd
-    assert "name,type" in extract_cmd
-    assert "--verbose" in extract_cmd
-    assert "--profile" in extract_cmd
-    assert "my-profile" in extract_cmd
-
-    # Convert command
-    convert_cmd = commands[1]
-    assert "convert" in convert_cmd
-    assert "geojson" in convert_cmd
-    assert "-" in convert_cmd  # Reading from stdin
-    assert "--precision" in convert_cmd
-    assert "5" in convert_cmd
+@pytest.mark.parametrize(
+    "kwargs,expected_tokens",
+    [
+        (
+            {
+                "bbox": None,
+                "where": None,
+                "include_cols": None,
+                "precision": 6,
+                "verbose": False,
+                "profile": None,
+            },
+            [{"convert", "geojson", "input.parquet", "--precision", "6"}],
+        ),
+        (
+            {
+                "bbox": "-122,37,-121,38",
+                "where": "population > 1000",
+                "include_cols": "name,type",
+                "precision": 5,
+                "verbose": True,
+                "profile": "my-profile",
+            },
+            [
+                {
+                    "extract",
+                    "input.parquet",
+                    "--bbox",
+                    "-122,37,-121,38",
+                    "--where",
+                    "population > 1000",
+                    "--include-cols",
+                    "name,type",
+                    "--verbose",
+                    "--profile",
+                    "my-profile",
+                },
+                # Convert reads the extract output from stdin
+                {"convert", "geojson", "-", "--precision", "5"},
+            ],
+        ),
+    ],
+    ids=["simple", "filtered"],
+)
+def test_build_gpio_commands(kwargs, expected_tokens):
+    """Test building gpio commands with and without filters."""
+    commands = _build_gpio_commands(input_path="input.parquet", src_crs=None, **kwargs)
+
+    assert len(commands) == len(expected_tokens)
+    for cmd, tokens in zip(commands, expected_tokens, strict=True):
+        assert set(cmd) >= tokens, f"missing {tokens - set(cmd)} in {cmd}"
 
 
 def test_build_gpio_commands_with_reprojection():
     """Test building gpio commands with CRS reprojection."""
-    from gpio_pmtiles.core import _build_gpio_commands
-
     commands = _build_gpio_commands(
         input_path="input.parquet",
         bbox=None,
@@ -159,7 +165,7 @@ def test_build_gpio_commands_with_reprojection():
     assert len(commands) == 2
 
     # Reproject command
-    reproject_cmd = commands[0]
+    reproject_cmd = set(commands[0])
     assert "convert" in reproject_cmd
     assert "reproject" in reproject_cmd
     assert "input.parquet" in reproject_cmd
@@ -172,7 +178,7 @@ def test_build_gpio_commands_with_reprojection():
     assert "my-profile" in reproject_cmd
 
     # Convert command should also have verbose and profile
-    convert_cmd = commands[1]
+    convert_cmd = set(commands[1])
     assert "convert" in convert_cmd
     assert "geojson" in convert_cmd
     assert "-" in convert_cmd  # Reading from stdin
@@ -183,46 +189,111 @@ def test_build_gpio_commands_with_reprojection():
     assert "my-profile" in convert_cmd
 
 
-def test_build_tippecanoe_command_basic():
-    """Test building basic tippecanoe command."""
-    from gpio_pmtiles.core import _build_tippecanoe_command
+@pytest.mark.parametrize(
+    "kwargs,present,absent",
+    [
+        (
+            {"min_zoom": None, "max_zoom": None, "verbose": False},
+            # -P: parallel mode, -zg: auto zoom detection
+            {"tippecanoe", "-P", "-o", "output.pmtiles", "-l", "test_layer", "-zg"}
+            | {"--drop-densest-as-needed"},
+            set(),
+        ),
+        (
+            {"min_zoom": 0, "max_zoom": 14, "verbose": True},
+            {"-Z", "0", "-z", "14", "--progress-interval=1"},
+            # No auto detection when zoom levels are explicit
+            {"-zg"},
+        ),
+    ],
+    ids=["basic", "with-zoom"],
+)
+def test_build_tippecanoe_command(kwargs, present, absent):
+    """Test building tippecanoe commands with auto and explicit zoom levels."""
+    cmd = set(_build_tippecanoe_command(output_path="output.pmtiles", layer="test_layer", **kwargs))
+
+    assert cmd >= present, f"missing {present - cmd}"
+    assert not cmd & absent
+
+
+def test_wait_for_upstream_reaps_all_before_raising():
+    """Test that every upstream process is reaped even when one fails."""
+    processes = [
+        subprocess.Popen([sys.executable, "-c", "raise SystemExit(3)"]),
+        subprocess.Popen([sys.executable, "-c", "pass"]),
+    ]
+
+    with pytest.raises(RuntimeError, match="exit code 3"):
+        _wait_for_upstream(processes)
+
+    assert [proc.returncode for proc in processes] == [3, 0]
 
-    cmd = _build_tippecanoe_command(
-        output_path="output.pmtiles",
-        layer="test_layer",
-        min_zoom=None,
-        max_zoom=None,
-        verbose=False,
+
+def test_spawn_stage_closes_previous_stdout():
+    """Test that a stage closes the upstream stdout once it is handed off."""
+    upstream, upstream_stdout = _spawn_stage(
+        [sys.executable, "-c", "print('hello')"], None, stdout=subprocess.PIPE, stderr=None
+    )
+    downstream, downstream_stdout = _spawn_stage(
+        [sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read())"],
+        upstream_stdout,
+        stdout=subprocess.PIPE,
+        stderr=None,
     )
 
-    assert "tippecanoe" in cmd
-    assert "-P" in cmd  # Parallel mode
-    assert "-o" in cmd
-    assert "output.pmtiles" in cmd
-    assert "-l" in cmd
-    assert "test_layer" in cmd
-    assert "-zg" in cmd  # Auto zoom detection
-    assert "--drop-densest-as-needed" in cmd
+    assert upstream_stdout.closed
+    assert downstream_stdout.read().strip() == b"hello"
+    downstream_stdout.close()
+    assert upstream.wait() == 0
+    assert downstream.wait() == 0
 
 
-def test_build_tippecanoe_command_with_zoom():
-    """Test building tippecanoe command with explicit zoom levels."""
-    from gpio_pmtiles.core import _build_tippecanoe_command
+def test_can_convert_in_process_plain_local_file():
+    """Test that unfiltered local conversions take the in-process fast path."""
+    assert _can_convert_in_process("input.parquet", None, None, None, None)
+
+
+def test_can_convert_in_process_requires_subprocess():
+    """Test that filters, reprojection and remote inputs use the gpio pipeline."""
+    assert not _can_convert_in_process("input.parquet", "-122,37,-121,38", None, None, None)
+    assert not _can_convert_in_process("input.parquet", None, "x > 1", None, None)
+    assert not _can_convert_in_process("input.parquet", None, None, "name", None)
+    assert not _can_convert_in_process("input.parquet", None, None, None, "EPSG:3857")
+    assert not _can_convert_in_process("s3://bucket/input.parquet", None, None, None, None)
+    assert not _can_convert_in_process("-", None, None, None, None)
+
+
+@pytest.mark.parametrize("verbose", [False, True], ids=["quiet", "verbose"])
+def test_run_in_process_feeds_downstream_stdin(tmp_path, monkeypatch, verbose):
+    """Test the in-process path writes GeoJSON to the downstream command and reaps it."""
+    import geoparquet_io.core.geojson_stream as geojson_stream
+
+    def fake_stream(input_path, precision, verbose, profile, stream):
+        stream.write('{"type": "Feature"}\n')
+
+    monkeypatch.setattr(geojson_stream, "convert_to_geojson_stream", fake_stream)
+    received = tmp_path / "received.txt"
+    # Stands in for tippecanoe: consumes stdin and, like it, writes to stdout
+    consumer = [
+        sys.executable,
+        "-c",
+        f"import sys; open({str(received)!r}, 'w').write(sys.stdin.read()); print('done')",
+    ]
+
+    _run_in_process("input.parquet", consumer, precision=6, verbose=verbose, profile=None)
+
+    assert received.read_text() == '{"type": "Feature"}\n'
 
-    cmd = _build_tippecanoe_command(
-        output_path="output.pmtiles",
-        layer="test_layer",
-        min_zoom=0,
-        max_zoom=14,
-        verbose=True,
-    )
 
-    assert "-Z" in cmd
-    assert "0" in cmd
-    assert "-z" in cmd
-    assert "14" in cmd
-    assert "-zg" not in cmd  # No auto detection when explicit
-    assert "--progress-interval=1" in cmd  # Verbose mode
+def test_run_in_process_reports_downstream_failure(monkeypatch):
+    """Test a failing downstream command surfaces as RuntimeError."""
+    import geoparquet_io.core.geojson_stream as geojson_stream
+
+    monkeypatch.setattr(geojson_stream, "convert_to_geojson_stream", lambda *args, **kwargs: None)
+    consumer = [sys.executable, "-c", "raise SystemExit(2)"]
+
+    with pytest.raises(RuntimeError, match="exit code 2"):
+        _run_in_process("input.parquet", consumer, precision=6, verbose=False, profile=None)
 
 
 # Path validation tests
@@ -230,8 +301,6 @@ def test_build_tippecanoe_command_with_zoom():
 
 def test_validate_path_valid():
     """Test path validation with valid paths."""
-    from gpio_pmtiles.core import _validate_path
-
     # Should not raise for normal paths
     _validate_path("/path/to/file.parquet")
     _validate_path("relative/path.parquet")
@@ -243,8 +312,6 @@ def test_validate_path_valid():
 
 def test_validate_path_shell_injection():
     """Test that path validation rejects shell metacharacters."""
-    from gpio_pmtiles.core import _validate_path
-
     dangerous_paths = [
         "file.parquet; rm -rf /",
         "file.parquet | cat",
@@ -262,8 +329,6 @@ def test_validate_path_shell_injection():
 
 def test_create_pmtiles_rejects_dangerous_input_path():
     """Test that create_pmtiles rejects input paths with shell metacharacters."""
-    from gpio_pmtiles.core import create_pmtiles_from_geoparquet
-
     with pytest.raises(ValueError, match="dangerous character"):
         create_pmtiles_from_geoparquet(
             input_path="input.parquet; rm -rf /",
@@ -273,8 +338,6 @@ def test_create_pmtiles_rejects_dangerous_input_path():
 
 def test_create_pmtiles_rejects_dangerous_output_path():
     """Test that create_pmtiles rejects output paths with shell metacharacters."""
-    from gpio_pmtiles.core import create_pmtiles_from_geoparquet
-
     with pytest.raises(ValueError, match="dangerous character"):
         create_pmtiles_from_geoparquet(
             input_path="input.parquet",
@@ -285,13 +348,11 @@ def test_create_pmtiles_rejects_dangerous_output_path():
 # Integration tests
 
 
-@pytest.mark.skipif(not has_gpio(), reason="gpio not installed")
-@pytest.mark.skipif(not has_tippecanoe(), reason="tippecanoe not installed")
+@pytest.mark.skipif(not HAS_GPIO, reason="gpio not installed")
+@pytest.mark.skipif(not HAS_TIPPECANOE, reason="tippecanoe not installed")
 @pytest.mark.slow
 def test_create_pmtiles_basic(tmp_path):
     """Test basic PMTiles creation from test data."""
-    from pathlib import Path
-
     # Find test data from main project
     test_data_dir = Path(__file__).parent.parent.parent.parent / "tests" / "data"
     if not test_data_dir.exists():
@@ -304,8 +365,6 @@ def test_create_pmtiles_basic(tmp_path):
     output_file = tmp_path / "output.pmtiles"
 
     # Import and run the function
-    from gpio_pmtiles.core import create_pmtiles_from_geoparquet
-
     create_pmtiles_from_geoparquet(
         input_path=str(input_file),
         output_path=str(output_file),
@@ -318,13 +377,11 @@ def test_create_pmtiles_basic(tmp_path):
     assert output_file.stat().st_size > 0
 
 
-@pytest.mark.skipif(not has_gpio(), reason="gpio not installed")
-@pytest.mark.skipif(not has_tippecanoe(), reason="tippecanoe not installed")
+@pytest.mark.skipif(not HAS_GPIO, reason="gpio not installed")
+@pytest.mark.skipif(not HAS_TIPPECANOE, reason="tippecanoe not installed")
 @pytest.mark.slow
 def test_create_pmtiles_with_filters(tmp_path):
     """Test PMTiles creation with filtering options."""
-    from pathlib import Path
-
     # Find test data
     test_data_dir = Path(__file__).parent.parent.parent.parent / "tests" / "data"
     if not test_data_dir.exists():
@@ -336,8 +393,6 @@ def test_create_pmtiles_with_filters(tmp_path):
 
     output_file = tmp_path / "filtered.pmtiles"
 
-    from gpio_pmtiles.core import create_pmtiles_from_geoparquet
-
     # Create with filters
     create_pmtiles_from_geoparquet(
         input_path=str(input_file),
@@ -353,13 +408,11 @@ def test_create_pmtiles_with_filters(tmp_path):
     assert output_file.stat().st_size > 0
 
 
-@pytest.mark.skipif(not has_gpio(), reason="gpio not installed")
-@pytest.mark.skipif(not has_tippecanoe(), reason="tippecanoe not installed")
+@pytest.mark.skipif(not HAS_GPIO, reason="gpio not installed")
+@pytest.mark.skipif(not HAS_TIPPECANOE, reason="tippecanoe not installed")
 @pytest.mark.slow
 def test_create_pmtiles_with_zoom_levels(tmp_path):
     """Test PMTiles creation with explicit zoom levels."""
-    from pathlib import Path
-
     # Find test data
     test_data_dir = Path(__file__).parent.parent.parent.parent / "tests" / "data"
     if not test_data_dir.exists():
@@ -371,8 +424,6 @@ def test_create_pmtiles_with_zoom_levels(tmp_path):
 
     output_file = tmp_path / "zoomed.pmtiles"
 
-    from gpio_pmtiles.core import create_pmtiles_from_geoparquet
-
     # Create with explicit zoom levels
     create_pmtiles_from_geoparquet(
         input_path=str(input_file),
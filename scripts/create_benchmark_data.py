@@ -6,13 +6,25 @@ This script creates standardized benchmark files at various sizes for
 performance testing. Files are saved locally and can be uploaded to source.coop.
 
 Usage:
-    python scripts/create_benchmark_data.py [--output-dir ./benchmark-data]
+    python scripts/create_benchmark_data.py [--output-dir ./benchmark-data] [--jobs 4] [--force]
+        [--hilbert [--row-group-size 100000]] [--pipe-to COMMAND]
+        [--upload [S3_URI]]
 """
 
 import argparse
+import io
+import shlex
+import shutil
+import signal
 import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 
+import pyarrow.parquet as pq
+
 # Source data URLs
 SOURCES = {
     "buildings": {
@@ -46,31 +58,233 @@ SIZES = {
     "xlarge": 10_000_000,
 }
 
+# Benchmark files to create: (source key, size key, output file name)
+PLAN = [
+    ("buildings", "tiny", "buildings_tiny.parquet"),
+    ("buildings", "small", "buildings_small.parquet"),
+    ("buildings", "medium", "buildings_medium.parquet"),
+    ("places", "tiny", "places_tiny.parquet"),
+    ("places", "small", "places_small.parquet"),
+    # Full Slovenia dataset (~800K); the 1M limit gets all rows
+    ("fields_medium", "large", "fields_large.parquet"),
+    # Japan fields subset to 10M
+    ("fields_large", "xlarge", "fields_xlarge.parquet"),
+]
+
+# Default upload location on source.coop
+DEFAULT_UPLOAD_URI = "s3://us-west-2.opendata.source.coop/cholmes/gpio-test/benchmark/"
+
+# AWS CLI s3 settings that speed up multi-GB uploads (config file only, no env vars)
+S3_TRANSFER_SETTINGS = {
+    "max_concurrent_requests": 20,
+    "multipart_chunksize": "16MB",
+}
+
+# Absolute gpio path: subprocess only takes its posix_spawn fast path (no
+# fork of this pyarrow-loaded process) for executables given with a directory
+GPIO = shutil.which("gpio") or "gpio"
+
+# Lines of gpio stderr kept for error reporting
+STDERR_TAIL_LINES = 200
+
+
+@dataclass
+class Artifact:
+    """A benchmark file with its size, and whether this run wrote it."""
+
+    path: Path
+    size_bytes: int
+    created: bool
+
+    @classmethod
+    def from_path(cls, path: Path, created: bool) -> "Artifact":
+        """Record a file together with its current size."""
+        return cls(path, path.stat().st_size, created)
+
+
+# Serializes progress output from concurrent extract workers
+_print_lock = threading.Lock()
+
+
+def _log(message: str) -> None:
+    """Print a line without interleaving output from other workers."""
+    with _print_lock:
+        print(message)
+
+
+def _spawn(cmd: list[str], **kwargs) -> subprocess.Popen:
+    """Start a process, letting subprocess use posix_spawn where it can.
+
+    close_fds=False is required for that path. It is safe here because the
+    pipes subprocess creates are non-inheritable, so concurrent workers do
+    not leak them into each other's children.
+    """
+    return subprocess.Popen(cmd, close_fds=False, **kwargs)
+
+
+def _tail_stderr(stream) -> tuple[deque, threading.Thread]:
+    """Drain a text stream on a background thread, keeping only its last lines.
 
-def run_gpio_extract(input_url: str, output_path: Path, limit: int) -> bool:
-    """Run gpio extract to create a subset."""
+    Memory stays bounded no matter how much the process writes. Join the
+    returned thread before reading the tail.
+    """
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    drain = threading.Thread(target=stderr_tail.extend, args=(stream,), daemon=True)
+    drain.start()
+    return stderr_tail, drain
+
+
+def _run_gpio(cmd: list[str], output_path: Path) -> bool:
+    """Run a gpio command, reporting failures against ``output_path``."""
+    _log(f"  Running: {' '.join(cmd)}")
+    try:
+        # Discard stdout and keep only the tail of stderr
+        proc = _spawn(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        stderr_tail, drain = _tail_stderr(proc.stderr)
+        try:
+            returncode = proc.wait(timeout=600)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            _log(f"  Error ({output_path.name}): Command timed out")
+            return False
+        finally:
+            drain.join()
+            proc.stderr.close()
+
+        if returncode != 0:
+            _log(f"  Error ({output_path.name}): {''.join(stderr_tail)}")
+            return False
+        return True
+    except Exception as e:
+        _log(f"  Error ({output_path.name}): {e}")
+        return False
+
+
+def run_gpio_extract(input_url: str, output_path: Path, limit: int) -> tuple[Path, bool]:
+    """Run gpio extract to create a subset.
+
+    Returns:
+        Tuple of (output_path, success) so results can be matched up when
+        extracts run concurrently.
+    """
     cmd = [
-        "gpio",
+        GPIO,
         "extract",
         input_url,
         str(output_path),
         "--limit",
         str(limit),
     ]
+    return output_path, _run_gpio(cmd, output_path)
 
-    print(f"  Running: {' '.join(cmd)}")
+
+def run_gpio_extract_stream(input_url: str, limit: int) -> subprocess.Popen:
+    """Start gpio extract writing the subset to stdout as an Arrow IPC stream.
+
+    The caller owns the returned process and its ``stdout`` and ``stderr``
+    pipes. Both are binary, since stdout carries Arrow IPC.
+    """
+    cmd = [GPIO, "extract", input_url, "-", "--limit", str(limit)]
+    _log(f"  Running: {' '.join(cmd)} |")
+    return _spawn(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def pipe_gpio_extract(input_url: str, limit: int, consumer_cmd: list[str]) -> bool:
+    """Stream a subset straight into ``consumer_cmd`` without an intermediate file.
+
+    The consumer reads the Arrow IPC stream on stdin (e.g. any gpio command
+    given ``-`` as its input).
+    """
+    extract_proc = run_gpio_extract_stream(input_url, limit)
+    extract_stderr = io.TextIOWrapper(extract_proc.stderr, errors="replace")
+    stderr_tail, drain = _tail_stderr(extract_stderr)
+    _log(f"    | {' '.join(consumer_cmd)}")
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-        if result.returncode != 0:
-            print(f"  Error: {result.stderr}")
-            return False
-        return True
-    except subprocess.TimeoutExpired:
-        print("  Error: Command timed out")
-        return False
+        consumer_proc = subprocess.Popen(consumer_cmd, stdin=extract_proc.stdout)
     except Exception as e:
-        print(f"  Error: {e}")
+        extract_proc.kill()
+        extract_proc.wait()
+        drain.join()
+        extract_stderr.close()
+        _log(f"  Error: {e}")
         return False
+    finally:
+        # Drop the parent's copy so extract gets SIGPIPE if the consumer exits
+        extract_proc.stdout.close()
+
+    consumer_rc = consumer_proc.wait()
+    extract_rc = extract_proc.wait()
+    drain.join()
+    extract_stderr.close()
+    if consumer_rc == 0 and extract_rc == -getattr(signal, "SIGPIPE", 0):
+        # Consumer finished without reading everything; not an extract failure
+        extract_rc = 0
+    if extract_rc != 0:
+        _log(f"  Error: gpio extract failed with exit code {extract_rc}: {''.join(stderr_tail)}")
+    if consumer_rc != 0:
+        _log(f"  Error: {consumer_cmd[0]} failed with exit code {consumer_rc}")
+    return extract_rc == 0 and consumer_rc == 0
+
+
+def hilbert_output_path(output_path: Path) -> Path:
+    """Path of the Hilbert-sorted variant of a benchmark file."""
+    return output_path.with_name(f"{output_path.stem}_hilbert.parquet")
+
+
+def run_gpio_hilbert_sort(input_path: Path, row_group_size: int) -> tuple[Path, bool]:
+    """Write a Hilbert-sorted copy of a subset with fixed-size row groups.
+
+    Spatially ordered row groups give streaming and partitioned readers
+    natural chunk boundaries to work through instead of whole-file reads.
+
+    Returns:
+        Tuple of (sorted_path, success)
+    """
+    sorted_path = hilbert_output_path(input_path)
+    cmd = [
+        GPIO,
+        "sort",
+        "hilbert",
+        str(input_path),
+        str(sorted_path),
+        "--row-group-size",
+        str(row_group_size),
+        "--compression",
+        "zstd",
+        "--compression-level",
+        "3",
+        "--overwrite",
+    ]
+    return sorted_path, _run_gpio(cmd, sorted_path)
+
+
+def _build_item(
+    input_url: str,
+    output_path: Path,
+    limit: int,
+    extract: bool,
+    row_group_size: int | None,
+) -> list[Artifact]:
+    """Extract one subset and, if requested, its Hilbert-sorted variant.
+
+    Returns:
+        Files that exist for this item after the run
+    """
+    if extract and not run_gpio_extract(input_url, output_path, limit)[1]:
+        return []
+    artifacts = [Artifact.from_path(output_path, created=extract)]
+
+    if row_group_size is None:
+        return artifacts
+    sorted_path = hilbert_output_path(output_path)
+    sort = extract or not sorted_path.exists()
+    if sort:
+        sorted_path, ok = run_gpio_hilbert_sort(output_path, row_group_size)
+        if not ok:
+            return artifacts
+    artifacts.append(Artifact.from_path(sorted_path, created=sort))
+    return artifacts
 
 
 def inspect_file(path: Path) -> dict:
@@ -83,77 +297,153 @@ def inspect_file(path: Path) -> dict:
         return {"success": False, "error": str(e)}
 
 
-def create_benchmark_files(output_dir: Path):
-    """Create all benchmark files."""
+def _cheap_rowcount(path: Path) -> int | None:
+    """Row count from the Parquet footer only, or None if unreadable."""
+    try:
+        return pq.read_metadata(path).num_rows
+    except Exception:
+        return None
+
+
+def _is_already_extracted(output_path: Path, limit: int, total_rows: int) -> bool:
+    """Check whether a previous run already produced this subset."""
+    if not output_path.exists():
+        return False
+    rows = _cheap_rowcount(output_path)
+    return rows is not None and rows >= min(limit, total_rows)
+
+
+def pipe_benchmark_subsets(work_items: list, pipe_to: str, jobs: int) -> None:
+    """Feed every subset to a consumer command instead of writing files.
+
+    ``{name}`` in ``pipe_to`` is replaced by each subset's file stem.
+    """
+    print(f"\n=== Piping {len(work_items)} benchmark subsets ({jobs} concurrent jobs) ===")
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                pipe_gpio_extract,
+                source["url"],
+                limit,
+                [arg.replace("{name}", output_path.stem) for arg in shlex.split(pipe_to)],
+            ): output_path.stem
+            for source, output_path, limit in work_items
+        }
+        for future in as_completed(futures):
+            status = "Piped" if future.result() else "Failed"
+            _log(f"  {status}: {futures[future]}")
+
+
+def _upload_command(output_dir: Path, upload_uri: str) -> list[str]:
+    """aws s3 sync command that uploads only new or changed files."""
+    return ["aws", "s3", "sync", "--no-progress", str(output_dir), upload_uri]
+
+
+def upload_benchmark_files(output_dir: Path, upload_uri: str) -> bool:
+    """Upload the output directory with the AWS CLI."""
+    cmd = _upload_command(output_dir, upload_uri)
+    print(f"  Running: {' '.join(cmd)}")
+    try:
+        return subprocess.run(cmd).returncode == 0
+    except FileNotFoundError:
+        print("  Error: aws CLI not found in PATH")
+        return False
+
+
+def create_benchmark_files(
+    output_dir: Path,
+    jobs: int = 4,
+    force: bool = False,
+    hilbert_row_group_size: int | None = None,
+    pipe_to: str | None = None,
+    upload_uri: str | None = None,
+):
+    """Create all benchmark files.
+
+    Extracts are network-bound, so they run concurrently on ``jobs`` threads.
+    Outputs left by an earlier run with the expected row count are reused
+    unless ``force`` is set. When ``hilbert_row_group_size`` is given, each
+    subset also gets a Hilbert-sorted ``*_hilbert.parquet`` variant written
+    with that many rows per row group. With ``pipe_to``, subsets are streamed
+    into that command instead of being saved. With ``upload_uri``, the
+    output directory is synced there once all files are written.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    created_files = []
-
-    # Buildings - tiny, small, medium
-    print("\n=== Creating building benchmark files ===")
-    buildings_url = SOURCES["buildings"]["url"]
-
-    for size_name in ["tiny", "small", "medium"]:
-        limit = SIZES[size_name]
-        output_path = output_dir / f"buildings_{size_name}.parquet"
-        print(f"\nCreating {output_path.name} ({limit:,} rows)...")
-
-        if run_gpio_extract(buildings_url, output_path, limit):
-            created_files.append(output_path)
-            print(f"  Created: {output_path}")
-
-    # Places (points) - tiny, small
-    print("\n=== Creating places benchmark files (points) ===")
-    places_url = SOURCES["places"]["url"]
-
-    for size_name in ["tiny", "small"]:
-        limit = SIZES[size_name]
-        output_path = output_dir / f"places_{size_name}.parquet"
-        print(f"\nCreating {output_path.name} ({limit:,} rows)...")
-
-        if run_gpio_extract(places_url, output_path, limit):
-            created_files.append(output_path)
-            print(f"  Created: {output_path}")
-
-    # Slovenia fields - for large
-    print("\n=== Creating field boundary benchmark files ===")
-    slovenia_url = SOURCES["fields_medium"]["url"]
-
-    # Full Slovenia dataset (~800K) as "large"
-    output_path = output_dir / "fields_large.parquet"
-    print(f"\nCreating {output_path.name} (full Slovenia, ~800K rows)...")
-    if run_gpio_extract(slovenia_url, output_path, 1_000_000):  # Will get all ~800K
-        created_files.append(output_path)
-        print(f"  Created: {output_path}")
-
-    # Japan fields - for xlarge (subset to 10M)
-    japan_url = SOURCES["fields_large"]["url"]
-    output_path = output_dir / "fields_xlarge.parquet"
-    print(f"\nCreating {output_path.name} (10M rows from Japan)...")
-    if run_gpio_extract(japan_url, output_path, 10_000_000):
-        created_files.append(output_path)
-        print(f"  Created: {output_path}")
+    # (source, output_path, limit) with lookups bound once per plan entry
+    work_items = [
+        (SOURCES[source_key], output_dir / output_name, SIZES[size_key])
+        for source_key, size_key, output_name in PLAN
+    ]
+
+    if pipe_to:
+        pipe_benchmark_subsets(work_items, pipe_to, jobs)
+        return
+
+    needs_extract = {}
+    for source, output_path, limit in work_items:
+        needs_extract[output_path] = force or not _is_already_extracted(
+            output_path, limit, source["total_rows"]
+        )
+        if not needs_extract[output_path]:
+            print(f"  Skipping {output_path.name} (already extracted, use --force to redo)")
+
+    pending = [item for item in work_items if needs_extract[item[1]]]
+    print(f"\n=== Creating {len(pending)} benchmark files ({jobs} concurrent jobs) ===")
+    for source, output_path, limit in pending:
+        print(f"  Queued {output_path.name} (up to {limit:,} rows of {source['description']})")
+
+    # One slot per plan entry so the summary keeps plan order
+    results: list[list[Artifact]] = [[] for _ in work_items]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                _build_item,
+                source["url"],
+                output_path,
+                limit,
+                needs_extract[output_path],
+                hilbert_row_group_size,
+            ): index
+            for index, (source, output_path, limit) in enumerate(work_items)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            for artifact in results[futures[future]]:
+                # Reused extracts were reported as skipped above; the summary lists all files
+                if artifact.created:
+                    _log(f"  Created: {artifact.path}")
+
+    artifacts = [artifact for item_artifacts in results for artifact in item_artifacts]
 
     # Summary
     print("\n=== Summary ===")
-    print(f"Created {len(created_files)} benchmark files in {output_dir}:\n")
+    print(f"{len(artifacts)} benchmark files in {output_dir}:\n")
 
     total_size = 0
-    for f in created_files:
-        if f.exists():
-            size_mb = f.stat().st_size / (1024 * 1024)
-            total_size += size_mb
-            print(f"  {f.name}: {size_mb:.2f} MB")
+    for artifact in artifacts:
+        size_mb = artifact.size_bytes / (1024 * 1024)
+        total_size += size_mb
+        print(f"  {artifact.path.name}: {size_mb:.2f} MB")
 
     print(f"\nTotal size: {total_size:.2f} MB")
 
+    if upload_uri:
+        print(f"\n=== Uploading to {upload_uri} ===")
+        if upload_benchmark_files(output_dir, upload_uri):
+            print("Upload complete")
+        else:
+            print("Upload failed")
+        return
+
     # Print upload command
     print("\n=== To upload to source.coop ===")
     print("First, get credentials from https://source.coop/cholmes/gpio-test")
-    print("Then run:")
-    print(
-        f"  aws s3 sync {output_dir} s3://us-west-2.opendata.source.coop/cholmes/gpio-test/benchmark/"
-    )
+    print("Optionally raise the AWS CLI transfer concurrency for large files:")
+    for setting, value in S3_TRANSFER_SETTINGS.items():
+        print(f"  aws configure set default.s3.{setting} {value}")
+    print("Then run (or re-run this script with --upload):")
+    print(f"  {' '.join(_upload_command(output_dir, DEFAULT_UPLOAD_URI))}")
 
 
 def main():
@@ -164,12 +454,70 @@ def main():
         default=Path("./benchmark-data"),
         help="Output directory for benchmark files",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Number of extracts to run concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-extract files even if they already exist with the expected row count",
+    )
+    parser.add_argument(
+        "--hilbert",
+        action="store_true",
+        help="Also write a Hilbert-sorted *_hilbert.parquet variant of each file",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=100_000,
+        help="Rows per row group for --hilbert variants (default: 100000)",
+    )
+    parser.add_argument(
+        "--pipe-to",
+        metavar="COMMAND",
+        help=(
+            "Stream each subset as Arrow IPC into COMMAND instead of writing files; "
+            "'{name}' is replaced by the subset name. "
+            "Example: --pipe-to 'gpio convert geojson - {name}.geojson'"
+        ),
+    )
+    parser.add_argument(
+        "--upload",
+        metavar="S3_URI",
+        nargs="?",
+        const=DEFAULT_UPLOAD_URI,
+        help=f"Sync the output directory to S3_URI when done (default: {DEFAULT_UPLOAD_URI})",
+    )
     args = parser.parse_args()
+    if args.pipe_to:
+        # Nothing is written locally in pipe mode, so these would be silently ignored
+        conflicting = [
+            flag
+            for flag, value in (
+                ("--force", args.force),
+                ("--hilbert", args.hilbert),
+                ("--upload", args.upload),
+            )
+            if value
+        ]
+        if conflicting:
+            parser.error(f"--pipe-to can't be combined with {', '.join(conflicting)}")
 
     print("Creating benchmark data files...")
     print(f"Output directory: {args.output_dir}")
 
-    create_benchmark_files(args.output_dir)
+    create_benchmark_files(
+        args.output_dir,
+        jobs=args.jobs,
+        force=args.force,
+        hilbert_row_group_size=args.row_group_size if args.hilbert else None,
+        pipe_to=args.pipe_to,
+        upload_uri=args.upload,
+    )
 
 
 if __name__ == "__main__":
@@ -13,19 +13,38 @@ Usage:
 
 import argparse
 import gc
+import hashlib
+import io
 import json
+import logging
+import math
 import os
+import queue
+import secrets
+import selectors
+import shutil
+import statistics
 import subprocess
+import sys
 import tempfile
+import threading
 import time
-import urllib.request
+import traceback
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
+
+import httpx
 
 # Import base URL and benchmark files from config to avoid duplication
 from geoparquet_io.benchmarks.config import BENCHMARK_DATA_URL, BENCHMARK_FILES
 
+logger = logging.getLogger("version_benchmark")
+
 # Test files from source.coop (ordered by size)
 # Built from BENCHMARK_FILES plus additional test files
 TEST_FILES = {
@@ -62,6 +81,45 @@ FILE_PRESETS = {
 # Local cache directory
 CACHE_DIR = Path("/tmp/gpio-benchmark-cache")
 
+# Content-addressed cache layout:
+#   sha256/<ab>/<digest>         file contents, one copy per distinct file
+#   files/<digest[:16]>/<name>   hardlink under the original filename
+#   index.json                   URL -> {etag, size, sha256}
+CACHE_INDEX = CACHE_DIR / "index.json"
+_cache_index_lock = threading.Lock()
+
+# Concurrent downloads when populating the cache, and the streaming chunk size
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Files at least this large are fetched as several concurrent byte ranges
+RANGED_DOWNLOAD_MIN = 64 * 1024 * 1024
+RANGE_SEGMENTS = 4
+
+# Only the end of a failing command's stderr is kept in the results
+STDERR_TAIL_BYTES = 8192
+
+# compare_results flags a delta as significant below this p-value, and
+# --fail-on-regression fails on significant slowdowns larger than the threshold
+SIGNIFICANCE_LEVEL = 0.05
+REGRESSION_THRESHOLD = 0.10
+
+# Hardware and software counters collected by --profile
+PERF_EVENTS = [
+    "task-clock",
+    "cycles",
+    "instructions",
+    "cache-misses",
+    "page-faults",
+    "context-switches",
+]
+
+# Trial outputs go to tmpfs when it has room, so timings don't include disk write-back
+BENCH_TMPFS = Path("/dev/shm")
+TMPFS_MIN_FREE = 2 * 1024**3
+
+# Finished trial directories are deleted in batches of this size
+PRUNE_EVERY = 100
+
 # Operations to benchmark (CLI commands)
 # All available operations
 ALL_OPERATIONS = {
@@ -195,6 +253,10 @@ CHAIN_OPERATIONS = {
     },
 }
 
+# Every operation by name, and the set of valid names (for --ops validation)
+OPERATIONS_BY_NAME = {**ALL_OPERATIONS, **IMPORT_OPERATIONS, **CHAIN_OPERATIONS}
+ALL_OP_NAMES = frozenset(OPERATIONS_BY_NAME)
+
 # Operation presets
 OPERATION_PRESETS = {
     "quick": ["inspect", "extract-limit", "add-bbox"],
@@ -238,107 +300,593 @@ OPERATIONS = [{"name": name, **ALL_OPERATIONS[name]} for name in OPERATION_PRESE
 TRUSTED_DOMAINS = {"data.source.coop", "source.coop"}
 
 
-def _validate_url(url: str) -> None:
-    """Validate URL is from a trusted domain."""
+def _parse_and_validate(url: str) -> tuple[ParseResult, str]:
+    """Parse a URL once, check it is from a trusted domain, and extract its filename.
+
+    Callers fetch ``parsed.geturl()``, so the URL that was validated is the
+    one that gets requested.
+
+    Returns:
+        Tuple of (parsed URL, filename)
+    """
     parsed = urlparse(url)
     if parsed.netloc not in TRUSTED_DOMAINS:
         raise ValueError(f"URL domain '{parsed.netloc}' not in trusted domains: {TRUSTED_DOMAINS}")
+    # Use basename to extract just the filename, preventing path traversal
+    # e.g., "../../../etc/passwd" becomes "passwd"
+    filename = os.path.basename(parsed.path)
+    if not filename:
+        raise ValueError(f"Could not extract filename from URL: {url}")
+    return parsed, filename
+
+
+def _make_client() -> httpx.Client:
+    """HTTP client shared by all downloads so connections and TLS sessions are reused."""
+    return httpx.Client(
+        timeout=60.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=DOWNLOAD_WORKERS * RANGE_SEGMENTS),
+    )
 
 
-def download_file(url: str, dest: Path) -> bool:
+def download_file(
+    url: str,
+    dest: Path,
+    client: httpx.Client | None = None,
+    head: httpx.Response | None = None,
+) -> bool:
     """Download a file from URL to destination.
 
-    Only downloads from trusted domains (source.coop).
+    Only downloads from trusted domains (source.coop). The body is streamed
+    into ``<dest>.part`` and renamed into place once complete; if a partial
+    file from an interrupted run is still valid for the same ETag, the
+    download resumes from where it stopped with a ``Range`` request.
     """
     try:
-        _validate_url(url)
-        # Use basename to get just the filename, preventing path traversal
-        filename = os.path.basename(urlparse(url).path)
-        print(f"  Downloading {filename}...", end=" ", flush=True)
-        urllib.request.urlretrieve(url, dest)
-        size_mb = dest.stat().st_size / (1024 * 1024)
-        print(f"done ({size_mb:.2f} MB)")
+        parsed, filename = _parse_and_validate(url)
+        if client is None:
+            with _make_client() as own_client:
+                _download(own_client, parsed, filename, dest, head)
+        else:
+            _download(client, parsed, filename, dest, head)
         return True
     except ValueError as e:
-        print(f"validation error: {e}")
+        logger.error("  Validation error: %s", e)
         return False
     except Exception as e:
-        print(f"failed: {e}")
+        logger.error("  Failed to download %s: %s", url, e)
         return False
 
 
-def get_cached_file(url: str) -> Path:
-    """Get local cached path for a URL, downloading if needed.
+def _download(
+    client: httpx.Client,
+    parsed: ParseResult,
+    filename: str,
+    dest: Path,
+    head: httpx.Response | None = None,
+) -> None:
+    """Download an already validated URL to dest and log its size."""
+    _download_to(client, parsed.geturl(), dest, head)
+    size_mb = dest.stat().st_size / (1024 * 1024)
+    logger.info("  Downloaded %s (%.2f MB)", filename, size_mb)
+
+
+def _download_to(
+    client: httpx.Client, url: str, dest: Path, head: httpx.Response | None = None
+) -> None:
+    """Stream url into dest via a resumable ``.part`` file.
+
+    ``head`` is the response to a HEAD request for url, if the caller already made one.
+    """
+    part = dest.with_name(dest.name + ".part")
+    etag_file = dest.with_name(dest.name + ".part.etag")
+
+    if head is None:
+        head = client.head(url)
+        head.raise_for_status()
+    etag = head.headers.get("etag")
+    total = int(head.headers.get("content-length", -1))
+
+    have = part.stat().st_size if part.exists() else 0
+    can_resume = (
+        have > 0
+        and etag is not None
+        and etag_file.exists()
+        and etag_file.read_text() == etag
+        and (total < 0 or have < total)
+    )
+    if (
+        not can_resume
+        and total >= RANGED_DOWNLOAD_MIN
+        and head.headers.get("accept-ranges") == "bytes"
+    ):
+        # No resume bookkeeping: a torn ranged download starts over
+        etag_file.unlink(missing_ok=True)
+        _download_ranges(client, url, part, total, etag)
+        os.replace(part, dest)
+        return
+
+    headers = {"Range": f"bytes={have}-", "If-Range": etag} if can_resume else {}
+    if etag is not None:
+        etag_file.write_text(etag)
+
+    with client.stream("GET", url, headers=headers) as response:
+        response.raise_for_status()
+        # A 200 means the server ignored the range (or the ETag changed): start over
+        mode = "ab" if response.status_code == 206 else "wb"
+        with open(part, mode) as f:
+            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+    if total >= 0 and part.stat().st_size != total:
+        raise RuntimeError(f"incomplete download ({part.stat().st_size} of {total} bytes)")
+    os.replace(part, dest)
+    etag_file.unlink(missing_ok=True)
+
+
+def _download_ranges(
+    client: httpx.Client, url: str, part: Path, total: int, etag: str | None
+) -> None:
+    """Fetch url into part as RANGE_SEGMENTS byte ranges downloaded concurrently."""
+    step = -(-total // RANGE_SEGMENTS)
+    bounds = [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+    with open(part, "wb") as f:
+        f.truncate(total)
+
+    def fetch(start: int, end: int) -> None:
+        headers = {"Range": f"bytes={start}-{end}"}
+        if etag is not None:
+            headers["If-Range"] = etag
+        with client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise RuntimeError("server ignored the range request or the file changed")
+            with open(part, "r+b") as f:
+                f.seek(start)
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                written = f.tell() - start
+        if written != end - start + 1:
+            raise RuntimeError(f"incomplete range {start}-{end} ({written} bytes)")
+
+    with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+        for future in [pool.submit(fetch, start, end) for start, end in bounds]:
+            future.result()
+
+
+def _blob_path(digest: str) -> Path:
+    """Content-addressed location of a cached file."""
+    return CACHE_DIR / "sha256" / digest[:2] / digest
+
+
+def _link_named(filename: str, digest: str) -> Path:
+    """Hardlink a cached blob under its original filename and return that path.
+
+    gpio picks readers by file extension, so benchmarks need the named path.
+    The digest prefix in the directory keeps same-named files from different
+    URLs apart.
+    """
+    named = CACHE_DIR / "files" / digest[:16] / filename
+    if not named.exists():
+        named.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(_blob_path(digest), named)
+        except FileExistsError:
+            pass
+        except OSError:
+            # Filesystem without hardlinks
+            shutil.copyfile(_blob_path(digest), named)
+    return named
+
+
+def _sha256(path: Path) -> str:
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _load_cache_index() -> dict[str, dict]:
+    try:
+        return json.loads(CACHE_INDEX.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache_index(index: dict[str, dict]) -> None:
+    tmp = CACHE_INDEX.with_name(CACHE_INDEX.name + ".tmp")
+    tmp.write_text(json.dumps(index, indent=2, sort_keys=True))
+    os.replace(tmp, CACHE_INDEX)
+
+
+def _is_current(entry: dict, head: httpx.Response) -> bool:
+    """Whether a cache index entry still matches the remote file."""
+    etag = head.headers.get("etag")
+    if etag is not None and entry.get("etag") is not None:
+        return etag == entry["etag"]
+    size = int(head.headers.get("content-length", -1))
+    return size >= 0 and size == entry.get("size")
+
+
+def _fetch(client: httpx.Client, url: str, index: dict[str, dict]) -> Path:
+    """Return the cached path for url, downloading only if the remote file changed."""
+    parsed, filename = _parse_and_validate(url)
+    entry = index.get(url)
+    cached = entry is not None and _blob_path(entry["sha256"]).exists()
+
+    try:
+        head = client.head(parsed.geturl())
+        head.raise_for_status()
+    except httpx.HTTPError:
+        if cached:
+            # Offline or server trouble: use what we already have
+            return _link_named(filename, entry["sha256"])
+        raise
+
+    if cached and _is_current(entry, head):
+        return _link_named(filename, entry["sha256"])
+
+    # Staging path is stable per URL so an interrupted download can resume
+    url_key = hashlib.sha256(url.encode()).hexdigest()[:16]
+    staging = CACHE_DIR / "downloads" / url_key / filename
+    staging.parent.mkdir(parents=True, exist_ok=True)
+    _download(client, parsed, filename, staging, head)
+
+    digest = _sha256(staging)
+    blob = _blob_path(digest)
+    blob.parent.mkdir(parents=True, exist_ok=True)
+    if blob.exists():
+        staging.unlink()
+    else:
+        os.replace(staging, blob)
+
+    with _cache_index_lock:
+        index[url] = {
+            "etag": head.headers.get("etag"),
+            "size": blob.stat().st_size,
+            "sha256": digest,
+        }
+    return _link_named(filename, digest)
 
-    Uses os.path.basename to prevent path traversal attacks.
+
+def _fetch_all(urls: list[str]) -> Iterator[tuple[str, Path]]:
+    """Cache every URL, fetching several at a time.
+
+    Yields (url, local path) as each file becomes available, so callers can
+    start using early files while later ones are still downloading.
+
+    Raises:
+        RuntimeError: After yielding everything else, if any URL failed.
     """
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    index = _load_cache_index()
+    failed = []
 
-    # Use basename to extract just the filename, preventing path traversal
-    # e.g., "../../../etc/passwd" becomes "passwd"
-    filename = os.path.basename(urlparse(url).path)
-    if not filename:
-        raise ValueError(f"Could not extract filename from URL: {url}")
-    cached_path = CACHE_DIR / filename
+    try:
+        with _make_client() as client, ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+            futures = {pool.submit(_fetch, client, url, index): url for url in dict.fromkeys(urls)}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    path = future.result()
+                except Exception as e:
+                    logger.error("  Failed to cache %s: %s", url, e)
+                    failed.append(url)
+                    continue
+                yield url, path
+    finally:
+        _save_cache_index(index)
 
-    # Download if not cached
-    if not cached_path.exists():
-        if not download_file(url, cached_path):
-            raise RuntimeError(f"Failed to download {url}")
+    if failed:
+        raise RuntimeError(f"Failed to download {', '.join(failed)}")
 
-    return cached_path
 
+def get_cached_file(url: str) -> Path:
+    """Get local cached path for a URL, downloading if needed."""
+    return dict(_fetch_all([url]))[url]
 
-def ensure_files_cached(
+
+def iter_cached_files(
     file_sizes: list[str] | None = None, include_source_formats: bool = False
-) -> tuple[dict[str, Path], dict[str, dict[str, Path]]]:
-    """Download test files to local cache.
+) -> Iterator[tuple[str, Path, dict[str, Path]]]:
+    """Download test files to local cache, yielding each size as soon as it is ready.
 
     Args:
         file_sizes: List of file sizes to cache. If None, caches all files.
         include_source_formats: Whether to also cache source format files for imports.
 
-    Returns:
-        Tuple of (parquet_files, source_format_files)
+    Yields:
+        Tuples of (size_name, parquet_path, {source_format: path}), in the
+        order the sizes finish downloading.
     """
-    print("\nEnsuring test files are cached locally...")
-    local_files = {}
+    logger.info("Ensuring test files are cached locally...")
     sizes_to_cache = file_sizes if file_sizes else list(TEST_FILES.keys())
+
+    # URLs each size needs: its parquet file plus any source format files
+    needed: dict[str, dict[str | None, str]] = {}
     for size_name in sizes_to_cache:
         if size_name in TEST_FILES:
-            local_files[size_name] = get_cached_file(TEST_FILES[size_name])
-
-    # Cache source format files for import operations
-    source_files: dict[str, dict[str, Path]] = {}
+            needed[size_name] = {None: TEST_FILES[size_name]}
     if include_source_formats:
-        print("  Caching source format files for import tests...")
+        logger.info("  Including source format files for import tests...")
         for fmt, sizes in SOURCE_FORMAT_FILES.items():
-            source_files[fmt] = {}
-            for size_name in sizes_to_cache:
+            for size_name in needed:
                 if size_name in sizes:
-                    source_files[fmt][size_name] = get_cached_file(sizes[size_name])
+                    needed[size_name][fmt] = sizes[size_name]
 
-    print()
+    paths: dict[str, Path] = {}
+    all_urls = [url for urls in needed.values() for url in urls.values()]
+    for url, path in _fetch_all(all_urls):
+        paths[url] = path
+        for size_name in [name for name, urls in needed.items() if url in urls.values()]:
+            if all(u in paths for u in needed[size_name].values()):
+                urls = needed.pop(size_name)
+                sources = {fmt: paths[u] for fmt, u in urls.items() if fmt is not None}
+                yield size_name, paths[urls[None]], sources
+    logger.info("  %d files ready in %s", len(paths), CACHE_DIR)
+
+
+def ensure_files_cached(
+    file_sizes: list[str] | None = None, include_source_formats: bool = False
+) -> tuple[dict[str, Path], dict[str, dict[str, Path]]]:
+    """Download test files to local cache.
+
+    Args:
+        file_sizes: List of file sizes to cache. If None, caches all files.
+        include_source_formats: Whether to also cache source format files for imports.
+
+    Returns:
+        Tuple of (parquet_files, source_format_files)
+    """
+    local_files: dict[str, Path] = {}
+    source_files: dict[str, dict[str, Path]] = {}
+    for size_name, path, sources in iter_cached_files(file_sizes, include_source_formats):
+        local_files[size_name] = path
+        for fmt, source_path in sources.items():
+            source_files.setdefault(fmt, {})[size_name] = source_path
     return local_files, source_files
 
 
-def _substitute_cmd(cmd: list[str], substitutions: dict[str, str]) -> list[str]:
-    """Substitute placeholders in command."""
-    final_cmd = []
-    for arg in cmd:
-        if arg.startswith("{") and arg.endswith("}"):
-            key = arg[1:-1]
-            if key in substitutions:
-                final_cmd.append(substitutions[key])
-            else:
-                final_cmd.append(arg)
-        else:
-            final_cmd.append(arg)
-    return final_cmd
+# A command template with each argument split into (literal, placeholder key or None)
+CompiledCmd = list[tuple[str, str | None]]
+
+
+def _compile_cmd(cmd: list[str]) -> CompiledCmd:
+    """Parse the ``{key}`` placeholders in a command template once."""
+    return [(arg, arg[1:-1] if arg.startswith("{") and arg.endswith("}") else None) for arg in cmd]
+
+
+def _apply(compiled: CompiledCmd, substitutions: dict[str, str]) -> list[str]:
+    """Fill in a compiled command. Placeholders without a substitution are kept as-is."""
+    return [substitutions.get(key, arg) if key else arg for arg, key in compiled]
+
+
+# Compile every operation's command template once, so trials only do dict lookups
+for _op in (*ALL_OPERATIONS.values(), *IMPORT_OPERATIONS.values()):
+    _op["_compiled"] = _compile_cmd(_op["cmd"])
+for _op in CHAIN_OPERATIONS.values():
+    _op["_compiled"] = [_compile_cmd(step) for step in _op["steps"]]
+
+
+def _stderr_tail(stderr: bytes) -> str:
+    """Decode the last STDERR_TAIL_BYTES of a failed command's stderr."""
+    return stderr[-STDERR_TAIL_BYTES:].decode("utf-8", errors="replace")
+
+
+# (user CPU seconds, system CPU seconds, peak RSS in KB, page faults) of one child
+Usage = tuple[float, float, int, int]
+
+
+def _usage_from_rusage(rusage) -> Usage:
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    max_rss = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    return rusage.ru_utime, rusage.ru_stime, max_rss, rusage.ru_minflt + rusage.ru_majflt
+
+
+def _combine_usage(total: Usage | None, usage: Usage | None) -> Usage | None:
+    """Add up CPU time and page faults of sequential children; keep the larger peak RSS."""
+    if total is None or usage is None:
+        return usage if total is None else total
+    return (
+        total[0] + usage[0],
+        total[1] + usage[1],
+        max(total[2], usage[2]),
+        total[3] + usage[3],
+    )
+
+
+def _self_usage() -> Usage | None:
+    """Resource usage of this process so far, or None without the resource module."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return _usage_from_rusage(resource.getrusage(resource.RUSAGE_SELF))
+
+
+def _run_in_process(cmd: list[str], timeout: float) -> tuple[int, bytes, Usage | None]:
+    """Run a gpio command through its Click entry point inside this interpreter.
+
+    Same contract as _run_child, minus the timeout, which can't be enforced
+    in-process. stdout is discarded and stderr captured. Usage is this
+    process's CPU time and page faults over the call, with its overall peak RSS.
+    """
+    import click
+
+    from geoparquet_io.cli.main import cli
+
+    if cmd[0] != "gpio":
+        raise ValueError(f"--in-process can only run gpio commands, not {cmd[0]!r}")
+
+    stderr = io.StringIO()
+    before = _self_usage()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull), redirect_stderr(stderr):
+        try:
+            result = cli.main(args=cmd[1:], prog_name="gpio", standalone_mode=False)
+            returncode = result if isinstance(result, int) else 0
+        except click.ClickException as e:
+            e.show()
+            returncode = e.exit_code
+        except click.Abort:
+            returncode = 1
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    after = _self_usage()
+
+    usage = None
+    if before is not None and after is not None:
+        usage = (after[0] - before[0], after[1] - before[1], after[2], after[3] - before[3])
+    return returncode, stderr.getvalue().encode()[-STDERR_TAIL_BYTES:], usage
+
+
+def _run_child(cmd: list[str], timeout: float) -> tuple[int, bytes, Usage | None]:
+    """Run cmd with stdout discarded and return (returncode, stderr tail, usage).
+
+    stderr is drained with a selector until EOF or the deadline, keeping only
+    the last STDERR_TAIL_BYTES, and the child is reaped with ``os.wait4`` so
+    its resource usage is exact even while other trials run concurrently.
+    Where ``os.wait4`` is unavailable (Windows) this falls back to
+    ``subprocess.run`` and usage is None.
+
+    Raises:
+        subprocess.TimeoutExpired: If the child was still running at the deadline;
+            it is killed and reaped first.
+    """
+    if not hasattr(os, "wait4"):
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout
+        )
+        return result.returncode, result.stderr[-STDERR_TAIL_BYTES:], None
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + timeout
+    tail = bytearray()
+    timed_out = False
+    fd = proc.stderr.fileno()
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                timed_out = True
+                proc.kill()
+                break
+            if not selector.select(remaining):
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            tail += chunk
+            del tail[:-STDERR_TAIL_BYTES]
+    proc.stderr.close()
+
+    _, status, rusage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if timed_out:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, bytes(tail), _usage_from_rusage(rusage)
+
+
+def _measurement(
+    elapsed_ns: int,
+    usage: Usage | None,
+    success: bool,
+    error: str | None,
+    perf_files: list[Path] | None = None,
+) -> dict:
+    """Build a trial result, adding CPU time, peak RSS and page faults when available.
+
+    ``usage`` covers exactly this trial's gpio processes. (On Linux a child's
+    peak RSS carries over from before exec, so it never reads lower than this
+    script's own RSS.) ``perf_files`` are
+    the ``perf stat`` outputs of a profiled trial; their counters are summed
+    into ``counters``.
+    """
+    measurement = {
+        "time_seconds": elapsed_ns / 1e9,
+        "time_ns": elapsed_ns,
+        "success": success,
+        "error": error,
+    }
+    if usage is not None:
+        measurement["user_time"] = usage[0]
+        measurement["sys_time"] = usage[1]
+        measurement["max_rss_kb"] = usage[2]
+        measurement["page_faults"] = usage[3]
+    if perf_files and success:
+        measurement["counters"] = _read_perf_counters(perf_files)
+    return measurement
 
 
-def run_operation(cmd: list[str], input_file: str, output_dir: Path) -> dict:
-    """Run a single operation and measure time."""
+def _perf_prefix(output: Path) -> list[str]:
+    """Command prefix that runs a command under ``perf stat``, writing CSV to output."""
+    return ["perf", "stat", "-x,", "-o", str(output), "-e", ",".join(PERF_EVENTS), "--"]
+
+
+def perf_available() -> bool:
+    """Whether ``perf stat`` is installed and allowed to count events for our children."""
+    if shutil.which("perf") is None:
+        return False
+    try:
+        probe = subprocess.run(
+            ["perf", "stat", "-x,", "-e", "task-clock", "--", "true"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return probe.returncode == 0
+
+
+def _read_perf_counters(paths: list[Path]) -> dict[str, float]:
+    """Sum the counters from ``perf stat -x,`` CSV files.
+
+    Events perf could not count (``<not supported>``/``<not counted>``) are
+    left out. Event modifiers such as ``:u`` are dropped and dashes become
+    underscores, so ``cache-misses:u`` is reported as ``cache_misses``.
+    """
+    counters: dict[str, float] = {}
+    for path in paths:
+        try:
+            lines = path.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split(",")
+            if len(fields) < 3:
+                continue
+            try:
+                value = float(fields[0])
+            except ValueError:
+                continue
+            name = fields[2].split(":")[0].replace("-", "_")
+            counters[name] = counters.get(name, 0.0) + value
+    return counters
+
+
+def run_operation(
+    cmd: CompiledCmd,
+    input_file: str,
+    output_dir: Path,
+    profile: bool = False,
+    in_process: bool = False,
+) -> dict:
+    """Run a single operation and measure time.
+
+    Outputs are written into ``output_dir``, which should be a fresh
+    directory; the caller is responsible for removing it. With ``profile``,
+    the command runs under ``perf stat`` and its counters are recorded; with
+    ``in_process`` it runs in this interpreter instead of a subprocess.
+    """
     output_file = output_dir / "output.parquet"
     partition_dir = output_dir / "partitioned"
     output_geojson = output_dir / "output.geojson"
@@ -353,53 +901,47 @@ def run_operation(cmd: list[str], input_file: str, output_dir: Path) -> dict:
         "output_fgb": str(output_fgb),
         "output_gpkg": str(output_gpkg),
     }
-    final_cmd = _substitute_cmd(cmd, substitutions)
-
-    # Force garbage collection before timing
-    gc.collect()
-
-    start_time = time.perf_counter()
+    final_cmd = _apply(cmd, substitutions)
+    run = _run_in_process if in_process else _run_child
+    perf_files = [output_dir / "perf.csv"] if profile else []
+    if profile:
+        final_cmd = _perf_prefix(perf_files[0]) + final_cmd
+
+    usage = None
+    start_ns = time.perf_counter_ns()
     try:
-        result = subprocess.run(
-            final_cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
-        end_time = time.perf_counter()
+        returncode, stderr, usage = run(final_cmd, timeout=300)
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
-        success = result.returncode == 0
-        error = result.stderr if not success else None
+        success = returncode == 0
+        error = _stderr_tail(stderr) if not success else None
 
     except subprocess.TimeoutExpired:
-        end_time = time.perf_counter()
+        elapsed_ns = time.perf_counter_ns() - start_ns
         success = False
         error = "Timeout"
     except Exception as e:
-        end_time = time.perf_counter()
+        elapsed_ns = time.perf_counter_ns() - start_ns
         success = False
         error = str(e)
 
-    elapsed = end_time - start_time
-
-    # Clean up output files
-    for output_path in [output_file, output_geojson, output_fgb, output_gpkg]:
-        if output_path.exists():
-            output_path.unlink()
-    if partition_dir.exists():
-        import shutil
+    return _measurement(elapsed_ns, usage, success, error, perf_files)
 
-        shutil.rmtree(partition_dir, ignore_errors=True)
-
-    return {
-        "time_seconds": elapsed,
-        "success": success,
-        "error": error,
-    }
 
+def run_chain_operation(
+    steps: list[CompiledCmd],
+    input_file: str,
+    output_dir: Path,
+    profile: bool = False,
+    in_process: bool = False,
+) -> dict:
+    """Run a chain of operations and measure total time.
 
-def run_chain_operation(steps: list[list[str]], input_file: str, output_dir: Path) -> dict:
-    """Run a chain of operations and measure total time."""
+    Intermediate and final files are left in ``output_dir`` for the caller to
+    remove. With ``profile``, every step runs under ``perf stat`` and the
+    counters are summed over the chain; with ``in_process`` the steps run in
+    this interpreter.
+    """
     # Create step files
     step_files = {
         "input": input_file,
@@ -408,73 +950,485 @@ def run_chain_operation(steps: list[list[str]], input_file: str, output_dir: Pat
         "step3": str(output_dir / "step3.parquet"),
         "output": str(output_dir / "output.parquet"),
     }
+    perf_files: list[Path] = []
+    run = _run_in_process if in_process else _run_child
 
-    # Force garbage collection before timing
-    gc.collect()
-
-    start_time = time.perf_counter()
+    usage = None
+    start_ns = time.perf_counter_ns()
     try:
-        for step_cmd in steps:
-            final_cmd = _substitute_cmd(step_cmd, step_files)
-            result = subprocess.run(
-                final_cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-            if result.returncode != 0:
-                end_time = time.perf_counter()
-                return {
-                    "time_seconds": end_time - start_time,
-                    "success": False,
-                    "error": result.stderr,
-                }
-
-        end_time = time.perf_counter()
+        for step_num, step_cmd in enumerate(steps, 1):
+            final_cmd = _apply(step_cmd, step_files)
+            if profile:
+                perf_files.append(output_dir / f"perf{step_num}.csv")
+                final_cmd = _perf_prefix(perf_files[-1]) + final_cmd
+            returncode, stderr, step_usage = run(final_cmd, timeout=300)
+            usage = _combine_usage(usage, step_usage)
+            if returncode != 0:
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                return _measurement(elapsed_ns, usage, False, _stderr_tail(stderr))
+
+        elapsed_ns = time.perf_counter_ns() - start_ns
         success = True
         error = None
 
     except subprocess.TimeoutExpired:
-        end_time = time.perf_counter()
+        elapsed_ns = time.perf_counter_ns() - start_ns
         success = False
         error = "Timeout"
     except Exception as e:
-        end_time = time.perf_counter()
+        elapsed_ns = time.perf_counter_ns() - start_ns
         success = False
         error = str(e)
 
-    elapsed = end_time - start_time
+    return _measurement(elapsed_ns, usage, success, error, perf_files)
 
-    # Clean up step files
-    for key, path in step_files.items():
-        if key != "input":
-            p = Path(path)
-            if p.exists():
-                p.unlink()
 
-    return {
-        "time_seconds": elapsed,
-        "success": success,
-        "error": error,
+@dataclass(frozen=True)
+class Trial:
+    """One timed run of an operation (single command or chain) on one input."""
+
+    input_path: str
+    cmd: CompiledCmd | None = None
+    steps: list[CompiledCmd] | None = None
+    profile: bool = False
+    in_process: bool = False
+
+
+def _default_tmp_dir() -> Path | None:
+    """Return BENCH_TMPFS if it is usable and has enough free space, else None."""
+    try:
+        if (
+            BENCH_TMPFS.is_dir()
+            and os.access(BENCH_TMPFS, os.W_OK)
+            and shutil.disk_usage(BENCH_TMPFS).free >= TMPFS_MIN_FREE
+        ):
+            return BENCH_TMPFS
+    except OSError:
+        pass
+    return None
+
+
+def _filesystem_type(path: Path) -> str:
+    """Filesystem type of the mount containing path, from /proc/mounts (Linux only)."""
+    try:
+        mounts = Path("/proc/mounts").read_text().splitlines()
+    except OSError:
+        return "unknown"
+
+    resolved = str(path.resolve())
+    best_mount, fs_type = "", "unknown"
+    for line in mounts:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        mount = fields[1].replace("\\040", " ")
+        under_mount = resolved == mount or resolved.startswith(mount.rstrip("/") + "/")
+        if under_mount and len(mount) > len(best_mount):
+            best_mount, fs_type = mount, fields[2]
+    return fs_type
+
+
+class TrialDirs:
+    """Hands out per-trial scratch directories and deletes them in batches.
+
+    Finished directories are removed on a background thread once
+    ``PRUNE_EVERY`` have accumulated, which caps disk usage without putting
+    cleanup between one trial and the next. Serial runs also ``flush`` after
+    each operation. Anything left over when the context exits is removed
+    along with ``root`` by its owner.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._finished: list[Path] = []
+        self._lock = threading.Lock()
+        self._cleaner = ThreadPoolExecutor(max_workers=1)
+
+    def __enter__(self) -> "TrialDirs":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._cleaner.shutdown(wait=True)
+
+    def new(self) -> Path:
+        """Create a fresh, uniquely named trial directory."""
+        trial_dir = self.root / f"t{secrets.token_hex(6)}"
+        trial_dir.mkdir()
+        return trial_dir
+
+    def flush(self) -> None:
+        """Remove all finished trial directories now and wait until they're gone."""
+        with self._lock:
+            batch, self._finished = self._finished, []
+        self._cleaner.submit(_remove_dirs, batch).result()
+
+    def release(self, trial_dir: Path) -> None:
+        """Mark a trial directory as finished, pruning a batch if one is due."""
+        with self._lock:
+            self._finished.append(trial_dir)
+            if len(self._finished) < PRUNE_EVERY:
+                return
+            batch, self._finished = self._finished, []
+        self._cleaner.submit(_remove_dirs, batch)
+
+
+def _remove_dirs(paths: list[Path]) -> None:
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _run_trial(trial: Trial, trial_dirs: TrialDirs) -> dict:
+    """Run a trial in its own scratch directory so concurrent trials never collide."""
+    trial_dir = trial_dirs.new()
+    try:
+        if trial.steps is not None:
+            return run_chain_operation(
+                trial.steps, trial.input_path, trial_dir, trial.profile, trial.in_process
+            )
+        return run_operation(
+            trial.cmd, trial.input_path, trial_dir, trial.profile, trial.in_process
+        )
+    finally:
+        trial_dirs.release(trial_dir)
+
+
+def _resolve_trial(
+    op_name: str, size_name: str, input_path: str, source_files: dict[str, Path]
+) -> tuple[dict | None, Trial | None, str | None]:
+    """Look up an operation and build its trial.
+
+    ``source_files`` maps source format to this size's file for import operations.
+
+    Returns:
+        Tuple of (operation, trial, skip_reason); operation and trial are None
+        when the operation should be skipped.
+    """
+    op = OPERATIONS_BY_NAME.get(op_name)
+    if op is None:
+        return None, None, "unknown operation"
+    if op.get("steps"):
+        return op, Trial(input_path, steps=op["_compiled"]), None
+    source_fmt = op.get("source_format")
+    if source_fmt:
+        # Skip import ops for sizes that don't have source files
+        if source_fmt not in source_files:
+            return None, None, f"no {source_fmt} file for {size_name}"
+        source_input = str(source_files[source_fmt])
+        return op, Trial(source_input, cmd=op["_compiled"]), None
+    return op, Trial(input_path, cmd=op["_compiled"]), None
+
+
+def _iqr(times: list[float]) -> float | None:
+    """Interquartile range of the warm times, a noise measure robust to outliers."""
+    if len(times) < 2:
+        return None
+    quartiles = statistics.quantiles(times, n=4)
+    return quartiles[2] - quartiles[0]
+
+
+def _summarize(
+    size_name: str, op_name: str, op: dict, cold_result: dict, trial_results: list[dict]
+) -> dict:
+    """Aggregate trial results for one (file, operation) pair into a benchmark record.
+
+    The cold (first) run is reported separately as ``cold_time`` so it doesn't
+    skew the warm statistics but regressions in startup cost stay visible.
+    """
+    successes = [r for r in trial_results if r["success"]]
+    times = [r["time_seconds"] for r in successes]
+    errors = [r["error"] for r in trial_results if not r["success"]]
+    record = {
+        "file_size": size_name,
+        "operation": op_name,
+        "description": op["description"],
+        "avg_time": sum(times) / len(times) if times else None,
+        "min_time": min(times) if times else None,
+        "max_time": max(times) if times else None,
+        "iqr": _iqr(times),
+        "cold_time": cold_result["time_seconds"] if cold_result["success"] else None,
+        "warm_times": times,
+        "success_count": len(times),
+        "fail_count": len(errors),
+        "errors": errors if errors else None,
     }
+    if successes and all("user_time" in r for r in successes):
+        record["avg_user_time"] = sum(r["user_time"] for r in successes) / len(successes)
+        record["avg_sys_time"] = sum(r["sys_time"] for r in successes) / len(successes)
+        record["max_rss_kb"] = max(r["max_rss_kb"] for r in successes)
+        record["avg_page_faults"] = sum(r["page_faults"] for r in successes) / len(successes)
+    if successes and all("counters" in r for r in successes):
+        names = set.intersection(*(set(r["counters"]) for r in successes))
+        counters = {
+            name: sum(r["counters"][name] for r in successes) / len(successes)
+            for name in sorted(names)
+        }
+        if counters.get("cycles"):
+            counters["ipc"] = counters.get("instructions", 0.0) / counters["cycles"]
+        record["counters"] = counters
+    return record
+
+
+def _format_summary(record: dict) -> str:
+    """One-line timing summary for a benchmark record."""
+    if record["avg_time"] is None:
+        errors = record["errors"]
+        return f" FAILED: {errors[0] if errors else 'unknown'}"
+    return (
+        f" {record['avg_time']:.3f}s (min={record['min_time']:.3f}, max={record['max_time']:.3f})"
+    )
+
+
+def _prewarm_page_cache(paths: Iterable[Path]) -> None:
+    """Read files through once so that no trial pays for reading them from disk.
+
+    Otherwise the disk read lands on whichever trial touches a file first,
+    inflating its time and making cold and warm runs differ for reasons that
+    have nothing to do with gpio.
+    """
+    buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+    for path in paths:
+        with open(path, "rb", buffering=0) as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            while f.readinto(buffer):
+                pass
+
+
+def _warmup(op_names: list[str]) -> None:
+    """Run ``gpio <command> --help`` once per distinct subcommand.
+
+    This loads the gpio entry point and its imports once, compiling bytecode
+    and pulling the installed packages into the page cache, so the first
+    timed trial of each operation doesn't also pay for that.
+    """
+    prefixes = {}
+    for op_name in op_names:
+        op = OPERATIONS_BY_NAME[op_name]
+        for cmd in op.get("steps") or [op["cmd"]]:
+            prefixes.setdefault(tuple(cmd[:2]), None)
+
+    print(f"Warming up {len(prefixes)} gpio subcommands...", flush=True)
+    for prefix in prefixes:
+        subprocess.run(
+            [*prefix, "--help"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=120,
+        )
+
+
+def _run_trials_serial(
+    groups: Iterable, iterations: int, trial_dirs: TrialDirs, on_record: Callable[[dict], None]
+) -> list[dict]:
+    """Run each group's trials back to back, printing progress as they finish."""
+    records = []
+    current_size = None
+    for size_name, op_name, op, trial in groups:
+        if size_name != current_size:
+            current_size = size_name
+            print(f"\n--- File: {size_name} ({TEST_FILES[size_name].split('/')[-1]}) ---")
+        print(f"  {op_name}: ", end="", flush=True)
+
+        # One extra, discarded run to warm the page cache for this input
+        cold_result = _run_trial(trial, trial_dirs)
+        print("c" if cold_result["success"] else "x", end="", flush=True)
+
+        trial_results = []
+        for _i in range(iterations):
+            result = _run_trial(trial, trial_dirs)
+            print("." if result["success"] else "x", end="", flush=True)
+            trial_results.append(result)
+
+        record = _summarize(size_name, op_name, op, cold_result, trial_results)
+        print(_format_summary(record))
+        on_record(record)
+        records.append(record)
+
+        # Clean up between operations rather than while the next one is timed
+        trial_dirs.flush()
+        gc.collect()
+    return records
+
+
+_END_OF_GROUPS = object()
+
+
+def _run_trials_parallel(
+    groups: Iterable,
+    iterations: int,
+    trial_dirs: TrialDirs,
+    on_record: Callable[[dict], None],
+    jobs: int,
+) -> list[dict]:
+    """Fan all trials out over ``jobs`` workers, then report in arrival order.
+
+    Each worker only waits on its gpio child process, so threads suffice.
+    Timing happens inside the worker around the subprocess, so queueing
+    delay is not measured, but concurrent trials do compete for CPU and I/O.
+    Groups are submitted as ``groups`` yields them.
+    """
+    arrived: list = []
+    cold_results: list[dict] = []
+    trial_results: list[list[dict]] = []
+    records: list[dict] = []
+
+    print(f"Running trials on {jobs} workers: ", end="", flush=True)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending: dict = {}
+
+        def handle(done) -> None:
+            for future in done:
+                index, is_cold = pending.pop(future)
+                result = future.result()
+                print("." if result["success"] else "x", end="", flush=True)
+                if is_cold:
+                    cold_results[index] = result
+                    trial = arrived[index][3]
+                    # Each group's warm runs are queued once its cold run finishes
+                    for _i in range(iterations):
+                        pending[executor.submit(_run_trial, trial, trial_dirs)] = (index, False)
+                else:
+                    trial_results[index].append(result)
+                if len(trial_results[index]) == iterations:
+                    size_name, op_name, op, _ = arrived[index]
+                    records[index] = _summarize(
+                        size_name, op_name, op, cold_results[index], trial_results[index]
+                    )
+                    on_record(records[index])
+
+        def add(group) -> None:
+            arrived.append(group)
+            cold_results.append({})
+            trial_results.append([])
+            records.append({})
+            pending[executor.submit(_run_trial, group[3], trial_dirs)] = (len(arrived) - 1, True)
+
+        # Groups may wait on downloads, so a feeder thread produces them while
+        # this loop keeps scheduling warm runs for groups that already arrived
+        feed: queue.Queue = queue.Queue()
+        feed_error: list[BaseException] = []
+
+        def produce() -> None:
+            try:
+                for group in groups:
+                    feed.put(group)
+            except BaseException as e:
+                feed_error.append(e)
+            finally:
+                feed.put(_END_OF_GROUPS)
+
+        feeder = threading.Thread(target=produce, daemon=True)
+        feeder.start()
+        feeding = True
+        while feeding or pending:
+            if feeding and not pending:
+                group = feed.get()
+            else:
+                try:
+                    group = feed.get_nowait() if feeding else None
+                except queue.Empty:
+                    group = None
+            if group is _END_OF_GROUPS:
+                feeding = False
+            elif group is not None:
+                add(group)
+                continue
+            if pending:
+                done, _ = wait(
+                    pending, timeout=0.05 if feeding else None, return_when=FIRST_COMPLETED
+                )
+                handle(done)
+        feeder.join()
+        if feed_error:
+            raise feed_error[0]
+    print()
+
+    current_size = None
+    for (size_name, op_name, _, _), record in zip(arrived, records, strict=True):
+        if size_name != current_size:
+            current_size = size_name
+            print(f"\n--- File: {size_name} ({TEST_FILES[size_name].split('/')[-1]}) ---")
+        print(f"  {op_name}:{_format_summary(record)}")
+    return records
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Keep the cyclic GC out of every timed region until the block exits.
+
+    The collector is global to the interpreter, so it is paused once around
+    all trials rather than per trial, where worker threads would re-enable it
+    under each other's timings.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+@contextmanager
+def _jsonl_writer(path: Path | None, metadata: dict) -> Iterator[Callable[[dict], None]]:
+    """Yield a callback that appends one record per line to path (a no-op if None).
+
+    The first line holds the run metadata, without the ``benchmarks`` list.
+    """
+    if path is None:
+        yield lambda record: None
+        return
+
+    with open(path, "w") as f:
+
+        def write(line: dict) -> None:
+            f.write(json.dumps(line, separators=(",", ":")) + "\n")
+            f.flush()
+
+        write({k: v for k, v in metadata.items() if k != "benchmarks"})
+        yield write
 
 
 def run_benchmarks(
     version_label: str,
-    iterations: int = 3,
+    iterations: int = 5,
     use_cache: bool = True,
     file_sizes: list[str] | None = None,
     ops: list[str] | None = None,
+    jobs: int = 1,
+    tmp_dir: Path | None = None,
+    jsonl_path: Path | None = None,
+    profile: bool = False,
+    in_process: bool = False,
 ) -> dict:
     """Run all benchmarks and return results.
 
     Args:
         version_label: Label for this version (e.g., 'v0.9.0', 'main')
-        iterations: Number of iterations per operation
-        use_cache: Whether to cache files locally
+        iterations: Number of timed iterations per operation. Each operation
+            also gets one untimed-for-statistics cold run first, recorded
+            as ``cold_time``.
+        use_cache: Whether to cache files locally. Cached inputs are also read
+            into the page cache before their first trial.
         file_sizes: List of file sizes to test. If None, uses all available.
         ops: List of operation names to run. If None, uses standard preset.
+        jobs: Number of trials to run concurrently. The default of 1 keeps
+            trials isolated from each other for the most stable timings.
+        tmp_dir: Directory for trial outputs. If None, uses /dev/shm when it
+            has at least 2 GB free, otherwise the system temp directory.
+        jsonl_path: If given, the run metadata and then each benchmark record
+            are appended to this JSON Lines file as soon as they are known, so
+            an interrupted run keeps its completed results.
+        profile: Run every command under ``perf stat`` and record its counters
+            per operation. Falls back to the rusage figures (always recorded)
+            when perf is missing or not permitted.
+        in_process: Run gpio commands through its Click entry point in this
+            interpreter rather than as subprocesses, so interpreter startup
+            and imports are paid once instead of per trial. Requires jobs=1
+            and no profile; results are only comparable to other in-process runs.
     """
+    if in_process and (jobs > 1 or profile):
+        raise ValueError("in_process can't be combined with jobs > 1 or profile")
+
     # Determine which files to run
     sizes_to_run = file_sizes if file_sizes else list(TEST_FILES.keys())
 
@@ -485,183 +1439,365 @@ def run_benchmarks(
         "version": version_label,
         "timestamp": datetime.now().isoformat(),
         "iterations": iterations,
+        "jobs": jobs,
+        "mode": "inproc" if in_process else "subprocess",
+        # Inputs are read into the page cache before their first trial; every
+        # operation then gets a cold run that is kept out of the warm statistics
+        "warmup": ["page-cache", "cold-run"] if use_cache else ["cold-run"],
         "file_sizes": sizes_to_run,
         "operations": ops_to_run,
         "benchmarks": [],
     }
 
-    # Get gpio version
-    try:
-        version_result = subprocess.run(["gpio", "--version"], capture_output=True, text=True)
-        results["gpio_version"] = version_result.stdout.strip()
-    except Exception:
-        results["gpio_version"] = "unknown"
+    if profile and not perf_available():
+        print("Warning: perf stat is unavailable; --profile falls back to rusage counters")
+        profile = False
+    results["profile"] = "perf" if profile else "rusage"
 
-    # Check if we need source format files for import operations
-    has_import_ops = any(op in IMPORT_OPERATIONS for op in ops_to_run)
+    scratch_root = tmp_dir if tmp_dir else _default_tmp_dir()
+    results["tmp_dir"] = str(scratch_root if scratch_root else tempfile.gettempdir())
+    results["tmp_fs"] = _filesystem_type(Path(results["tmp_dir"]))
 
-    # Get local files if caching enabled
-    if use_cache:
-        local_files, source_files = ensure_files_cached(sizes_to_run, has_import_ops)
+    # Get gpio version. In-process runs measure the package this interpreter
+    # imports, which need not be the gpio on PATH, so record that one instead
+    if in_process:
+        # Importing here also keeps the CLI's import cost out of the timings
+        import geoparquet_io
+        from geoparquet_io.cli.main import __version__ as gpio_version
+
+        results["gpio_version"] = f"geoparquet-io, version {gpio_version}"
+        results["gpio_package"] = str(Path(geoparquet_io.__file__).parent)
     else:
-        local_files = None
-        source_files = {}
+        try:
+            version_result = subprocess.run(["gpio", "--version"], capture_output=True, text=True)
+            results["gpio_version"] = version_result.stdout.strip()
+        except Exception:
+            results["gpio_version"] = "unknown"
+
+    # Check if we need source format files for import operations
+    has_import_ops = any(op in IMPORT_OPERATIONS for op in ops_to_run)
 
     print(f"\n{'=' * 60}")
     print(f"Benchmarking: {version_label}")
     print(f"GPIO Version: {results['gpio_version']}")
     print(f"Iterations: {iterations}")
+    print(f"Concurrent trials: {jobs}")
+    print(f"Mode: {results['mode']}")
+    if in_process:
+        print(f"GPIO package: {results['gpio_package']}")
     print(f"File sizes: {', '.join(sizes_to_run)}")
     print(f"Operations: {', '.join(ops_to_run)}")
     print(f"Using local cache: {use_cache}")
+    print(f"Output dir: {results['tmp_dir']} ({results['tmp_fs']})")
     print(f"{'=' * 60}\n")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_dir = Path(tmpdir)
-
-        for size_name in sizes_to_run:
-            input_url = TEST_FILES[size_name]
-            # Use cached local file or remote URL
-            if local_files:
-                input_path = str(local_files[size_name])
-            else:
-                input_path = input_url
-
-            print(f"\n--- File: {size_name} ({input_url.split('/')[-1]}) ---")
+    # Files become available as they finish downloading, so benchmarking of
+    # the first sizes overlaps the download of the rest
+    if use_cache:
+        ready_files = iter_cached_files(sizes_to_run, has_import_ops)
+    else:
+        ready_files = ((size, TEST_FILES[size], {}) for size in sizes_to_run)
 
+    def iter_groups():
+        """Yield (size_name, op_name, operation, trial) for every pair that will run."""
+        for size_name, input_path, source_files in ready_files:
+            if use_cache:
+                _prewarm_page_cache([input_path, *source_files.values()])
             for op_name in ops_to_run:
-                # Get operation details
-                if op_name in ALL_OPERATIONS:
-                    op = ALL_OPERATIONS[op_name]
-                    is_chain = False
-                    is_import = False
-                elif op_name in IMPORT_OPERATIONS:
-                    op = IMPORT_OPERATIONS[op_name]
-                    is_chain = False
-                    is_import = True
-                    # Skip import ops for sizes that don't have source files
-                    source_fmt = op["source_format"]
-                    if source_fmt not in source_files or size_name not in source_files.get(
-                        source_fmt, {}
-                    ):
-                        print(f"  {op_name}: SKIPPED (no {source_fmt} file for {size_name})")
-                        continue
-                elif op_name in CHAIN_OPERATIONS:
-                    op = CHAIN_OPERATIONS[op_name]
-                    is_chain = True
-                    is_import = False
-                else:
-                    print(f"  {op_name}: SKIPPED (unknown operation)")
-                    continue
-
-                print(f"  {op_name}: ", end="", flush=True)
-
-                times = []
-                errors = []
-
-                for _i in range(iterations):
-                    if is_chain:
-                        result = run_chain_operation(op["steps"], input_path, output_dir)
-                    elif is_import:
-                        # Get the source format file for import operations
-                        source_fmt = op["source_format"]
-                        source_input = str(source_files[source_fmt][size_name])
-                        result = run_operation(op["cmd"], source_input, output_dir)
-                    else:
-                        result = run_operation(op["cmd"], input_path, output_dir)
-
-                    if result["success"]:
-                        times.append(result["time_seconds"])
-                        print(".", end="", flush=True)
-                    else:
-                        errors.append(result["error"])
-                        print("x", end="", flush=True)
-
-                if times:
-                    avg_time = sum(times) / len(times)
-                    min_time = min(times)
-                    max_time = max(times)
-                    print(f" {avg_time:.3f}s (min={min_time:.3f}, max={max_time:.3f})")
-                else:
-                    print(f" FAILED: {errors[0] if errors else 'unknown'}")
-                    avg_time = None
-                    min_time = None
-                    max_time = None
-
-                results["benchmarks"].append(
-                    {
-                        "file_size": size_name,
-                        "operation": op_name,
-                        "description": op["description"],
-                        "avg_time": avg_time,
-                        "min_time": min_time,
-                        "max_time": max_time,
-                        "success_count": len(times),
-                        "fail_count": len(errors),
-                        "errors": errors if errors else None,
-                    }
+                op, trial, skip_reason = _resolve_trial(
+                    op_name, size_name, str(input_path), source_files
                 )
+                if skip_reason:
+                    print(f"  {op_name}: SKIPPED ({skip_reason})")
+                    continue
+                if profile or in_process:
+                    trial = replace(trial, profile=profile, in_process=in_process)
+                yield size_name, op_name, op, trial
+
+    if not in_process:
+        _warmup([op_name for op_name in ops_to_run if op_name in OPERATIONS_BY_NAME])
+
+    # Removing the TemporaryDirectory deletes whatever trial dirs weren't pruned yet
+    with (
+        tempfile.TemporaryDirectory(dir=scratch_root) as tmpdir,
+        TrialDirs(Path(tmpdir)) as trial_dirs,
+        _jsonl_writer(jsonl_path, results) as on_record,
+        _gc_paused(),
+    ):
+        if jobs > 1:
+            records = _run_trials_parallel(iter_groups(), iterations, trial_dirs, on_record, jobs)
+        else:
+            records = _run_trials_serial(iter_groups(), iterations, trial_dirs, on_record)
 
+    # Report in plan order regardless of which files finished downloading first
+    size_order = {name: i for i, name in enumerate(sizes_to_run)}
+    op_order = {name: i for i, name in enumerate(ops_to_run)}
+    results["benchmarks"] = sorted(
+        records, key=lambda r: (size_order[r["file_size"]], op_order[r["operation"]])
+    )
     return results
 
 
-def compare_results(file1: str, file2: str):
-    """Compare two benchmark result files."""
-    with open(file1) as f:
-        results1 = json.load(f)
-    with open(file2) as f:
-        results2 = json.load(f)
+def _cpu_time(record: dict) -> float | None:
+    """Average user + system CPU seconds of a record, if it was measured."""
+    if record.get("avg_user_time") is None:
+        return None
+    return record["avg_user_time"] + record["avg_sys_time"]
+
+
+def _page_faults(record: dict) -> float | None:
+    """Average page faults of a record, preferring perf's count over rusage."""
+    perf_faults = record.get("counters", {}).get("page_faults")
+    return perf_faults if perf_faults is not None else record.get("avg_page_faults")
+
+
+def _best_time(record: dict | None) -> float | None:
+    """Fastest warm time of a record, the metric runs are compared on.
+
+    The minimum is the run least disturbed by GC, cache misses and other
+    load, so it tracks the operation's own cost more stably than the mean.
+    Falls back to the mean for records without a minimum.
+    """
+    if record is None:
+        return None
+    best = record.get("min_time")
+    return best if best is not None else record.get("avg_time")
+
+
+def _cpu_inefficiency(b1: dict, b2: dict) -> str | None:
+    """Describe a CPU-time increase that bought no matching wall-time gain.
+
+    Extra threads that don't speed anything up leave wall time flat while CPU
+    time grows, so the wall-time delta alone would not show them.
+    """
+    cpu1, cpu2 = _cpu_time(b1), _cpu_time(b2)
+    wall1, wall2 = b1.get("avg_time"), b2.get("avg_time")
+    if not (cpu1 and cpu2 and wall1 and wall2):
+        return None
+    cpu_change = (cpu2 - cpu1) / cpu1
+    wall_change = (wall2 - wall1) / wall1
+    if cpu_change <= REGRESSION_THRESHOLD or wall_change < -REGRESSION_THRESHOLD:
+        return None
+    return (
+        f"CPU {cpu_change * 100:+.1f}% for wall {wall_change * 100:+.1f}% "
+        f"(CPU/wall {cpu1 / wall1:.2f} -> {cpu2 / wall2:.2f})"
+    )
+
+
+def _percent_change(before: float | None, after: float | None) -> str:
+    """Format the relative change between two values, or N/A if either is missing."""
+    if before is None or after is None or before <= 0:
+        return "N/A"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def _iter_jsonl(path: str) -> Iterator[dict]:
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _load_results(path: str) -> tuple[dict, Iterable[dict]]:
+    """Load a results file as (run metadata, benchmark records).
+
+    Accepts the consolidated ``.json`` output or the ``.jsonl`` file written
+    during a run; the latter's records are streamed rather than loaded at once.
+    """
+    if path.endswith(".jsonl"):
+        lines = _iter_jsonl(path)
+        return next(lines), lines
+    with open(path) as f:
+        results = json.load(f)
+    return results, results["benchmarks"]
+
+
+def _samples(record: dict | None) -> list[float]:
+    """Per-iteration times of a record (empty for results that predate them)."""
+    if record is None:
+        return []
+    return record.get("warm_times") or record.get("times") or []
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b), by Lentz's continued fraction."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    if x > (a + 1.0) / (a + b + 2.0):
+        # The continued fraction converges quickly only below this point
+        return 1.0 - _betainc(b, a, 1.0 - x)
+
+    log_front = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log1p(-x)
+    )
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    fraction = d
+    for m in range(1, 200):
+        for numerator in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            fraction *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return math.exp(log_front) * fraction / a
+
+
+def welch_p_value(sample1: list[float], sample2: list[float]) -> float | None:
+    """Two-sided p-value of Welch's t-test for a difference in means.
+
+    Returns None when either sample has fewer than two values or both have
+    zero variance, i.e. when no meaningful test is possible.
+    """
+    n1, n2 = len(sample1), len(sample2)
+    if n1 < 2 or n2 < 2:
+        return None
+    se1 = statistics.variance(sample1) / n1
+    se2 = statistics.variance(sample2) / n2
+    if se1 + se2 == 0:
+        return None
+    t = (statistics.fmean(sample2) - statistics.fmean(sample1)) / math.sqrt(se1 + se2)
+    df = (se1 + se2) ** 2 / (se1**2 / (n1 - 1) + se2**2 / (n2 - 1))
+    return _betainc(df / 2, 0.5, df / (df + t * t))
+
+
+def _format_spread(sample: list[float]) -> str:
+    if len(sample) < 2:
+        return "N/A"
+    return f"{statistics.median(sample):.3f}s ±{statistics.stdev(sample):.3f}"
+
+
+def compare_results(file1: str, *others: str) -> list[str]:
+    """Compare a baseline result file against one or more others (``.json`` or ``.jsonl``).
+
+    Deltas are marked ``*`` when Welch's t-test over the per-iteration times
+    gives p < SIGNIFICANCE_LEVEL and ``~`` when it doesn't; unmarked deltas
+    had too few samples to test.
 
-    print(f"\n{'=' * 70}")
-    print(f"Comparison: {results1['version']} vs {results2['version']}")
-    print(f"{'=' * 70}\n")
+    Returns:
+        Descriptions of significant regressions larger than REGRESSION_THRESHOLD.
+    """
+    results1, benchmarks1 = _load_results(file1)
+    benchmarks1 = list(benchmarks1)
+    regressions = []
+    for file2 in others:
+        results2, benchmarks2 = _load_results(file2)
+        regressions += _compare_pair(results1, benchmarks1, results2, benchmarks2)
+    return regressions
+
+
+def _compare_pair(
+    results1: dict, benchmarks1: list[dict], results2: dict, benchmarks2: Iterable[dict]
+) -> list[str]:
+    """Print the comparison table for one pair of runs and return its regressions."""
+    version1, version2 = results1["version"], results2["version"]
+    print(f"\n{'=' * 105}")
+    print(f"Comparison: {version1} vs {version2}")
+    print(f"{'=' * 105}\n")
+    mode1 = results1.get("mode", "subprocess")
+    mode2 = results2.get("mode", "subprocess")
+    if mode1 != mode2:
+        print(
+            f"Warning: comparing {mode1} results with {mode2} results; times are not comparable\n"
+        )
 
     # Build lookup for results2
     lookup2 = {}
-    for b in results2["benchmarks"]:
+    for b in benchmarks2:
         key = (b["file_size"], b["operation"])
         lookup2[key] = b
 
     print(
-        f"{'Operation':<25} {'File':<8} {results1['version']:<12} {results2['version']:<12} {'Delta':<12}"
+        f"{'Operation':<25} {'File':<8} {version1:<12} {version2:<12} "
+        f"{'Delta':<14} {'CPU Delta':<10} {'RSS Delta':<10} {'PF Delta':<10}"
     )
-    print("-" * 70)
+    print("-" * 105)
 
-    for b1 in results1["benchmarks"]:
+    regressions = []
+    spreads = []
+    inefficiencies = []
+    for b1 in benchmarks1:
         key = (b1["file_size"], b1["operation"])
         b2 = lookup2.get(key)
 
         op_name = b1["operation"]
         file_size = b1["file_size"]
 
-        if b1["avg_time"] is None:
-            time1_str = "FAILED"
-        else:
-            time1_str = f"{b1['avg_time']:.3f}s"
+        time1, time2 = _best_time(b1), _best_time(b2)
+        time1_str = "FAILED" if time1 is None else f"{time1:.3f}s"
 
-        if b2 is None or b2["avg_time"] is None:
+        if time2 is None:
             time2_str = "FAILED" if b2 else "N/A"
             delta_str = "N/A"
         else:
-            time2_str = f"{b2['avg_time']:.3f}s"
+            time2_str = f"{time2:.3f}s"
 
-            if b1["avg_time"] is not None and b1["avg_time"] > 0:
-                delta = (b2["avg_time"] - b1["avg_time"]) / b1["avg_time"] * 100
+            if time1 is not None and time1 > 0:
+                delta = (time2 - time1) / time1 * 100
+                p_value = welch_p_value(_samples(b1), _samples(b2))
+                significant = p_value is not None and p_value < SIGNIFICANCE_LEVEL
+                marker = "" if p_value is None else ("*" if significant else "~")
                 if delta > 0:
-                    delta_str = f"+{delta:.1f}% slower"
+                    delta_str = f"+{delta:.1f}%{marker} slower"
                 elif delta < 0:
-                    delta_str = f"{delta:.1f}% faster"
+                    delta_str = f"{delta:.1f}%{marker} faster"
                 else:
                     delta_str = "same"
+                if significant and delta > REGRESSION_THRESHOLD * 100:
+                    regressions.append(
+                        f"{op_name} ({file_size}): +{delta:.1f}% vs {version1} (p={p_value:.3f})"
+                    )
             else:
                 delta_str = "N/A"
 
-        print(f"{op_name:<25} {file_size:<8} {time1_str:<12} {time2_str:<12} {delta_str:<12}")
+        cpu_str = _percent_change(_cpu_time(b1), _cpu_time(b2) if b2 else None)
+        rss_str = _percent_change(b1.get("max_rss_kb"), b2.get("max_rss_kb") if b2 else None)
+        pf_str = _percent_change(_page_faults(b1), _page_faults(b2) if b2 else None)
+
+        print(
+            f"{op_name:<25} {file_size:<8} {time1_str:<12} {time2_str:<12} {delta_str:<14} "
+            f"{cpu_str:<10} {rss_str:<10} {pf_str:<10}"
+        )
+        inefficiency = _cpu_inefficiency(b1, b2) if b2 else None
+        if inefficiency:
+            inefficiencies.append(f"{op_name} ({file_size}): {inefficiency}")
+        if _samples(b1) or _samples(b2):
+            spreads.append((op_name, file_size, _samples(b1), _samples(b2)))
+
+    print("\nTimes are each run's fastest iteration.")
+    print(f"* significant (Welch's t-test, p < {SIGNIFICANCE_LEVEL}), ~ within noise")
+
+    if inefficiencies:
+        print(f"\nMore CPU time without a matching speedup in {version2}:")
+        for line in inefficiencies:
+            print(f"  {line}")
+
+    if spreads:
+        print(f"\n{'Median ± stdev':<34} {version1:<20} {version2:<20}")
+        print("-" * 74)
+        for op_name, file_size, sample1, sample2 in spreads:
+            print(
+                f"{op_name:<25} {file_size:<8} "
+                f"{_format_spread(sample1):<20} {_format_spread(sample2):<20}"
+            )
 
     print()
+    return regressions
 
 
 def main():
+    # Download progress goes to stderr, so printing JSON to stdout stays clean
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
     parser = argparse.ArgumentParser(description="Version comparison benchmark")
     parser.add_argument(
         "--version-label",
@@ -670,14 +1806,17 @@ def main():
     parser.add_argument(
         "--output",
         "-o",
-        help="Output JSON file for results",
+        help=(
+            "Output JSON file for results. Records are also streamed to a .jsonl "
+            "file alongside it while the run progresses"
+        ),
     )
     parser.add_argument(
         "--iterations",
         "-n",
         type=int,
-        default=3,
-        help="Number of iterations per operation (default: 3)",
+        default=5,
+        help="Number of iterations per operation (default: 5)",
     )
     parser.add_argument(
         "--no-cache",
@@ -701,14 +1840,57 @@ def main():
             "or comma-separated operation names. Default: full"
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help=(
+            "Number of trials to run concurrently (default: 1). Higher values "
+            "finish sooner but trials compete for CPU and disk."
+        ),
+    )
+    parser.add_argument(
+        "--tmp-dir",
+        type=Path,
+        help="Directory for benchmark outputs (default: /dev/shm if it has room, else system temp)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Run each command under 'perf stat' and record cycles, instructions, "
+            "cache misses, page faults and context switches (Linux)"
+        ),
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help=(
+            "Run gpio commands inside this Python process instead of as subprocesses, "
+            "excluding interpreter startup from timings (incompatible with --jobs and --profile)"
+        ),
+    )
     parser.add_argument(
         "--compare",
-        nargs=2,
-        metavar=("FILE1", "FILE2"),
-        help="Compare two result files",
+        nargs="+",
+        metavar="FILE",
+        help="Compare result files: the first is the baseline for each of the others",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help=(
+            "With --compare, exit with status 1 if any operation is significantly "
+            "slower (p < 0.05) by more than 10%%"
+        ),
     )
 
     args = parser.parse_args()
+    if args.compare and len(args.compare) < 2:
+        parser.error("--compare needs a baseline file and at least one file to compare")
+    if args.in_process and (args.jobs > 1 or args.profile):
+        parser.error("--in-process can't be combined with --jobs or --profile")
 
     # Parse file sizes
     if args.files in FILE_PRESETS:
@@ -721,30 +1903,41 @@ def main():
             parser.error(f"Invalid file sizes: {invalid}. Valid: {list(TEST_FILES.keys())}")
 
     # Parse operations
-    all_ops = (
-        set(ALL_OPERATIONS.keys()) | set(CHAIN_OPERATIONS.keys()) | set(IMPORT_OPERATIONS.keys())
-    )
     if args.ops in OPERATION_PRESETS:
         ops_list = OPERATION_PRESETS[args.ops]
     else:
         ops_list = [s.strip() for s in args.ops.split(",")]
         # Validate operations
-        invalid = [s for s in ops_list if s not in all_ops]
+        invalid = [s for s in ops_list if s not in ALL_OP_NAMES]
         if invalid:
-            parser.error(f"Invalid operations: {invalid}. Valid: {sorted(all_ops)}")
+            parser.error(f"Invalid operations: {invalid}. Valid: {sorted(ALL_OP_NAMES)}")
 
     if args.compare:
-        compare_results(args.compare[0], args.compare[1])
+        regressions = compare_results(*args.compare)
+        if regressions:
+            print("Significant regressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            if args.fail_on_regression:
+                sys.exit(1)
     elif args.version_label:
+        jsonl_path = Path(args.output).with_suffix(".jsonl") if args.output else None
         results = run_benchmarks(
             args.version_label,
             args.iterations,
             use_cache=not args.no_cache,
             file_sizes=file_sizes,
             ops=ops_list,
+            jobs=args.jobs,
+            tmp_dir=args.tmp_dir,
+            jsonl_path=jsonl_path,
+            profile=args.profile,
+            in_process=args.in_process,
         )
 
-        if args.output:
+        if args.output and Path(args.output) == jsonl_path:
+            print(f"\nResults saved to {args.output}")
+        elif args.output:
             with open(args.output, "w") as f:
                 json.dump(results, f, indent=2)
             print(f"\nResults saved to {args.output}")
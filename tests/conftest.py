@@ -4,10 +4,10 @@ Pytest configuration and shared fixtures for geoparquet-io tests.
 
 import json
 import os
+import re
 import shutil
 import tempfile
 import time
-from contextlib import contextmanager
 from pathlib import Path
 
 import duckdb
@@ -21,6 +21,22 @@ BUILDINGS_TEST_FILE = TEST_DATA_DIR / "buildings_test.parquet"
 COUNTRY_PARTITION_DIR = TEST_DATA_DIR / "country_partition"
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def test_data_dir():
     """Return the path to the test data directory."""
@@ -48,18 +64,27 @@ def temp_output_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture(scope="module")
+def module_output_dir(tmp_path_factory):
+    """Directory shared by one test module's output files, cleaned up by pytest."""
+    return tmp_path_factory.mktemp("outputs")
+
+
 @pytest.fixture
-def temp_output_file(temp_output_dir):
-    """Create a temporary output file path."""
-    return os.path.join(temp_output_dir, "output.parquet")
+def temp_output_file(request, module_output_dir):
+    """Create a temporary output file path, unique to the requesting test."""
+    # The node id below the module includes the class, so same-named tests don't collide
+    name = re.sub(r"[^\w.-]", "_", request.node.nodeid.split("::", 1)[-1])
+    return os.path.join(module_output_dir, f"{name}.parquet")
 
 
-@contextmanager
-def duckdb_connection():
+@pytest.fixture(scope="session")
+def duckdb_session():
     """
-    Context manager for DuckDB connections that ensures proper cleanup.
+    DuckDB connection with the spatial extension, shared by a whole test session.
 
-    Useful for tests to avoid Windows file locking issues.
+    INSTALL and LOAD run once rather than per test. Tests should use
+    duckdb_conn, which hands out a cursor on this connection.
     """
     con = duckdb.connect()
     try:
@@ -70,6 +95,20 @@ def duckdb_connection():
         con.close()
 
 
+@pytest.fixture
+def duckdb_conn(duckdb_session):
+    """
+    Per-test cursor on the shared DuckDB connection, closed after the test.
+
+    Closing it promptly avoids Windows file locking issues.
+    """
+    cursor = duckdb_session.cursor()
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
 # Windows-safe cleanup helpers
 
 
@@ -138,12 +177,8 @@ def get_geoparquet_version(parquet_file):
     Returns:
         str: GeoParquet version string (e.g., "1.0.0", "1.1.0", "2.0.0") or None
     """
-    pf = pq.ParquetFile(parquet_file)
-    metadata = pf.schema_arrow.metadata
-    if metadata and b"geo" in metadata:
-        geo_meta = json.loads(metadata[b"geo"].decode("utf-8"))
-        return geo_meta.get("version")
-    return None
+    geo_meta = get_geo_metadata(parquet_file)
+    return geo_meta.get("version") if geo_meta else None
 
 
 def has_native_geo_types(parquet_file):
@@ -156,9 +191,11 @@ def has_native_geo_types(parquet_file):
     Returns:
         bool: True if file has native Parquet geo types
     """
-    pf = pq.ParquetFile(parquet_file)
-    schema_str = str(pf.metadata.schema)
-    return "Geometry" in schema_str or "Geography" in schema_str
+    schema = pq.read_metadata(parquet_file).schema
+    return any(
+        str(schema.column(i).logical_type).startswith(("Geometry", "Geography"))
+        for i in range(len(schema))
+    )
 
 
 def has_geoparquet_metadata(parquet_file):
@@ -171,8 +208,7 @@ def has_geoparquet_metadata(parquet_file):
     Returns:
         bool: True if file has GeoParquet metadata
     """
-    pf = pq.ParquetFile(parquet_file)
-    metadata = pf.schema_arrow.metadata
+    metadata = pq.read_metadata(parquet_file).metadata
     return metadata is not None and b"geo" in metadata
 
 
@@ -186,8 +222,7 @@ def get_geo_metadata(parquet_file):
     Returns:
         dict: GeoParquet metadata or None
     """
-    pf = pq.ParquetFile(parquet_file)
-    metadata = pf.schema_arrow.metadata
+    metadata = pq.read_metadata(parquet_file).metadata
     if metadata and b"geo" in metadata:
         return json.loads(metadata[b"geo"].decode("utf-8"))
     return None
@@ -4,38 +4,43 @@ Tests for add commands.
 
 import os
 
-import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from click.testing import CliRunner
 
 from geoparquet_io.cli.main import add
+from geoparquet_io.core.add_bbox_column import add_bbox_column
+
+
+@pytest.fixture(scope="module")
+def h3_extension(duckdb_session):
+    """Load the h3 community extension once on the shared DuckDB connection."""
+    duckdb_session.execute("INSTALL h3 FROM community; LOAD h3;")
 
 
 class TestAddCommands:
-    """Test suite for add commands."""
+    """Test suite for add commands.
+
+    Tests that only inspect the written file call the core function directly;
+    CLI parsing and output are covered by the tests that go through CliRunner.
+    """
 
     def test_add_bbox_to_buildings(self, buildings_test_file, temp_output_file):
         """Test adding bbox column to buildings file (which doesn't have bbox)."""
-        runner = CliRunner()
-        result = runner.invoke(add, ["bbox", buildings_test_file, temp_output_file])
-        assert result.exit_code == 0
+        add_bbox_column(buildings_test_file, temp_output_file)
         assert os.path.exists(temp_output_file)
 
         # Verify bbox column was added
-        conn = duckdb.connect()
-        columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-        column_names = [col[0] for col in columns]
-        assert "bbox" in column_names
+        output_meta = pq.read_metadata(temp_output_file)
+        schema = output_meta.schema.to_arrow_schema()
+        assert "bbox" in schema.names
 
         # Verify row count matches
-        input_count = conn.execute(f'SELECT COUNT(*) FROM "{buildings_test_file}"').fetchone()[0]
-        output_count = conn.execute(f'SELECT COUNT(*) FROM "{temp_output_file}"').fetchone()[0]
-        assert input_count == output_count
+        assert pq.read_metadata(buildings_test_file).num_rows == output_meta.num_rows
 
         # Verify bbox structure
-        bbox_col = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-        bbox_info = [col for col in bbox_col if col[0] == "bbox"][0]
-        assert "STRUCT" in bbox_info[1]
+        assert pa.types.is_struct(schema.field("bbox").type)
 
     def test_add_bbox_to_places_skips_existing(self, places_test_file, temp_output_file):
         """Test adding bbox to file with existing bbox skips and informs user."""
@@ -56,14 +61,11 @@ class TestAddCommands:
         assert "Replacing existing bbox column" in result.output
 
         # Verify only 1 bbox column exists in output
-        conn = duckdb.connect()
-        columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-        bbox_columns = [col for col in columns if col[0] == "bbox"]
-        assert len(bbox_columns) == 1
+        assert pq.read_schema(temp_output_file).names.count("bbox") == 1
 
         # Verify row count preserved
-        input_count = conn.execute(f'SELECT COUNT(*) FROM "{places_test_file}"').fetchone()[0]
-        output_count = conn.execute(f'SELECT COUNT(*) FROM "{temp_output_file}"').fetchone()[0]
+        input_count = pq.read_metadata(places_test_file).num_rows
+        output_count = pq.read_metadata(temp_output_file).num_rows
         assert input_count == output_count
 
     def test_add_bbox_force_with_custom_name(self, places_test_file, temp_output_file):
@@ -78,26 +80,17 @@ class TestAddCommands:
         assert "2 bbox columns" in result.output
 
         # Verify both bbox and bounds columns exist
-        conn = duckdb.connect()
-        columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-        column_names = [col[0] for col in columns]
+        column_names = pq.read_schema(temp_output_file).names
         assert "bbox" in column_names  # Original kept
         assert "bounds" in column_names  # New one added
 
     def test_add_bbox_with_custom_name(self, buildings_test_file, temp_output_file):
         """Test adding bbox column with custom name."""
-        runner = CliRunner()
-        result = runner.invoke(
-            add, ["bbox", buildings_test_file, temp_output_file, "--bbox-name", "bounds"]
-        )
-        assert result.exit_code == 0
+        add_bbox_column(buildings_test_file, temp_output_file, bbox_column_name="bounds")
         assert os.path.exists(temp_output_file)
 
         # Verify custom bbox column name was used
-        conn = duckdb.connect()
-        columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-        column_names = [col[0] for col in columns]
-        assert "bounds" in column_names
+        assert "bounds" in pq.read_schema(temp_output_file).names
 
     def test_add_bbox_with_verbose(self, buildings_test_file, temp_output_file):
         """Test adding bbox column with verbose flag."""
@@ -108,17 +101,11 @@ class TestAddCommands:
 
     def test_add_bbox_preserves_columns(self, buildings_test_file, temp_output_file):
         """Test that add bbox preserves all original columns."""
-        runner = CliRunner()
-        result = runner.invoke(add, ["bbox", buildings_test_file, temp_output_file])
-        assert result.exit_code == 0
+        add_bbox_column(buildings_test_file, temp_output_file)
 
         # Verify columns are preserved
-        conn = duckdb.connect()
-        input_columns = conn.execute(f'DESCRIBE SELECT * FROM "{buildings_test_file}"').fetchall()
-        output_columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-
-        input_col_names = {col[0] for col in input_columns}
-        output_col_names = {col[0] for col in output_columns}
+        input_col_names = set(pq.read_schema(buildings_test_file).names)
+        output_col_names = set(pq.read_schema(temp_output_file).names)
 
         # All input columns should be in output
         assert input_col_names.issubset(output_col_names)
@@ -181,7 +168,8 @@ class TestAddCommands:
         assert "No valid bbox column found" in result.output
 
     # H3 tests
-    def test_add_h3_to_buildings(self, buildings_test_file, temp_output_file):
+    @pytest.mark.usefixtures("h3_extension")
+    def test_add_h3_to_buildings(self, buildings_test_file, temp_output_file, duckdb_conn):
         """Test adding H3 column to buildings file."""
         runner = CliRunner()
         result = runner.invoke(add, ["h3", buildings_test_file, temp_output_file])
@@ -189,17 +177,13 @@ class TestAddCommands:
         assert os.path.exists(temp_output_file)
 
         # Verify h3_cell column was added
-        conn = duckdb.connect()
-        conn.execute("INSTALL spatial; LOAD spatial;")
-        conn.execute("INSTALL h3 FROM community; LOAD h3;")
-
-        columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
+        columns = duckdb_conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
         column_names = [col[0] for col in columns]
         assert "h3_cell" in column_names
 
         # Verify row count is preserved
-        input_count = conn.execute(f'SELECT COUNT(*) FROM "{buildings_test_file}"').fetchone()[0]
-        output_count = conn.execute(f'SELECT COUNT(*) FROM "{temp_output_file}"').fetchone()[0]
+        input_count = pq.read_metadata(buildings_test_file).num_rows
+        output_count = pq.read_metadata(temp_output_file).num_rows
         assert input_count == output_count
 
         # Verify H3 column is VARCHAR
@@ -207,30 +191,28 @@ class TestAddCommands:
         assert "VARCHAR" in h3_col[1]
 
         # Verify H3 cells are valid
-        valid_count = conn.execute(
+        valid_count = duckdb_conn.execute(
             f'SELECT COUNT(*) FROM "{temp_output_file}" '
             f"WHERE h3_is_valid_cell(h3_string_to_h3(h3_cell))"
         ).fetchone()[0]
         assert valid_count == output_count
 
-    def test_add_h3_default_resolution(self, buildings_test_file, temp_output_file):
+    @pytest.mark.usefixtures("h3_extension")
+    def test_add_h3_default_resolution(self, buildings_test_file, temp_output_file, duckdb_conn):
         """Test that H3 uses resolution 9 by default."""
         runner = CliRunner()
         result = runner.invoke(add, ["h3", buildings_test_file, temp_output_file])
         assert result.exit_code == 0
 
         # Verify all cells are resolution 9
-        conn = duckdb.connect()
-        conn.execute("INSTALL spatial; LOAD spatial;")
-        conn.execute("INSTALL h3 FROM community; LOAD h3;")
-
-        resolutions = conn.execute(
+        resolutions = duckdb_conn.execute(
             f'SELECT DISTINCT h3_get_resolution(h3_string_to_h3(h3_cell)) FROM "{temp_output_file}"'
         ).fetchall()
         assert len(resolutions) == 1
         assert resolutions[0][0] == 9
 
-    def test_add_h3_custom_resolution(self, buildings_test_file, temp_output_file):
+    @pytest.mark.usefixtures("h3_extension")
+    def test_add_h3_custom_resolution(self, buildings_test_file, temp_output_file, duckdb_conn):
         """Test adding H3 column with custom resolution."""
         runner = CliRunner()
         result = runner.invoke(
@@ -239,11 +221,7 @@ class TestAddCommands:
         assert result.exit_code == 0
 
         # Verify all cells are resolution 13
-        conn = duckdb.connect()
-        conn.execute("INSTALL spatial; LOAD spatial;")
-        conn.execute("INSTALL h3 FROM community; LOAD h3;")
-
-        resolutions = conn.execute(
+        resolutions = duckdb_conn.execute(
             f'SELECT DISTINCT h3_get_resolution(h3_string_to_h3(h3_cell)) FROM "{temp_output_file}"'
         ).fetchall()
         assert len(resolutions) == 1
@@ -259,10 +237,7 @@ class TestAddCommands:
         assert os.path.exists(temp_output_file)
 
         # Verify custom H3 column name was used
-        conn = duckdb.connect()
-        columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-        column_names = [col[0] for col in columns]
-        assert "h3_building" in column_names
+        assert "h3_building" in pq.read_schema(temp_output_file).names
 
     def test_add_h3_with_verbose(self, buildings_test_file, temp_output_file):
         """Test adding H3 column with verbose flag."""
@@ -279,12 +254,8 @@ class TestAddCommands:
         assert result.exit_code == 0
 
         # Verify columns are preserved
-        conn = duckdb.connect()
-        input_columns = conn.execute(f'DESCRIBE SELECT * FROM "{buildings_test_file}"').fetchall()
-        output_columns = conn.execute(f'DESCRIBE SELECT * FROM "{temp_output_file}"').fetchall()
-
-        input_col_names = {col[0] for col in input_columns}
-        output_col_names = {col[0] for col in output_columns}
+        input_col_names = set(pq.read_schema(buildings_test_file).names)
+        output_col_names = set(pq.read_schema(temp_output_file).names)
 
         # All input columns should be in output
         assert input_col_names.issubset(output_col_names)
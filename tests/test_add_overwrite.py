@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import click
 import pytest
 from click.testing import CliRunner
 
@@ -11,6 +12,12 @@ from geoparquet_io.cli.main import cli
 TEST_PARQUET = Path(__file__).parent / "data" / "fields_pgo_crs84_zstd.parquet"
 
 
+@pytest.fixture(scope="module")
+def runner():
+    """One CliRunner shared by the module; it keeps no state between invokes."""
+    return CliRunner()
+
+
 class TestAddCommandsOverwrite:
     """Test --overwrite behavior for add commands.
 
@@ -22,127 +29,82 @@ class TestAddCommandsOverwrite:
     completes, to keep tests fast. Full operation tests are in other test files.
     """
 
-    def test_add_admin_divisions_fails_without_overwrite(self, tmp_path):
-        """Test that add admin-divisions fails by default if output exists."""
+    @pytest.fixture
+    def existing_output(self, tmp_path):
+        """An output path that already exists (the commands only check existence)."""
         output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["add", "admin-divisions", str(TEST_PARQUET), str(output_file)])
-
-        assert result.exit_code != 0
-        assert "already exists" in result.output or "Use --overwrite" in result.output
+        output_file.touch()
+        return output_file
+
+    @pytest.mark.parametrize("subcommand", ["admin-divisions", "bbox", "h3", "kdtree", "quadkey"])
+    def test_fails_without_overwrite(self, runner, existing_output, subcommand):
+        """Test that add commands fail by default if output exists."""
+        # standalone_mode=False lets the ClickException propagate instead of being
+        # formatted into the captured output and turned into an exit code
+        with pytest.raises(click.ClickException, match="already exists"):
+            runner.invoke(
+                cli,
+                ["add", subcommand, str(TEST_PARQUET), str(existing_output)],
+                standalone_mode=False,
+                catch_exceptions=False,
+            )
 
     @pytest.mark.slow
     @pytest.mark.network
-    def test_add_admin_divisions_with_overwrite(self, tmp_path):
+    def test_add_admin_divisions_with_overwrite(self, runner, existing_output):
         """Test that add admin-divisions works with --overwrite."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
         result = runner.invoke(
-            cli, ["add", "admin-divisions", str(TEST_PARQUET), str(output_file), "--overwrite"]
+            cli,
+            ["add", "admin-divisions", str(TEST_PARQUET), str(existing_output), "--overwrite"],
+            catch_exceptions=False,
         )
 
         # Should succeed with --overwrite
         assert result.exit_code == 0, f"Expected success with --overwrite, got: {result.output}"
 
-    def test_add_bbox_fails_without_overwrite(self, tmp_path):
-        """Test that add bbox fails by default if output exists."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["add", "bbox", str(TEST_PARQUET), str(output_file)])
-
-        assert result.exit_code != 0
-        assert "already exists" in result.output or "Use --overwrite" in result.output
-
     @pytest.mark.slow
-    def test_add_bbox_with_overwrite(self, tmp_path):
+    def test_add_bbox_with_overwrite(self, runner, existing_output):
         """Test that add bbox works with --overwrite."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
         result = runner.invoke(
-            cli, ["add", "bbox", str(TEST_PARQUET), str(output_file), "--overwrite"]
+            cli,
+            ["add", "bbox", str(TEST_PARQUET), str(existing_output), "--overwrite"],
+            catch_exceptions=False,
         )
 
         # Should succeed with --overwrite
         assert result.exit_code == 0, f"Expected success with --overwrite, got: {result.output}"
 
-    def test_add_h3_fails_without_overwrite(self, tmp_path):
-        """Test that add h3 fails by default if output exists."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["add", "h3", str(TEST_PARQUET), str(output_file)])
-
-        assert result.exit_code != 0
-        assert "already exists" in result.output or "Use --overwrite" in result.output
-
     @pytest.mark.slow
-    def test_add_h3_with_overwrite(self, tmp_path):
+    def test_add_h3_with_overwrite(self, runner, existing_output):
         """Test that add h3 works with --overwrite."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
         result = runner.invoke(
-            cli, ["add", "h3", str(TEST_PARQUET), str(output_file), "--overwrite"]
+            cli,
+            ["add", "h3", str(TEST_PARQUET), str(existing_output), "--overwrite"],
+            catch_exceptions=False,
         )
 
         # Should succeed with --overwrite
         assert result.exit_code == 0, f"Expected success with --overwrite, got: {result.output}"
 
-    def test_add_kdtree_fails_without_overwrite(self, tmp_path):
-        """Test that add kdtree fails by default if output exists."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["add", "kdtree", str(TEST_PARQUET), str(output_file)])
-
-        assert result.exit_code != 0
-        assert "already exists" in result.output or "Use --overwrite" in result.output
-
     @pytest.mark.slow
-    def test_add_kdtree_with_overwrite(self, tmp_path):
+    def test_add_kdtree_with_overwrite(self, runner, existing_output):
         """Test that add kdtree works with --overwrite."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
         result = runner.invoke(
-            cli, ["add", "kdtree", str(TEST_PARQUET), str(output_file), "--overwrite"]
+            cli,
+            ["add", "kdtree", str(TEST_PARQUET), str(existing_output), "--overwrite"],
+            catch_exceptions=False,
         )
 
         # Should succeed with --overwrite
         assert result.exit_code == 0, f"Expected success with --overwrite, got: {result.output}"
 
-    def test_add_quadkey_fails_without_overwrite(self, tmp_path):
-        """Test that add quadkey fails by default if output exists."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["add", "quadkey", str(TEST_PARQUET), str(output_file)])
-
-        assert result.exit_code != 0
-        assert "already exists" in result.output or "Use --overwrite" in result.output
-
     @pytest.mark.slow
-    def test_add_quadkey_with_overwrite(self, tmp_path):
+    def test_add_quadkey_with_overwrite(self, runner, existing_output):
         """Test that add quadkey works with --overwrite."""
-        output_file = tmp_path / "output.parquet"
-        output_file.write_text("existing content")
-
-        runner = CliRunner()
         result = runner.invoke(
-            cli, ["add", "quadkey", str(TEST_PARQUET), str(output_file), "--overwrite"]
+            cli,
+            ["add", "quadkey", str(TEST_PARQUET), str(existing_output), "--overwrite"],
+            catch_exceptions=False,
         )
 
         # Should succeed with --overwrite
@@ -20,6 +20,25 @@ TEST_DATA_DIR = Path(__file__).parent / "data"
 PLACES_PARQUET = TEST_DATA_DIR / "places_test.parquet"
 
 
+@pytest.fixture(scope="module")
+def places_arrow():
+    """Places test data as an immutable PyArrow table, read once per module.
+
+    The file is memory-mapped so reads go through the OS page cache; the
+    map stays open for the module since the table may reference it.
+    """
+    if not PLACES_PARQUET.exists():
+        pytest.skip("Test data not available")
+    with pa.memory_map(str(PLACES_PARQUET), "r") as source:
+        yield pq.read_table(source)
+
+
+@pytest.fixture
+def places_table(places_arrow):
+    """Fresh Table per test, wrapping the module's shared Arrow data (same as read())."""
+    return Table(places_arrow)
+
+
 class TestRead:
     """Tests for gpio.read() entry point."""
 
@@ -52,18 +71,14 @@ class TestTable:
     """Tests for the Table class."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     @pytest.fixture
-    def output_file(self):
-        """Create a temporary output file path."""
-        tmp_path = Path(tempfile.gettempdir()) / f"test_api_{uuid.uuid4()}.parquet"
-        yield str(tmp_path)
-        safe_unlink(tmp_path)
+    def output_file(self, tmp_path):
+        """Create a temporary output file path; pytest cleans up tmp_path."""
+        return str(tmp_path / "test_api.parquet")
 
     def test_table_repr(self, sample_table):
         """Test Table string representation."""
@@ -84,18 +99,18 @@ class TestTable:
         assert "geometry" in names
         assert "name" in names
 
-    def test_add_bbox(self, sample_table):
-        """Test add_bbox() method."""
-        result = sample_table.add_bbox()
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [({}, "bbox"), ({"column_name": "bounds"}, "bounds")],
+        ids=["default", "custom_name"],
+    )
+    def test_add_bbox(self, sample_table, kwargs, expected):
+        """Test add_bbox() method, with default and custom column names."""
+        result = sample_table.add_bbox(**kwargs)
         assert isinstance(result, Table)
-        assert "bbox" in result.column_names
+        assert expected in result.column_names
         assert result.num_rows == 766
 
-    def test_add_bbox_custom_name(self, sample_table):
-        """Test add_bbox() with custom column name."""
-        result = sample_table.add_bbox(column_name="bounds")
-        assert "bounds" in result.column_names
-
     def test_add_quadkey(self, sample_table):
         """Test add_quadkey() method."""
         result = sample_table.add_quadkey(resolution=10)
@@ -122,54 +137,45 @@ class TestTable:
         result = sample_table.extract(limit=10)
         assert result.num_rows == 10
 
-    def test_chaining(self, sample_table):
-        """Test chaining multiple operations."""
+    def test_chain_and_write(self, sample_table, output_file):
+        """Test chaining multiple operations and writing the result with write()."""
         result = sample_table.add_bbox().add_quadkey(resolution=10)
         assert "bbox" in result.column_names
         assert "quadkey" in result.column_names
         assert result.num_rows == 766
 
-    def test_write(self, sample_table, output_file):
-        """Test write() method."""
-        sample_table.add_bbox().write(output_file)
+        result.write(output_file)
         assert Path(output_file).exists()
 
-        # Verify output
-        loaded = pq.read_table(output_file)
-        assert "bbox" in loaded.column_names
-
-    def test_add_h3(self, sample_table):
-        """Test add_h3() method."""
-        result = sample_table.add_h3()
+        # Verify output from the footer; no need to decode the written data
+        meta = pq.read_metadata(output_file)
+        assert {"bbox", "quadkey"}.issubset(meta.schema.to_arrow_schema().names)
+        assert meta.num_rows == 766
+
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [({}, "h3_cell"), ({"resolution": 5}, "h3_cell"), ({"column_name": "my_h3"}, "my_h3")],
+        ids=["default", "custom_resolution", "custom_column_name"],
+    )
+    def test_add_h3(self, sample_table, kwargs, expected):
+        """Test add_h3() method, with default and custom parameters."""
+        result = sample_table.add_h3(**kwargs)
         assert isinstance(result, Table)
-        assert "h3_cell" in result.column_names
-        assert result.num_rows == 766
-
-    def test_add_h3_custom_resolution(self, sample_table):
-        """Test add_h3() with custom resolution."""
-        result = sample_table.add_h3(resolution=5)
-        assert "h3_cell" in result.column_names
+        assert expected in result.column_names
         assert result.num_rows == 766
 
-    def test_add_h3_custom_column_name(self, sample_table):
-        """Test add_h3() with custom column name."""
-        result = sample_table.add_h3(column_name="my_h3")
-        assert "my_h3" in result.column_names
-        assert result.num_rows == 766
-
-    def test_add_kdtree(self, sample_table):
-        """Test add_kdtree() method."""
-        result = sample_table.add_kdtree()
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"iterations": 5, "sample_size": 1000}],
+        ids=["default", "custom_params"],
+    )
+    def test_add_kdtree(self, sample_table, kwargs):
+        """Test add_kdtree() method, with default and custom parameters."""
+        result = sample_table.add_kdtree(**kwargs)
         assert isinstance(result, Table)
         assert "kdtree_cell" in result.column_names
         assert result.num_rows == 766
 
-    def test_add_kdtree_custom_params(self, sample_table):
-        """Test add_kdtree() with custom parameters."""
-        result = sample_table.add_kdtree(iterations=5, sample_size=1000)
-        assert "kdtree_cell" in result.column_names
-        assert result.num_rows == 766
-
     def test_sort_column(self, sample_table):
         """Test sort_column() method."""
         result = sample_table.sort_column("name")
@@ -210,11 +216,9 @@ class TestOps:
     """Tests for the ops module (pure functions)."""
 
     @pytest.fixture
-    def arrow_table(self):
+    def arrow_table(self, places_arrow):
         """Get an Arrow table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return pq.read_table(PLACES_PARQUET)
+        return places_arrow
 
     def test_add_bbox(self, arrow_table):
         """Test ops.add_bbox()."""
@@ -245,11 +249,9 @@ class TestPipe:
     """Tests for the pipe() composition helper."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_pipe_empty(self, sample_table):
         """Test pipe with no operations."""
@@ -273,17 +275,13 @@ class TestPipe:
         assert "bbox" in result.column_names
         assert "quadkey" in result.column_names
 
-    def test_pipe_with_ops(self):
+    def test_pipe_with_ops(self, places_arrow):
         """Test pipe with ops functions on Arrow table."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-
-        arrow_table = pq.read_table(PLACES_PARQUET)
         transform = pipe(
             lambda t: ops.add_bbox(t),
             lambda t: ops.extract(t, limit=10),
         )
-        result = transform(arrow_table)
+        result = transform(places_arrow)
         assert "bbox" in result.column_names
         assert result.num_rows == 10
 
@@ -316,11 +314,9 @@ class TestConvert:
         return str(path)
 
     @pytest.fixture
-    def output_file(self):
-        """Create a temporary output file path."""
-        tmp_path = Path(tempfile.gettempdir()) / f"test_convert_{uuid.uuid4()}.parquet"
-        yield str(tmp_path)
-        safe_unlink(tmp_path)
+    def output_file(self, tmp_path):
+        """Create a temporary output file path; pytest cleans up tmp_path."""
+        return str(tmp_path / "test_convert.parquet")
 
     def test_convert_geopackage_returns_table(self, gpkg_file):
         """Test that convert() returns a Table for GeoPackage input."""
@@ -351,21 +347,19 @@ class TestConvert:
         convert(csv_wkt_file).write(output_file)
         assert Path(output_file).exists()
 
-        # Verify output
-        loaded = pq.read_table(output_file)
-        assert loaded.num_rows > 0
-        assert "geometry" in loaded.column_names
+        # Verify output from the footer
+        meta = pq.read_metadata(output_file)
+        assert meta.num_rows > 0
+        assert "geometry" in meta.schema.to_arrow_schema().names
 
 
 class TestTableUpload:
     """Tests for Table.upload() method."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_upload_writes_temp_and_calls_upload(self, sample_table):
         """Test that upload() writes to temp file and calls core upload."""
@@ -422,11 +416,9 @@ class TestTableMetadataProperties:
     """Tests for the new metadata properties on Table."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_crs_property(self, sample_table):
         """Test crs property returns CRS or None."""
@@ -467,11 +459,9 @@ class TestTableInfo:
     """Tests for the info() method."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_info_verbose_returns_none(self, sample_table, capsys):
         """Test info(verbose=True) prints output and returns None."""
@@ -499,18 +489,14 @@ class TestWriteReturnsPath:
     """Tests for write() returning Path."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     @pytest.fixture
-    def output_file(self):
-        """Create a temporary output file path."""
-        tmp_path = Path(tempfile.gettempdir()) / f"test_write_{uuid.uuid4()}.parquet"
-        yield str(tmp_path)
-        safe_unlink(tmp_path)
+    def output_file(self, tmp_path):
+        """Create a temporary output file path; pytest cleans up tmp_path."""
+        return str(tmp_path / "test_write.parquet")
 
     def test_write_returns_path(self, sample_table, output_file):
         """Test that write() returns a Path object."""
@@ -524,11 +510,9 @@ class TestOpsNewFunctions:
     """Tests for the new ops module functions."""
 
     @pytest.fixture
-    def arrow_table(self):
+    def arrow_table(self, places_arrow):
         """Get an Arrow table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return pq.read_table(PLACES_PARQUET)
+        return places_arrow
 
     def test_add_h3(self, arrow_table):
         """Test ops.add_h3()."""
@@ -565,11 +549,9 @@ class TestReadPartition:
     """Tests for the read_partition() function."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     @pytest.fixture
     def partition_dir(self, sample_table):
@@ -607,11 +589,9 @@ class TestTableHeadTail:
     """Tests for head() and tail() methods."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_head_default(self, sample_table):
         """Test head() returns first 10 rows by default."""
@@ -674,11 +654,9 @@ class TestTableStats:
     """Tests for stats() method."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_stats_returns_dict(self, sample_table):
         """Test stats() returns a dictionary."""
@@ -713,11 +691,9 @@ class TestTableMetadata:
     """Tests for metadata() method."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_metadata_returns_dict(self, sample_table):
         """Test metadata() returns a dictionary."""
@@ -768,18 +744,15 @@ class TestTableToGeojson:
     """Tests for to_geojson() method."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
         # Use a smaller subset for faster tests
-        return read(PLACES_PARQUET).head(10)
+        return places_table.head(10)
 
     @pytest.fixture
     def output_file(self, tmp_path):
         """Create a temporary output file path using pytest's tmp_path fixture."""
-        file_path = tmp_path / f"test_geojson_{uuid.uuid4()}.geojson"
-        yield str(file_path)
+        return str(tmp_path / "test_geojson.geojson")
 
     def test_to_geojson_to_file(self, sample_table, output_file):
         """Test to_geojson() writes to file."""
@@ -1007,11 +980,9 @@ class TestTableCheck:
     """Tests for Table check methods."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_check_returns_check_result(self, sample_table):
         """Test check() returns a CheckResult."""
@@ -1078,11 +1049,9 @@ class TestTableAddBboxMetadata:
     """Tests for add_bbox_metadata() method."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_add_bbox_metadata_requires_bbox_column(self, sample_table):
         """Test add_bbox_metadata() raises error if bbox column missing."""
@@ -1146,11 +1115,9 @@ class TestTableWriteFormats:
     """Tests for Table.write() with multiple output formats."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_table):
         """Create a sample Table from test data."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return read(PLACES_PARQUET)
+        return places_table
 
     def test_write_geopackage(self, sample_table):
         """Test Table.write() with GeoPackage format."""
@@ -1233,11 +1200,9 @@ class TestOpsConversionFunctions:
     """Tests for ops.convert_to_*() functions."""
 
     @pytest.fixture
-    def sample_table(self):
+    def sample_table(self, places_arrow):
         """Create a sample Arrow table."""
-        if not PLACES_PARQUET.exists():
-            pytest.skip("Test data not available")
-        return pq.read_table(str(PLACES_PARQUET))
+        return places_arrow
 
     def test_convert_to_geopackage(self, sample_table):
         """Test ops.convert_to_geopackage()."""
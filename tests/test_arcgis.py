@@ -6,17 +6,16 @@ Network tests are marked separately for optional integration testing.
 """
 
 import tempfile
-import uuid
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import click
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 from click.testing import CliRunner
 
 from geoparquet_io.cli.main import cli
-from tests.conftest import safe_unlink
 
 # --- Mock Data Fixtures ---
 
@@ -54,6 +53,40 @@ MOCK_FEATURES_PAGE = {
     ],
 }
 
+# Arrow tables are immutable, so one instance can back every mocked arcgis_to_table()
+MOCK_TABLE = pa.table({"geometry": [b"test"], "name": ["Point 1"]})
+
+
+@pytest.fixture
+def mock_make_request(monkeypatch):
+    """Replace the ArcGIS HTTP helper with a mock; set .return_value per test."""
+    mock = MagicMock()
+    monkeypatch.setattr("geoparquet_io.core.arcgis._make_request", mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def arcgis_client():
+    """HTTP client shared by the network tests, so they reuse pooled connections."""
+    from geoparquet_io.core.arcgis import _get_http_client
+
+    with _get_http_client() as client:
+        yield client
+
+
+@pytest.fixture
+def mock_get_feature_count(monkeypatch):
+    """Replace the ArcGIS feature count query with a mock."""
+    mock = MagicMock()
+    monkeypatch.setattr("geoparquet_io.core.arcgis.get_feature_count", mock)
+    return mock
+
+
+@pytest.fixture
+def output_file(tmp_path):
+    """Output file path inside the test's own pytest-managed directory."""
+    return str(tmp_path / "out.parquet")
+
 
 class TestResolveToken:
     """Tests for token resolution."""
@@ -161,29 +194,67 @@ class TestValidateArcgisUrl:
             validate_arcgis_url("https://example.com/rest/services/Test/FeatureServer")
 
 
+class TestHttpClient:
+    """Tests for HTTP client handling."""
+
+    def test_given_client_is_used_and_left_open(self):
+        """Test a caller's client serves the request and is not closed by it."""
+        from geoparquet_io.core.arcgis import _make_request
+
+        client = MagicMock()
+        client.get.return_value.json.return_value = {"count": 3}
+
+        assert _make_request("GET", "https://example.com/query", client=client) == {"count": 3}
+        client.get.assert_called_once_with("https://example.com/query", params=None)
+        client.__exit__.assert_not_called()
+        client.close.assert_not_called()
+
+    def test_conversion_scopes_one_client(self, monkeypatch):
+        """Test a conversion passes one client to its requests and closes it afterwards."""
+        from geoparquet_io.core.arcgis import ArcGISLayerInfo, arcgis_to_table
+
+        client = MagicMock()
+        client.__enter__.return_value = client
+        monkeypatch.setattr("geoparquet_io.core.arcgis._get_http_client", lambda: client)
+        layer_info = ArcGISLayerInfo(
+            name="Test Layer",
+            geometry_type="esriGeometryPoint",
+            spatial_reference={"wkid": 4326},
+            fields=[],
+            max_record_count=1000,
+            total_count=0,
+        )
+
+        with patch(
+            "geoparquet_io.core.arcgis.get_layer_info", return_value=layer_info
+        ) as mock_layer_info:
+            arcgis_to_table("https://example.com/arcgis/rest/services/Test/FeatureServer/0")
+
+        assert mock_layer_info.call_args.kwargs["client"] is client
+        client.__exit__.assert_called_once()
+
+
 class TestGenerateToken:
     """Tests for token generation."""
 
-    @patch("geoparquet_io.core.arcgis._make_request")
-    def test_successful_generation(self, mock_request):
+    def test_successful_generation(self, mock_make_request):
         """Test successful token generation."""
         from geoparquet_io.core.arcgis import generate_token
 
-        mock_request.return_value = {"token": "new_token", "expires": 3600}
+        mock_make_request.return_value = {"token": "new_token", "expires": 3600}
 
         result = generate_token("user", "pass")
 
         assert result == "new_token"
-        mock_request.assert_called_once()
+        mock_make_request.assert_called_once()
 
-    @patch("geoparquet_io.core.arcgis._make_request")
-    def test_invalid_credentials(self, mock_request):
+    def test_invalid_credentials(self, mock_make_request):
         """Test error on invalid credentials."""
         import click
 
         from geoparquet_io.core.arcgis import generate_token
 
-        mock_request.return_value = {
+        mock_make_request.return_value = {
             "error": {"code": 400, "message": "Invalid credentials", "details": []}
         }
 
@@ -194,14 +265,12 @@ class TestGenerateToken:
 class TestGetLayerInfo:
     """Tests for layer info retrieval."""
 
-    @patch("geoparquet_io.core.arcgis._make_request")
-    @patch("geoparquet_io.core.arcgis.get_feature_count")
-    def test_successful_info(self, mock_count, mock_request):
+    def test_successful_info(self, mock_make_request, mock_get_feature_count):
         """Test successful layer info retrieval."""
         from geoparquet_io.core.arcgis import get_layer_info
 
-        mock_request.return_value = MOCK_LAYER_INFO
-        mock_count.return_value = 100
+        mock_make_request.return_value = MOCK_LAYER_INFO
+        mock_get_feature_count.return_value = 100
 
         result = get_layer_info("https://example.com/FeatureServer/0")
 
@@ -214,12 +283,11 @@ class TestGetLayerInfo:
 class TestFetchFeaturesPage:
     """Tests for feature fetching."""
 
-    @patch("geoparquet_io.core.arcgis._make_request")
-    def test_fetch_page(self, mock_request):
+    def test_fetch_page(self, mock_make_request):
         """Test fetching a single page of features."""
         from geoparquet_io.core.arcgis import fetch_features_page
 
-        mock_request.return_value = MOCK_FEATURES_PAGE
+        mock_make_request.return_value = MOCK_FEATURES_PAGE
 
         result = fetch_features_page(
             "https://example.com/FeatureServer/0",
@@ -257,13 +325,6 @@ class TestCrsExtraction:
 class TestCLI:
     """CLI integration tests."""
 
-    @pytest.fixture
-    def output_file(self):
-        """Create temp output file path."""
-        tmp_path = Path(tempfile.gettempdir()) / f"test_arcgis_{uuid.uuid4()}.parquet"
-        yield str(tmp_path)
-        safe_unlink(tmp_path)
-
     @patch("geoparquet_io.core.arcgis.convert_arcgis_to_geoparquet")
     def test_basic_command(self, mock_convert, output_file):
         """Test basic CLI command."""
@@ -280,38 +341,40 @@ class TestCLI:
 
         assert result.exit_code == 0
         mock_convert.assert_called_once()
+        kwargs = mock_convert.call_args.kwargs
+        assert kwargs["service_url"] == "https://example.com/FeatureServer/0"
+        assert kwargs["output_file"] == output_file
 
     def test_missing_output(self):
         """Test error when output file missing."""
+        # standalone_mode=False raises the usage error instead of formatting it
         runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "extract",
-                "arcgis",
-                "https://example.com/FeatureServer/0",
-            ],
-        )
-
-        assert result.exit_code != 0
+        with pytest.raises(click.MissingParameter) as excinfo:
+            runner.invoke(
+                cli,
+                ["extract", "arcgis", "https://example.com/FeatureServer/0"],
+                standalone_mode=False,
+                catch_exceptions=False,
+            )
+        assert excinfo.value.param.name == "output_file"
 
     def test_username_without_password(self, output_file):
         """Test error when username provided without password."""
         runner = CliRunner()
-        result = runner.invoke(
-            cli,
-            [
-                "extract",
-                "arcgis",
-                "https://example.com/FeatureServer/0",
-                output_file,
-                "--username",
-                "user",
-            ],
-        )
-
-        assert result.exit_code != 0
-        assert "password" in result.output.lower() or "password" in str(result.exception).lower()
+        with pytest.raises(click.BadParameter, match="--password"):
+            runner.invoke(
+                cli,
+                [
+                    "extract",
+                    "arcgis",
+                    "https://example.com/FeatureServer/0",
+                    output_file,
+                    "--username",
+                    "user",
+                ],
+                standalone_mode=False,
+                catch_exceptions=False,
+            )
 
 
 class TestPythonAPI:
@@ -322,9 +385,7 @@ class TestPythonAPI:
         """Test extract_arcgis API function."""
         from geoparquet_io.api.table import extract_arcgis
 
-        # Create mock table
-        mock_table = pa.table({"geometry": [b"test"], "name": ["Point 1"]})
-        mock_arcgis_to_table.return_value = mock_table
+        mock_arcgis_to_table.return_value = MOCK_TABLE
 
         result = extract_arcgis("https://example.com/FeatureServer/0")
 
@@ -336,9 +397,7 @@ class TestPythonAPI:
         """Test ops.from_arcgis function."""
         from geoparquet_io.api import ops
 
-        # Create mock table
-        mock_table = pa.table({"geometry": [b"test"], "name": ["Point 1"]})
-        mock_arcgis_to_table.return_value = mock_table
+        mock_arcgis_to_table.return_value = MOCK_TABLE
 
         result = ops.from_arcgis("https://example.com/FeatureServer/0")
 
@@ -349,13 +408,6 @@ class TestPythonAPI:
 class TestStreamingConversion:
     """Tests for memory-efficient streaming conversion."""
 
-    @pytest.fixture
-    def output_file(self):
-        """Create temp output file path."""
-        tmp_path = Path(tempfile.gettempdir()) / f"test_arcgis_stream_{uuid.uuid4()}.parquet"
-        yield str(tmp_path)
-        safe_unlink(tmp_path)
-
     def test_geojson_page_to_table(self):
         """Test converting a single page of GeoJSON features to Arrow table."""
         from geoparquet_io.core.arcgis import _geojson_page_to_table
@@ -534,35 +586,29 @@ class TestStreamingConversion:
 
 
 @pytest.mark.network
+@pytest.mark.xdist_group("arcgis_network")
 class TestNetworkIntegration:
     """Network integration tests (require actual ArcGIS service)."""
 
     # Small public service for testing
     SMALL_SERVICE = "https://services7.arcgis.com/n1YM8pTrFmm7L4hs/ArcGIS/rest/services/Current_Ice_Jams/FeatureServer/0"
 
-    def test_fetch_layer_info(self):
+    def test_fetch_layer_info(self, arcgis_client):
         """Test fetching real layer info."""
         from geoparquet_io.core.arcgis import get_layer_info
 
-        info = get_layer_info(self.SMALL_SERVICE)
+        info = get_layer_info(self.SMALL_SERVICE, client=arcgis_client)
         assert info.name is not None
         assert info.total_count >= 0
 
-    def test_fetch_feature_count(self):
+    def test_fetch_feature_count(self, arcgis_client):
         """Test fetching real feature count."""
         from geoparquet_io.core.arcgis import get_feature_count
 
-        count = get_feature_count(self.SMALL_SERVICE)
+        count = get_feature_count(self.SMALL_SERVICE, client=arcgis_client)
         assert isinstance(count, int)
         assert count >= 0
 
-    @pytest.fixture
-    def output_file(self):
-        """Create temp output file path."""
-        tmp_path = Path(tempfile.gettempdir()) / f"test_arcgis_network_{uuid.uuid4()}.parquet"
-        yield str(tmp_path)
-        safe_unlink(tmp_path)
-
     def test_full_conversion(self, output_file):
         """Test full conversion of small public service."""
         from geoparquet_io.core.arcgis import convert_arcgis_to_geoparquet
@@ -1,9 +1,10 @@
 """Tests for benchmark suite functionality."""
 
-import tempfile
 from dataclasses import FrozenInstanceError
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from geoparquet_io.benchmarks.config import (
@@ -30,6 +31,49 @@ from geoparquet_io.core.benchmark_suite import (
 )
 
 
+@pytest.fixture(scope="module")
+def test_parquet(tmp_path_factory):
+    """Small test parquet file, written once; the benchmarks only read it."""
+    path = tmp_path_factory.mktemp("bench") / "test.parquet"
+    table = pa.table(
+        {
+            "id": [1, 2, 3],
+            "geometry": [b"point1", b"point2", b"point3"],
+        }
+    )
+    pq.write_table(table, path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def read_result(test_parquet, tmp_path_factory):
+    """Result of one 'read' benchmark run, shared by tests that only inspect it."""
+    return run_single_operation(
+        operation="read",
+        input_path=test_parquet,
+        output_dir=tmp_path_factory.mktemp("read_output"),
+    )
+
+
+def _make_result(**overrides) -> BenchmarkResult:
+    """Build a successful 'read' BenchmarkResult, overriding only what a test varies."""
+    values = {
+        "operation": "read",
+        "file": "test.parquet",
+        "time_seconds": 1.0,
+        "peak_rss_memory_mb": 100,
+        "success": True,
+    }
+    values.update(overrides)
+    return BenchmarkResult(**values)
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    """Baseline result for regression comparisons; frozen, so all of them can share it."""
+    return _make_result()
+
+
 class TestBenchmarkConfig:
     """Tests for benchmark configuration."""
 
@@ -110,90 +154,35 @@ class TestOperationRegistry:
 class TestBenchmarkRunner:
     """Tests for benchmark runner."""
 
-    @pytest.fixture
-    def test_parquet(self):
-        """Create a small test parquet file."""
-        import pyarrow as pa
-        import pyarrow.parquet as pq
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.parquet"
-            table = pa.table(
-                {
-                    "id": [1, 2, 3],
-                    "geometry": [b"point1", b"point2", b"point3"],
-                }
-            )
-            pq.write_table(table, path)
-            yield path
-
-    def test_run_single_operation_returns_result(self, test_parquet):
+    def test_run_single_operation_returns_result(self, read_result):
         """Test that run_single_operation returns BenchmarkResult."""
-        with tempfile.TemporaryDirectory() as output_dir:
-            result = run_single_operation(
-                operation="read",
-                input_path=test_parquet,
-                output_dir=Path(output_dir),
-            )
-
-            assert isinstance(result, BenchmarkResult)
-            assert result.operation == "read"
-            assert result.success is True
-            assert result.time_seconds > 0
-            assert result.peak_rss_memory_mb >= 0
+        assert isinstance(read_result, BenchmarkResult)
+        assert read_result.operation == "read"
+        assert read_result.success is True
+        assert read_result.time_seconds > 0
+        assert read_result.peak_rss_memory_mb >= 0
 
-    def test_benchmark_result_has_required_fields(self, test_parquet):
+    def test_benchmark_result_has_required_fields(self, read_result):
         """Test BenchmarkResult has all required fields."""
-        with tempfile.TemporaryDirectory() as output_dir:
-            result = run_single_operation(
-                operation="read",
-                input_path=test_parquet,
-                output_dir=Path(output_dir),
-            )
-
-            # Check all required fields exist
-            assert hasattr(result, "operation")
-            assert hasattr(result, "file")
-            assert hasattr(result, "time_seconds")
-            assert hasattr(result, "peak_rss_memory_mb")
-            assert hasattr(result, "success")
-            assert hasattr(result, "error")
-            assert hasattr(result, "details")
-
-    def test_benchmark_result_is_frozen(self, test_parquet):
+        # Check all required fields exist
+        assert hasattr(read_result, "operation")
+        assert hasattr(read_result, "file")
+        assert hasattr(read_result, "time_seconds")
+        assert hasattr(read_result, "peak_rss_memory_mb")
+        assert hasattr(read_result, "success")
+        assert hasattr(read_result, "error")
+        assert hasattr(read_result, "details")
+
+    def test_benchmark_result_is_frozen(self, read_result):
         """Test BenchmarkResult is immutable (frozen dataclass)."""
-        with tempfile.TemporaryDirectory() as output_dir:
-            result = run_single_operation(
-                operation="read",
-                input_path=test_parquet,
-                output_dir=Path(output_dir),
-            )
-
-            # Frozen dataclasses raise FrozenInstanceError on mutation
-            with pytest.raises(FrozenInstanceError):
-                result.time_seconds = 999.0
+        # Frozen dataclasses raise FrozenInstanceError on mutation
+        with pytest.raises(FrozenInstanceError):
+            read_result.time_seconds = 999.0
 
 
 class TestBenchmarkSuite:
     """Tests for full benchmark suite."""
 
-    @pytest.fixture
-    def test_parquet(self):
-        """Create a small test parquet file."""
-        import pyarrow as pa
-        import pyarrow.parquet as pq
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "test.parquet"
-            table = pa.table(
-                {
-                    "id": [1, 2, 3],
-                    "geometry": [b"point1", b"point2", b"point3"],
-                }
-            )
-            pq.write_table(table, path)
-            yield path
-
     def test_run_suite_returns_suite_result(self, test_parquet):
         """Test that run_benchmark_suite returns SuiteResult."""
         result = run_benchmark_suite(
@@ -225,69 +214,23 @@ class TestBenchmarkSuite:
 class TestRegressionComparison:
     """Tests for regression comparison."""
 
-    def test_compare_results_no_regression(self):
-        """Test comparison with no regression."""
-        baseline = BenchmarkResult(
-            operation="read",
-            file="test.parquet",
-            time_seconds=1.0,
-            peak_rss_memory_mb=100,
-            success=True,
-        )
-        current = BenchmarkResult(
-            operation="read",
-            file="test.parquet",
-            time_seconds=1.05,  # 5% slower - within threshold
-            peak_rss_memory_mb=105,  # 5% more - within threshold
-            success=True,
-        )
-
-        comparison = compare_results(baseline, current)
-
-        assert comparison.status == RegressionStatus.OK
-        assert comparison.time_delta_pct == pytest.approx(0.05, rel=0.01)
-
-    def test_compare_results_warning(self):
-        """Test comparison with warning-level regression."""
-        baseline = BenchmarkResult(
-            operation="read",
-            file="test.parquet",
-            time_seconds=1.0,
-            peak_rss_memory_mb=100,
-            success=True,
-        )
-        current = BenchmarkResult(
-            operation="read",
-            file="test.parquet",
-            time_seconds=1.15,  # 15% slower - warning
-            peak_rss_memory_mb=100,
-            success=True,
-        )
-
-        comparison = compare_results(baseline, current)
-
-        assert comparison.status == RegressionStatus.WARNING
-
-    def test_compare_results_failure(self):
-        """Test comparison with failure-level regression."""
-        baseline = BenchmarkResult(
-            operation="read",
-            file="test.parquet",
-            time_seconds=1.0,
-            peak_rss_memory_mb=100,
-            success=True,
-        )
-        current = BenchmarkResult(
-            operation="read",
-            file="test.parquet",
-            time_seconds=1.30,  # 30% slower - failure
-            peak_rss_memory_mb=100,
-            success=True,
-        )
+    @pytest.mark.parametrize(
+        "time_seconds,peak_rss_memory_mb,expected",
+        [
+            (1.05, 105, RegressionStatus.OK),  # 5% slower/larger - within threshold
+            (1.15, 100, RegressionStatus.WARNING),  # 15% slower - warning
+            (1.30, 100, RegressionStatus.FAILURE),  # 30% slower - failure
+        ],
+        ids=["no-regression", "warning", "failure"],
+    )
+    def test_compare_results(self, baseline, time_seconds, peak_rss_memory_mb, expected):
+        """Test comparison status for increasing time regressions."""
+        current = _make_result(time_seconds=time_seconds, peak_rss_memory_mb=peak_rss_memory_mb)
 
         comparison = compare_results(baseline, current)
 
-        assert comparison.status == RegressionStatus.FAILURE
+        assert comparison.status == expected
+        assert comparison.time_delta_pct == pytest.approx(time_seconds - 1.0, rel=0.01)
 
 
 class TestBenchmarkReporting:
@@ -295,15 +238,7 @@ class TestBenchmarkReporting:
 
     def test_format_table(self):
         """Test table formatting."""
-        results = [
-            BenchmarkResult(
-                operation="read",
-                file="test.parquet",
-                time_seconds=1.23,
-                peak_rss_memory_mb=45.6,
-                success=True,
-            ),
-        ]
+        results = [_make_result(time_seconds=1.23, peak_rss_memory_mb=45.6)]
 
         table = format_table(results)
 
@@ -374,45 +309,42 @@ class TestChainOperationExecution:
     operations work with valid GeoParquet data.
     """
 
-    def test_chain_extract_bbox_sort_runs(self, places_test_file):
+    def test_chain_extract_bbox_sort_runs(self, places_test_file, tmp_path):
         """Test chain-extract-bbox-sort operation runs."""
         from geoparquet_io.benchmarks.operations import get_operation
 
-        with tempfile.TemporaryDirectory() as output_dir:
-            op = get_operation("chain-extract-bbox-sort")
-            result = op["run"](Path(places_test_file), Path(output_dir))
+        op = get_operation("chain-extract-bbox-sort")
+        result = op["run"](Path(places_test_file), tmp_path)
 
-            assert result["steps_completed"] == 3
-            assert "columns_selected" in result
-            assert "final_rows" in result
-            assert "final_size_mb" in result
+        assert result["steps_completed"] == 3
+        assert "columns_selected" in result
+        assert "final_rows" in result
+        assert "final_size_mb" in result
 
-    def test_chain_filter_reproject_partition_runs(self, places_test_file):
+    def test_chain_filter_reproject_partition_runs(self, places_test_file, tmp_path):
         """Test chain-filter-reproject-partition operation runs."""
         from geoparquet_io.benchmarks.operations import get_operation
 
-        with tempfile.TemporaryDirectory() as output_dir:
-            op = get_operation("chain-filter-reproject-partition")
-            result = op["run"](Path(places_test_file), Path(output_dir))
+        op = get_operation("chain-filter-reproject-partition")
+        result = op["run"](Path(places_test_file), tmp_path)
 
-            # May be skipped if no rows in bbox
-            if result.get("skipped"):
-                assert "reason" in result
-            else:
-                assert result["steps_completed"] == 3
-                assert "partitions_created" in result
+        # May be skipped if no rows in bbox
+        if result.get("skipped"):
+            assert "reason" in result
+        else:
+            assert result["steps_completed"] == 3
+            assert "partitions_created" in result
 
-    def test_chain_convert_optimize_skips_when_no_source(self, places_test_file):
+    def test_chain_convert_optimize_skips_when_no_source(self, places_test_file, tmp_path):
         """Test chain-convert-optimize skips when no source file."""
         from geoparquet_io.benchmarks.operations import get_operation
 
-        with tempfile.TemporaryDirectory() as output_dir:
-            op = get_operation("chain-convert-optimize")
-            result = op["run"](Path(places_test_file), Path(output_dir))
+        op = get_operation("chain-convert-optimize")
+        result = op["run"](Path(places_test_file), tmp_path)
 
-            # Should skip since there's no GeoJSON/GPKG alongside
-            assert result["skipped"] is True
-            assert "No source format file" in result["reason"]
+        # Should skip since there's no GeoJSON/GPKG alongside
+        assert result["skipped"] is True
+        assert "No source format file" in result["reason"]
 
     def test_chain_convert_optimize_with_geojson_source(self, geojson_input, tmp_path):
         """Test chain-convert-optimize works when source file exists."""
@@ -428,11 +360,13 @@ class TestChainOperationExecution:
         # Create a "parquet" path that will be passed (the function looks for .geojson)
         parquet_path = copied_geojson.with_suffix(".parquet")
 
-        with tempfile.TemporaryDirectory() as output_dir:
-            op = get_operation("chain-convert-optimize")
-            result = op["run"](parquet_path, Path(output_dir))
+        # Keep outputs apart from the copied source file
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        op = get_operation("chain-convert-optimize")
+        result = op["run"](parquet_path, output_dir)
 
-            assert result.get("skipped") is not True
-            assert result["steps_completed"] == 3
-            assert result["source_format"] == "geojson"
-            assert "final_rows" in result
+        assert result.get("skipped") is not True
+        assert result["steps_completed"] == 3
+        assert result["source_format"] == "geojson"
+        assert "final_rows" in result
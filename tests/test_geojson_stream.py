@@ -176,6 +176,29 @@ class TestConvertToGeoJSONStream:
                 assert "coordinates" in feature["geometry"]
                 assert "properties" in feature
 
+    def test_custom_stream(self, capsys):
+        """Test writing GeoJSONSeq to a caller-provided stream instead of stdout."""
+        import io
+
+        stream = io.StringIO()
+        count = convert_to_geojson_stream(str(PLACES_PARQUET), rs=False, stream=stream)
+
+        lines = [line for line in stream.getvalue().strip().split("\n") if line]
+        assert len(lines) == count
+        assert json.loads(lines[0])["type"] == "Feature"
+        assert capsys.readouterr().out == ""
+
+    def test_convert_to_geojson_forwards_stream(self, capsys):
+        """Test that convert_to_geojson passes its stream through to the writer."""
+        import io
+
+        stream = io.StringIO()
+        count = convert_to_geojson(str(PLACES_PARQUET), rs=False, stream=stream)
+
+        lines = [line for line in stream.getvalue().strip().split("\n") if line]
+        assert len(lines) == count
+        assert capsys.readouterr().out == ""
+
 
 @pytest.mark.skipif(not PLACES_PARQUET.exists(), reason="Test data not available")
 class TestConvertGeoJSONCLI:
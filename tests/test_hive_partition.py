@@ -17,11 +17,14 @@ from click.testing import CliRunner
 from geoparquet_io.cli.main import cli
 
 
-@pytest.fixture
-def sample_parquet():
-    """Create a sample GeoParquet file for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-        tmp_name = tmp.name
+@pytest.fixture(scope="module")
+def sample_parquet(tmp_path_factory):
+    """Create a sample GeoParquet file for testing.
+
+    Partitioning only reads its input, so the regular and Hive tests in this
+    module share one file instead of rewriting it for every test.
+    """
+    tmp_name = str(tmp_path_factory.mktemp("hive_input") / "sample.parquet")
 
     # Create valid WKB for POINT(0 0)
     wkb_point = bytes.fromhex("0101000000000000000000000000000000000000000000000000000000")
@@ -50,21 +53,7 @@ def sample_parquet():
     table = table.replace_schema_metadata(metadata)
     pq.write_table(table, tmp_name)
 
-    yield tmp_name
-
-    # Cleanup
-    try:
-        if os.path.exists(tmp_name):
-            os.unlink(tmp_name)
-    except PermissionError:
-        # On Windows, file might still be locked - try again after a short delay
-        import gc
-        import time
-
-        gc.collect()  # Force garbage collection to close file handles
-        time.sleep(0.1)
-        if os.path.exists(tmp_name):
-            os.unlink(tmp_name)
+    return tmp_name
 
 
 @pytest.fixture
@@ -281,15 +270,11 @@ class TestHivePartitioning:
             # Check compression (should be ZSTD)
             if pf.num_row_groups > 0:
                 row_group = pf.metadata.row_group(0)
-                # Find geometry column
-                for i in range(row_group.num_columns):
-                    if "geometry" in pf.schema_arrow.field(i).name:
-                        col_meta = row_group.column(i)
-                        compression = str(col_meta.compression)
-                        assert "ZSTD" in compression.upper(), (
-                            f"Expected ZSTD compression, got {compression}"
-                        )
-                        break
+                geom_idx = pf.schema_arrow.get_field_index(geo_meta["primary_column"])
+                compression = str(row_group.column(geom_idx).compression)
+                assert "ZSTD" in compression.upper(), (
+                    f"Expected ZSTD compression, got {compression}"
+                )
 
 
 class TestPartitionStringWithChars:
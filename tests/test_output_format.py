@@ -102,19 +102,15 @@ def validate_output_format(
     # =========================
     # 2. COMPRESSION CHECK
     # =========================
-    pf = pq.ParquetFile(parquet_file)
+    # Reuses the footer read above rather than opening the file again
     if pf.num_row_groups > 0:
         row_group = pf.metadata.row_group(0)
         if row_group.num_columns > 0:
             # Find geometry column
             geom_col_name = geo_meta.get("primary_column", "geometry")
-            geom_col_idx = None
-            for i in range(len(schema)):
-                if schema.field(i).name == geom_col_name:
-                    geom_col_idx = i
-                    break
+            geom_col_idx = schema.get_field_index(geom_col_name)
 
-            if geom_col_idx is not None:
+            if geom_col_idx != -1:
                 col_meta = row_group.column(geom_col_idx)
                 actual_compression = str(col_meta.compression).upper()
 
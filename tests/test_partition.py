@@ -2,13 +2,25 @@
 Tests for partition commands.
 """
 
+import glob
 import os
+from unittest.mock import patch
 
+import duckdb
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 from click.testing import CliRunner
 
 from geoparquet_io.cli.main import partition
+from geoparquet_io.core.partition_common import (
+    PARTITION_KEY_COLUMN,
+    _can_stage_with_arrow,
+    _hilbert_order_clause,
+    _is_clustered_by,
+    _stage_partitions,
+    partition_by_column,
+)
 
 
 # Shared CliRunner to avoid repeated instantiation
@@ -400,3 +412,207 @@ class TestPartitionPrefix:
         sample_dir = os.path.join(temp_output_dir, hive_dirs[0])
         parquet_files = [f for f in os.listdir(sample_dir) if f.endswith(".parquet")]
         assert all(f.startswith("places_") for f in parquet_files)
+
+
+class TestStagePartitions:
+    """Tests for _stage_partitions function."""
+
+    def _read_back(self, tmp_path, codes, keys, column_expr='"code"', prefix_length=None):
+        """Stage a code column and return the n values staged under each key."""
+        input_file = tmp_path / "input.parquet"
+        pq.write_table(pa.table({"code": codes, "n": list(range(1, len(codes) + 1))}), input_file)
+
+        con = duckdb.connect()
+        try:
+            source = _stage_partitions(
+                con,
+                str(input_file),
+                column_expr,
+                "code",
+                keys,
+                str(tmp_path / "staging"),
+                verbose=False,
+                column_prefix_length=prefix_length,
+            )
+            return {
+                key: con.execute(
+                    f"SELECT n FROM {source} WHERE \"{PARTITION_KEY_COLUMN}\" = '{index}'"
+                ).fetchall()
+                for index, key in enumerate(keys)
+            }
+        finally:
+            con.close()
+
+    def test_each_key_reads_back_its_rows(self, tmp_path):
+        """Test that filtering the staged source on a key's index returns its rows."""
+        rows = self._read_back(
+            tmp_path, ["US", "a/b", None, "O'Brien", "US"], ["O'Brien", "US", "a/b"]
+        )
+
+        # Insertion order within a partition is kept, NULLs are dropped
+        assert rows == {"US": [(1,), (5,)], "a/b": [(2,)], "O'Brien": [(4,)]}
+
+    def test_null_strings_survive_arrow_staging(self, tmp_path):
+        """Test that PyArrow-staged keys a Hive reader would parse as NULL keep their rows."""
+        codes = ["NULL", "US", "null", "__HIVE_DEFAULT_PARTITION__"]
+        rows = self._read_back(tmp_path, codes, sorted(codes))
+
+        assert rows == {
+            "NULL": [(1,)],
+            "US": [(2,)],
+            "null": [(3,)],
+            "__HIVE_DEFAULT_PARTITION__": [(4,)],
+        }
+
+    def test_unlisted_keys_are_left_out(self, tmp_path):
+        """Test that only the listed keys are staged."""
+        input_file = tmp_path / "input.parquet"
+        pq.write_table(pa.table({"code": ["A", "B", "A"]}), input_file)
+        staging = tmp_path / "staging"
+
+        con = duckdb.connect()
+        try:
+            source = _stage_partitions(
+                con, str(input_file), '"code"', "code", ["A"], str(staging), verbose=False
+            )
+            count = con.execute(f"SELECT count(*) FROM {source}").fetchone()[0]
+        finally:
+            con.close()
+
+        assert count == 2
+
+    def test_prefix_keys_use_duckdb_copy(self, tmp_path):
+        """Test that prefix partitions are staged with their DuckDB-computed keys."""
+        rows = self._read_back(
+            tmp_path, ["USA", "USB", "CAN"], ["CA", "US"], 'LEFT("code", 2)', prefix_length=2
+        )
+
+        assert rows == {"CA": [(3,)], "US": [(1,), (2,)]}
+
+    def test_null_strings_survive_duckdb_copy(self, tmp_path):
+        """Test that keys a Hive reader would parse as NULL keep their rows."""
+        codes = ["NULL", "US", "null"]
+        rows = self._read_back(tmp_path, codes, sorted(codes), 'LEFT("code", 4)', prefix_length=4)
+
+        assert rows == {"NULL": [(1,)], "US": [(2,)], "null": [(3,)]}
+
+
+class TestCanStageWithArrow:
+    """Tests for _can_stage_with_arrow function."""
+
+    def test_string_and_integer_columns(self, tmp_path):
+        """Test that string and integer partition columns are staged by PyArrow."""
+        input_file = tmp_path / "input.parquet"
+        pq.write_table(pa.table({"code": ["A"], "n": [1], "x": [1.5]}), input_file)
+
+        assert _can_stage_with_arrow(str(input_file), "code")
+        assert _can_stage_with_arrow(str(input_file), "n")
+        assert not _can_stage_with_arrow(str(input_file), "x")
+
+    def test_native_geometry_falls_back(self, test_data_dir):
+        """Test that native Parquet geometry columns are left to DuckDB."""
+        input_file = test_data_dir / "fields_pgo_crs84_zstd.parquet"
+        assert not _can_stage_with_arrow(str(input_file), "id")
+
+    def test_glob_falls_back(self, tmp_path):
+        """Test that inputs PyArrow cannot open directly are left to DuckDB."""
+        assert not _can_stage_with_arrow(str(tmp_path / "*.parquet"), "code")
+
+
+class TestIsClusteredBy:
+    """Tests for _is_clustered_by function."""
+
+    def _check(self, tmp_path, codes):
+        input_file = tmp_path / "input.parquet"
+        pq.write_table(pa.table({"code": codes}), input_file, row_group_size=10)
+        values = [(code,) for code in sorted(set(codes) - {None})]
+        con = duckdb.connect()
+        try:
+            return _is_clustered_by(con, str(input_file), "code", values, verbose=False)
+        finally:
+            con.close()
+
+    def test_sorted_input(self, tmp_path):
+        """Test that row groups in value order are detected, ignoring all-NULL groups."""
+        codes = sorted(f"C{i % 5}" for i in range(50)) + [None] * 10
+        assert self._check(tmp_path, codes)
+
+    def test_interleaved_input(self, tmp_path):
+        """Test that overlapping row-group ranges are not treated as clustered."""
+        codes = [f"C{i % 5}" for i in range(50)]
+        assert not self._check(tmp_path, codes)
+
+    def test_single_row_group(self, tmp_path):
+        """Test that a single row group is never treated as clustered."""
+        assert not self._check(tmp_path, ["A", "B"])
+
+
+class TestHilbertOrderClause:
+    """Tests for _hilbert_order_clause function."""
+
+    def test_uses_dataset_bounds(self):
+        """Test that the curve extent comes from the dataset bounds and geometry column."""
+        with (
+            patch(
+                "geoparquet_io.core.partition_common.find_primary_geometry_column",
+                return_value="geom",
+            ),
+            patch(
+                "geoparquet_io.core.partition_common.get_dataset_bounds",
+                return_value=(-10.0, -5.0, 10.0, 5.0),
+            ),
+        ):
+            clause = _hilbert_order_clause("input.parquet")
+
+        assert clause == (
+            'ORDER BY ST_Hilbert("geom", ST_Extent(ST_MakeEnvelope(-10.0, -5.0, 10.0, 5.0)))'
+        )
+
+
+class TestPartitionHilbertOrder:
+    """End-to-end tests for partition_by_column with hilbert_order=True."""
+
+    def test_staged_partitions_are_hilbert_sorted(self, tmp_path, duckdb_conn):
+        """Test that rows in each staged partition file follow the Hilbert curve."""
+        input_file = str(tmp_path / "input.parquet")
+        # Interleaved categories in a single row group force the staged path,
+        # which selects * EXCLUDE the staging key column.
+        duckdb_conn.execute(f"""
+            COPY (
+                SELECT i AS id,
+                       CASE WHEN i % 2 = 0 THEN 'A' ELSE 'B' END AS category,
+                       ((i * 37) % 200 - 100)::DOUBLE AS x,
+                       ((i * 91) % 160 - 80)::DOUBLE AS y,
+                       ST_Point(x, y) AS geometry
+                FROM range(200) t(i)
+            ) TO '{input_file}' (FORMAT PARQUET)
+        """)
+        assert not _is_clustered_by(
+            duckdb_conn, input_file, "category", [("A",), ("B",)], verbose=False
+        )
+        xmin, ymin, xmax, ymax = duckdb_conn.execute(
+            f"SELECT min(x), min(y), max(x), max(y) FROM '{input_file}'"
+        ).fetchone()
+
+        output_dir = tmp_path / "output"
+        num_partitions = partition_by_column(
+            input_file, str(output_dir), "category", skip_analysis=True, hilbert_order=True
+        )
+
+        assert num_partitions == 2
+        output_files = sorted(glob.glob(os.path.join(output_dir, "*.parquet")))
+        assert [os.path.basename(f) for f in output_files] == ["A.parquet", "B.parquet"]
+        for output_file in output_files:
+            table = pq.read_table(output_file)
+            assert PARTITION_KEY_COLUMN not in table.column_names
+            expected = [
+                row[0]
+                for row in duckdb_conn.execute(f"""
+                    SELECT id FROM '{output_file}'
+                    ORDER BY ST_Hilbert(
+                        x, y, ST_Extent(ST_MakeEnvelope({xmin}, {ymin}, {xmax}, {ymax}))
+                    )
+                """).fetchall()
+            ]
+            assert table.column("id").to_pylist() == expected
+            assert expected != sorted(expected)
@@ -1,5 +1,7 @@
 """Tests for core/split_by_country.py module."""
 
+from unittest.mock import patch
+
 import pytest
 from click import UsageError
 
@@ -7,6 +9,7 @@ from geoparquet_io.core.split_by_country import (
     _is_wgs84,
     check_country_code_column,
     check_crs,
+    split_by_country,
 )
 
 
@@ -36,6 +39,16 @@ class TestIsWgs84:
         wgs84_dict = {"type": "GeographicCRS", "name": "WGS 84"}
         assert _is_wgs84(wgs84_dict) is True
 
+    def test_dict_matched_by_id(self):
+        """Test PROJJSON identified as WGS84 by its id, whatever its name."""
+        assert _is_wgs84({"type": "GeographicCRS", "id": {"authority": "EPSG", "code": 4326}})
+        assert _is_wgs84({"type": "GeographicCRS", "id": {"authority": "OGC", "code": "CRS84"}})
+
+    def test_dict_matched_by_datum(self):
+        """Test unnamed geographic PROJJSON on the WGS 84 datum ensemble."""
+        crs = {"type": "GeographicCRS", "name": "unknown", "datum_ensemble": {"name": "WGS 84"}}
+        assert _is_wgs84(crs) is True
+
     def test_non_wgs84(self):
         """Test non-WGS84 CRS returns False."""
         assert _is_wgs84("EPSG:3857") is False
@@ -92,3 +105,34 @@ class TestCheckCountryCodeColumn:
         with pytest.raises(UsageError) as exc_info:
             check_country_code_column(places_test_file, "nonexistent_column")
         assert "not found" in str(exc_info.value)
+
+
+class TestSplitByCountry:
+    """Tests for split_by_country function."""
+
+    def test_passes_write_options_through(self, tmp_path):
+        """Test that compression and row group options reach the partition writer."""
+        input_file = tmp_path / "input.parquet"
+        input_file.touch()
+        with (
+            patch("geoparquet_io.core.split_by_country._metadata_connection"),
+            patch("geoparquet_io.core.split_by_country.check_country_code_column"),
+            patch("geoparquet_io.core.split_by_country.check_crs"),
+            patch(
+                "geoparquet_io.core.split_by_country.partition_by_column", return_value=2
+            ) as mock_partition,
+        ):
+            split_by_country(
+                str(input_file),
+                str(tmp_path / "out"),
+                compression="ZSTD",
+                compression_level=3,
+                row_group_rows=1_000_000,
+            )
+
+        kwargs = mock_partition.call_args.kwargs
+        assert kwargs["compression"] == "ZSTD"
+        assert kwargs["compression_level"] == 3
+        assert kwargs["row_group_rows"] == 1_000_000
+        assert kwargs["row_group_size_mb"] is None
+        assert kwargs["hilbert_order"] is False
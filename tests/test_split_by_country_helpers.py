@@ -21,3 +21,18 @@ class TestCheckCountryCodeColumn:
 
         with pytest.raises(UsageError):
             check_country_code_column(sample_file, "nonexistent_column")
+
+    def test_all_null_column_raises_error(self, tmp_path):
+        """Test that a column of only NULLs raises UsageError from footer statistics."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        from click import UsageError
+
+        from geoparquet_io.core.split_by_country import check_country_code_column
+
+        input_file = tmp_path / "nulls.parquet"
+        table = pa.table({"admin:country_code": pa.array([None] * 30, pa.string())})
+        pq.write_table(table, input_file, row_group_size=10)
+
+        with pytest.raises(UsageError, match="only NULL values"):
+            check_country_code_column(str(input_file))
@@ -12,7 +12,6 @@ import tempfile
 import uuid
 from pathlib import Path
 
-import duckdb
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
@@ -243,15 +242,6 @@ class TestDiskRewriteStrategy:
         assert "geometry" in geo_meta["columns"]
 
 
-@pytest.fixture
-def duckdb_connection():
-    """Create DuckDB connection with spatial extension."""
-    con = duckdb.connect()
-    con.execute("INSTALL spatial; LOAD spatial")
-    yield con
-    con.close()
-
-
 @pytest.fixture
 def sample_geoparquet(tmp_path):
     """Create a sample GeoParquet file for testing."""
@@ -290,14 +280,14 @@ def sample_geoparquet(tmp_path):
 class TestWriteFromQuery:
     """Tests for writing from DuckDB queries."""
 
-    def test_arrow_memory_write_from_query(self, duckdb_connection, sample_geoparquet, output_file):
+    def test_arrow_memory_write_from_query(self, duckdb_conn, sample_geoparquet, output_file):
         """ArrowMemoryStrategy writes from query correctly."""
         strategy = WriteStrategyFactory.get_strategy(WriteStrategy.ARROW_MEMORY)
 
         query = f"SELECT * FROM read_parquet('{sample_geoparquet}')"
 
         strategy.write_from_query(
-            con=duckdb_connection,
+            con=duckdb_conn,
             query=query,
             output_path=output_file,
             geometry_column="geometry",